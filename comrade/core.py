@@ -1,3 +1,8 @@
+import asyncio
+import logging
+import os
+import socket
+import time
 import typing
 
 import attr
@@ -11,11 +16,15 @@ from grpc_reflection.v1alpha import reflection
 from sqlalchemy.ext.asyncio import create_async_engine
 
 from comrade import db
+from comrade.lease import Lease
 
 
 EXTENSIONS = [".core", ".dkp"]
 
 
+logger = logging.getLogger(__name__)
+
+
 @attr.s(slots=True, auto_attribs=True)
 class Listener:
 
@@ -31,6 +40,10 @@ class RPC:
 
     listeners: typing.List[Listener] = attr.ib(factory=list)
 
+    # How many items can be waiting to be added to the auction queue at once, before
+    # we start turning away any more.
+    ingest_queue_size: int = 1000
+
 
 @attr.s(slots=True, auto_attribs=True)
 class DKP:
@@ -38,6 +51,15 @@ class DKP:
     url: str
     database: str
     dkp_pool_id: int
+    cache_ttl: float = 10.0
+    max_connections: int = 4
+    keepalive_timeout: float = 60.0
+    request_timeout: float = 30.0
+    change_history: int = 32
+    refresh_interval_idle: float = 60.0
+    refresh_interval_active: float = 5.0
+    max_staleness: typing.Optional[float] = None
+    chunk_size: int = 65536
 
 
 @attr.s(slots=True, auto_attribs=True)
@@ -71,6 +93,36 @@ class Auction:
     roles: AuctionRoles
     limits: AuctionLimits
     channels: list[str] = attr.ib(factory=list)
+    live_status: bool = False
+    status_interval: float = 2.0
+    error_backoff: float = 1.0
+    error_backoff_max: float = 30.0
+    bundle_size: int = 1
+    early_close: bool = False
+    early_close_grace: float = 15.0
+    dedup_window: float = 300.0
+    dedup_max_keys: int = 10000
+    feed_history: int = 1000
+    feed_buffer: int = 100
+
+    # With failover enabled, this is also how a standby keeps up with the leader,
+    # by tailing this same file, so it has to be a path that every process can see
+    # (i.e. on shared storage), and is required.
+    journal: typing.Optional[str] = None
+    journal_flush_interval: float = 0.1
+    journal_snapshot_every: int = 1000
+
+
+@attr.s(slots=True, auto_attribs=True)
+class Failover:
+
+    # Requires auction.journal to be set, to a path shared by every process.
+    enabled: bool = False
+    lease: str = "comrade"
+    node: typing.Optional[str] = None
+    ttl: float = 15.0
+    heartbeat_interval: float = 5.0
+    poll_interval: float = 0.5
 
 
 @attr.s(slots=True, auto_attribs=True)
@@ -81,19 +133,41 @@ class Config:
     dkp: DKP
     auction: Auction
     rpc: RPC = attr.ib(factory=RPC)
+    failover: Failover = attr.ib(factory=Failover)
+
+
+class SlashCommands(SlashCommand):
+    # When we're running as a standby, we're still connected to Discord, so that we
+    # can take over quickly, but we have to leave answering commands to the leader.
+    async def invoke_command(self, func, ctx, args):
+        if self._discord.is_leader:
+            await super().invoke_command(func, ctx, args)
 
 
 class Bot(_Bot):
     def __init__(self, command_prefix="!", *args, config_file, **kwargs):
         super().__init__(command_prefix, *args, **kwargs)
 
-        self._slash = SlashCommand(self, sync_commands=True)
+        self._slash = SlashCommands(self, sync_commands=True)
 
         with open(config_file) as fp:
             self.config: Config = cattr.structure(toml.load(fp), Config)
 
         self.db = create_async_engine(self.config.database)
 
+        # If failover is enabled, then we're only allowed to do anything while we
+        # hold the lease, otherwise we're always in charge.
+        self.is_leader = not self.config.failover.enabled
+        self.lease = None
+        self._lease_holder = None
+        if self.config.failover.enabled:
+            self.lease = Lease(
+                self.db,
+                self.config.failover.lease,
+                self.config.failover.node or f"{socket.gethostname()}:{os.getpid()}",
+                ttl=self.config.failover.ttl,
+            )
+
         self.rpc = grpc.aio.server()
         self._rpc_services = []
 
@@ -129,8 +203,66 @@ class Bot(_Bot):
 
     async def close(self, *args, **kwargs):
         await self.rpc.stop(10)
+
+        if self._lease_holder is not None:
+            self._lease_holder.cancel()
+        if self.is_leader and self.lease is not None:
+            try:
+                await self.lease.release()
+            except Exception:
+                logger.exception("Failed to release the lease")
+
         return await super().close(*args, **kwargs)
 
     async def on_ready(self):
         async with self.db.begin() as conn:
             await conn.run_sync(db.metadata.create_all)
+
+        if self.lease is not None and self._lease_holder is None:
+            self._lease_holder = self.loop.create_task(self._hold_lease())
+
+    def _set_leader(self, is_leader: bool):
+        if is_leader != self.is_leader:
+            self.is_leader = is_leader
+            if is_leader:
+                logger.info("Acquired the lease, taking over.")
+                self.dispatch("leadership_acquired")
+            else:
+                logger.warning("Lost the lease, standing by.")
+                self.dispatch("leadership_lost")
+
+    async def _hold_lease(self):
+        config = self.config.failover
+        expires_at = None
+
+        while True:
+            attempted_at = time.monotonic()
+            try:
+                # If renewing takes so long that the lease could have run out by the
+                # time we hear back, then we can't count on still having it, and
+                # there's no point waiting around to find out.
+                held = await asyncio.wait_for(
+                    self.lease.acquire(), config.ttl - config.heartbeat_interval
+                )
+            except asyncio.CancelledError:
+                raise
+            except asyncio.TimeoutError:
+                logger.warning("Timed out renewing the lease")
+                held = False
+                expires_at = None
+            except Exception:
+                logger.exception("Failed to renew the lease")
+
+                # We don't know whether we still hold the lease or not, so we'll
+                # keep going as long as it would still be valid if we did, but we
+                # have to stop in time for someone else to be able to take over,
+                # without there ever being two of us in charge.
+                held = (
+                    expires_at is not None
+                    and time.monotonic() < expires_at - config.heartbeat_interval
+                )
+            else:
+                expires_at = attempted_at + config.ttl if held else None
+
+            self._set_leader(held)
+            await asyncio.sleep(config.heartbeat_interval)
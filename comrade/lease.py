@@ -0,0 +1,104 @@
+from sqlalchemy import Table, Column, Float, String, sql
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.compiler import compiles
+
+from comrade import db
+
+
+leases = Table(
+    "leases",
+    db.metadata,
+    Column("name", String(100), primary_key=True),
+    Column("holder", String(255), nullable=False),
+    Column("expires_at", Float, nullable=False),
+    extend_existing=True,
+)
+
+
+class EpochNow(sql.expression.FunctionElement):
+    # The database's current time, in seconds since the epoch. Every process that
+    # shares a lease has to agree on when it expires, so it has to come from the one
+    # clock that they all share, rather than from each of their own.
+    type = Float()
+    name = "epoch_now"
+    inherit_cache = True
+
+
+@compiles(EpochNow)
+def _epoch_now(element, compiler, **kw):
+    return "EXTRACT(EPOCH FROM CURRENT_TIMESTAMP)"
+
+
+@compiles(EpochNow, "sqlite")
+def _epoch_now_sqlite(element, compiler, **kw):
+    return "((julianday('now') - 2440587.5) * 86400.0)"
+
+
+@compiles(EpochNow, "mysql")
+def _epoch_now_mysql(element, compiler, **kw):
+    return "UNIX_TIMESTAMP(NOW(6))"
+
+
+class Lease:
+    # A lease held in the shared database, which decides which one of several
+    # comrade processes gets to actually do anything. Whoever holds it has to keep
+    # renewing it, and if they stop (because they've crashed, or lost their
+    # connection to the database) then anybody else can take it over once it has
+    # expired.
+
+    def __init__(self, engine, name: str, holder: str, *, ttl: float):
+        self.engine = engine
+        self.name = name
+        self.holder = holder
+        self.ttl = ttl
+
+    async def acquire(self) -> bool:
+        # Takes the lease if it's ours already, or if whoever had it has let it
+        # expire, returning whether we hold it now. This is also how we renew it.
+        now = EpochNow()
+        try:
+            async with self.engine.begin() as conn:
+                result = await conn.execute(
+                    sql.update(leases)
+                    .where(leases.c.name == self.name)
+                    .where(
+                        sql.or_(
+                            leases.c.holder == self.holder, leases.c.expires_at < now
+                        )
+                    )
+                    .values(holder=self.holder, expires_at=now + self.ttl)
+                )
+                if result.rowcount:
+                    return True
+
+                # If there isn't a lease at all yet, then we can just create it,
+                # but if there is, someone else is holding it.
+                existing = (
+                    await conn.execute(
+                        sql.select(leases.c.name).where(leases.c.name == self.name)
+                    )
+                ).first()
+                if existing is not None:
+                    return False
+
+                await conn.execute(
+                    sql.insert(leases).values(
+                        name=self.name, holder=self.holder, expires_at=now + self.ttl
+                    )
+                )
+        except IntegrityError:
+            # Somebody else beat us to creating it.
+            return False
+
+        return True
+
+    async def release(self) -> None:
+        # Lets the lease go early, so that someone else can take over straight away,
+        # instead of having to wait for it to expire.
+        async with self.engine.begin() as conn:
+            await conn.execute(
+                sql.update(leases)
+                .where(leases.c.name == self.name)
+                .where(leases.c.holder == self.holder)
+                .values(expires_at=0)
+            )
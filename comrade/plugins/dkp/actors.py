@@ -0,0 +1,83 @@
+import asyncio
+import typing
+
+
+T = typing.TypeVar("T")
+
+
+def _cancelling() -> bool:
+    # Whether the current task itself has been asked to cancel, rather than just
+    # something it was waiting on. Task.cancelling() only exists from Python 3.11.
+    cancelling = getattr(asyncio.current_task(), "cancelling", None)
+    return cancelling is not None and cancelling() > 0
+
+
+class ChannelActors:
+    # Runs the commands for each auction channel one at a time, in the order that
+    # they were submitted, so that nothing else can touch a channel's auction while
+    # a command for it is part way through (say, waiting on the DKP to refresh).
+    #
+    # Each channel gets its own queue and worker, so a slow command in one channel
+    # doesn't hold up any of the others.
+
+    def __init__(self):
+        self._queues: dict[str, asyncio.Queue] = {}
+        self._workers: dict[str, asyncio.Task] = {}
+        self._closing = False
+
+    def submit(
+        self, channel: str, command: typing.Callable[[], typing.Awaitable[T]]
+    ) -> "asyncio.Future[T]":
+        queue = self._queues.get(channel)
+        if queue is None:
+            queue = self._queues[channel] = asyncio.Queue()
+            self._workers[channel] = asyncio.create_task(self._worker(channel, queue))
+
+        fut = asyncio.get_running_loop().create_future()
+        queue.put_nowait((command, fut))
+        return fut
+
+    async def _worker(self, channel: str, queue: asyncio.Queue):
+        while True:
+            command, fut = await queue.get()
+            try:
+                if fut.cancelled():
+                    continue
+
+                try:
+                    result = await command()
+                except asyncio.CancelledError:
+                    fut.cancel()
+
+                    # A command can get cancelled without us being cancelled (say,
+                    # something it was waiting on was cancelled), in which case only
+                    # that command is over, and we carry on with the next one.
+                    # Otherwise every command after it would be stuck forever.
+                    if self._closing or _cancelling():
+                        raise
+                except Exception as exc:
+                    fut.set_exception(exc)
+                else:
+                    fut.set_result(result)
+            finally:
+                queue.task_done()
+
+    async def join(self) -> None:
+        await asyncio.gather(*(queue.join() for queue in self._queues.values()))
+
+    async def close(self) -> None:
+        self._closing = True
+        for worker in self._workers.values():
+            worker.cancel()
+        await asyncio.gather(*self._workers.values(), return_exceptions=True)
+        self._closing = False
+
+        # Anything that never got to run is cancelled, so that nobody is left waiting
+        # on it forever.
+        for queue in self._queues.values():
+            while not queue.empty():
+                _, fut = queue.get_nowait()
+                fut.cancel()
+
+        self._queues.clear()
+        self._workers.clear()
@@ -1,25 +1,33 @@
+import asyncio
+import bisect
+import collections
 import enum
 import datetime
+import heapq
 import itertools
 import logging
-import random
 import typing
 import functools
 
-from collections.abc import Iterable
+from collections.abc import Container, Iterable
 
 import attr
+import cattr
 import discord
 import discord.utils
 import humanize
 
-from discord.ext import tasks
 from discord.ext.commands import Cog
 from discord_slash import cog_ext, SlashContext
 from discord_slash.model import SlashCommandOptionType as OptionType
 from discord_slash.utils.manage_commands import create_option
 
-from .provider import CharacterDKP
+from .actors import ChannelActors
+from .clock import Clock, MonotonicClock
+from .dispatch import Dispatcher, Priority
+from .feed import AuctionFeed
+from .journal import Journal, JournalFollower
+from .provider import CharacterDKP, DKPChange, DKPSnapshot
 
 
 logger = logging.getLogger(__name__)
@@ -29,7 +37,7 @@ def humanize_delta(td: datetime.timedelta) -> str:
     return humanize.precisedelta(td, format="%0.0f")
 
 
-async def smart_send(ctx, hidden=False, **kwargs):
+async def smart_send(ctx, dispatcher: Dispatcher, hidden=False, **kwargs):
     # There's an issue (it might be with the library or the API, not sure which)
     # where if you defer a command with a hidden response, you can't then later
     # respond with a public response without first giving a private response.
@@ -44,10 +52,21 @@ async def smart_send(ctx, hidden=False, **kwargs):
     #
     # This only really needs to be used in situations where a command might send
     # a mixture of response types (hidden and public) after a ctx.defer.
+    #
+    # Everything goes through the dispatcher for the channel, so that it stays in
+    # order with everything else going to that channel. Someone is waiting on the
+    # private responses, so we wait for those to actually be sent, and they get to
+    # skip ahead of any public messages that are still queued.
     if hidden:
-        await ctx.send(hidden=True, **kwargs)
+        await dispatcher.submit(
+            ctx.channel.name,
+            functools.partial(ctx.send, hidden=True, **kwargs),
+            priority=Priority.Interaction,
+        )
     else:
-        await ctx.channel.send(**kwargs)
+        dispatcher.submit(
+            ctx.channel.name, functools.partial(ctx.channel.send, **kwargs)
+        )
 
 
 @attr.s(slots=True, frozen=True, auto_attribs=True)
@@ -92,6 +111,9 @@ class Bid:
     bid: int
     id: int = 0
 
+    # The index of the item in the auction that this bid is for.
+    item: int = 0
+
 
 @attr.s(slots=True, frozen=True, auto_attribs=True)
 class AuctionResults:
@@ -101,20 +123,419 @@ class AuctionResults:
     rolled: int = 0
 
 
+class BidBook:
+    # An order book for a single auction, which keeps the best bid for each
+    # (bidder, id) sorted by the same key that we use to determine the results, so
+    # that adding a bid doesn't require re-sorting every bid we've ever seen, and
+    # the current winners can be read straight off the top of the book.
+    #
+    # The sort key depends on each bidder's current DKP, so the book remembers the
+    # snapshot that it was sorted against, and will re-key itself when it's used
+    # with a different one.
+
+    def __init__(self):
+        self.history: list[Bid] = []
+        self.amounts: collections.Counter[int] = collections.Counter()
+        self.mutations = 0
+
+        self._entries: list[tuple[tuple, int, Bid]] = []
+        self._best: dict[tuple[str, int], tuple[tuple, int, Bid]] = {}
+        self._seq = itertools.count()
+        self._dkp: typing.Optional[typing.Mapping[str, CharacterDKP]] = None
+        self._member_treshold: typing.Optional[int] = None
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _sync(self, dkp: typing.Mapping[str, CharacterDKP], member_treshold: int):
+        if dkp is self._dkp and member_treshold == self._member_treshold:
+            return
+
+        key_fn = _bid_key(dkp, member_treshold)
+
+        if member_treshold != self._member_treshold:
+            # Which of someone's bids is their best one depends on the treshold, so
+            # if that has changed, we have to rebuild the book from every bid.
+            self._dkp = dkp
+            self._member_treshold = member_treshold
+            self._entries = []
+            self._best = {}
+            for bid in self.history:
+                self._insert((key_fn(bid), next(self._seq), bid))
+            return
+
+        # A bidder's DKP is the same for all of their bids, so a new snapshot can't
+        # change which bid is their best, only where it sits in the book. Most of
+        # the time it won't have changed anything for the handful of people bidding
+        # on this item, in which case we can skip sorting entirely.
+        entries = [(key_fn(bid), seq, bid) for _, seq, bid in self._entries]
+        if entries != self._entries:
+            entries.sort()
+            self._entries = entries
+            self._best = {(entry[2].bidder, entry[2].id): entry for entry in entries}
+
+        self._dkp = dkp
+
+    def _insert(self, entry: tuple[tuple, int, Bid]) -> None:
+        # Only the best bid for each (bidder, id) counts towards the results, so if
+        # this bid doesn't beat the one we already have, it doesn't go in the book.
+        bid = entry[2]
+        existing = self._best.get((bid.bidder, bid.id))
+        if existing is not None:
+            if entry[0] <= existing[0]:
+                return
+            del self._entries[bisect.bisect_left(self._entries, existing)]
+
+        self._best[(bid.bidder, bid.id)] = entry
+        bisect.insort(self._entries, entry)
+
+    def add(
+        self,
+        bid: Bid,
+        dkp: typing.Mapping[str, CharacterDKP],
+        member_treshold: int,
+    ) -> None:
+        self._sync(dkp, member_treshold)
+
+        self.history.append(bid)
+        self.amounts[bid.bid] += 1
+        self.mutations += 1
+
+        self._insert((_bid_key(dkp, member_treshold)(bid), next(self._seq), bid))
+
+    def rebase(
+        self,
+        before: typing.Mapping[str, CharacterDKP],
+        after: typing.Mapping[str, CharacterDKP],
+        changed: Container[str],
+    ) -> bool:
+        # Moves the book from one snapshot onto a newer one without re-keying it,
+        # which is only possible if none of the people who have bid in it have had
+        # their DKP change in between. Returns whether it could.
+        if self._dkp is not before:
+            return False
+        if any(bidder in changed for bidder, _ in self._best):
+            return False
+        self._dkp = after
+        return True
+
+    def groups(
+        self, dkp: typing.Mapping[str, CharacterDKP], member_treshold: int
+    ) -> Iterable[list[Bid]]:
+        # Yields the bids in the book from best to worst, grouped together when
+        # they are tied with each other.
+        self._sync(dkp, member_treshold)
+
+        for _, entries in itertools.groupby(
+            reversed(self._entries), key=lambda entry: entry[0]
+        ):
+            yield [bid for _, _, bid in entries]
+
+
+@attr.s(slots=True, frozen=True, auto_attribs=True)
+class QueuedItem:
+
+    item: AuctionItem
+    tier: int = 0
+    order: int = 0
+
+
+class ItemQueue:
+    # The items that are waiting to be auctioned, highest tier first, and then in
+    # the order that they were added. Officers can move items into a higher tier,
+    # or bump them to the front of the queue, so that the valuable drops don't have
+    # to wait behind everything else.
+    #
+    # Items are kept in a heap, and anything that gets changed just gets pushed
+    # again, with the old entry being thrown away once it makes it to the top.
+    #
+    # Adding an item that is already in the queue doesn't add another entry, it
+    # just increases the quantity of the one that's already there, so that they get
+    # auctioned off together.
+
+    def __init__(self, items: Iterable[QueuedItem] = ()):
+        self._heap: list[tuple[int, int, str]] = []
+        self._entries: dict[str, QueuedItem] = {}
+
+        # Every item gets its own place in the order, new items go after everything
+        # else, and bumped items go before everything else.
+        self._first_order = 0
+        self._next_order = 0
+
+        for queued in items:
+            self._push(queued)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __iter__(self) -> typing.Iterator[QueuedItem]:
+        return iter(sorted(self._entries.values(), key=self._key))
+
+    @staticmethod
+    def _key(queued: QueuedItem) -> tuple[int, int]:
+        return (-queued.tier, queued.order)
+
+    @staticmethod
+    def _name(item: typing.Union[AuctionItem, str]) -> str:
+        if isinstance(item, AuctionItem):
+            item = item.item
+        return item.strip().lower()
+
+    def _push(self, queued: QueuedItem) -> None:
+        name = self._name(queued.item)
+        self._entries[name] = queued
+        self._first_order = min(self._first_order, queued.order)
+        self._next_order = max(self._next_order, queued.order + 1)
+        heapq.heappush(self._heap, (*self._key(queued), name))
+
+    def get(self, item: typing.Union[AuctionItem, str]) -> typing.Optional[QueuedItem]:
+        return self._entries.get(self._name(item))
+
+    def add(self, item: AuctionItem, tier: int = 0) -> QueuedItem:
+        existing = self.get(item)
+        if existing is None:
+            queued = QueuedItem(item=item, tier=tier, order=self._next_order)
+        else:
+            queued = attr.evolve(
+                existing,
+                item=attr.evolve(
+                    existing.item, quantity=existing.item.quantity + item.quantity
+                ),
+                tier=max(existing.tier, tier),
+            )
+        self._push(queued)
+        return queued
+
+    def front(self, count: int) -> list[QueuedItem]:
+        return heapq.nsmallest(count, self._entries.values(), key=self._key)
+
+    def peek(self) -> typing.Optional[QueuedItem]:
+        while self._heap:
+            tier, order, name = self._heap[0]
+            queued = self._entries.get(name)
+            if queued is not None and self._key(queued) == (tier, order):
+                return queued
+            heapq.heappop(self._heap)
+        return None
+
+    def remove(
+        self, item: typing.Union[AuctionItem, str]
+    ) -> typing.Optional[QueuedItem]:
+        return self._entries.pop(self._name(item), None)
+
+    def set_tier(self, item: typing.Union[AuctionItem, str], tier: int) -> bool:
+        queued = self.get(item)
+        if queued is None:
+            return False
+        self._push(attr.evolve(queued, tier=tier))
+        return True
+
+    def bump(self, item: typing.Union[AuctionItem, str]) -> bool:
+        # Moves an item to the front of the queue, which means putting it in the
+        # highest tier that we have, ahead of everything else that's in it.
+        queued = self.get(item)
+        if queued is None:
+            return False
+        front = typing.cast(QueuedItem, self.peek())
+        self._push(attr.evolve(queued, tier=front.tier, order=self._first_order - 1))
+        return True
+
+    def push_front(self, item: AuctionItem) -> None:
+        queued = self.add(item)
+        self.bump(queued.item)
+
+
+class RecentKeys:
+    # The idempotency keys of items that have been added recently, so that when the
+    # same drop gets reported by more than one log tailer, we only add it once.
+    #
+    # Keys are only remembered for a limited window, and only up to a limited number
+    # of them, oldest first, so this never grows without bound. Keys come in (more
+    # or less) in time order, so the oldest is always at the front.
+
+    def __init__(
+        self,
+        window: float,
+        max_size: int,
+        keys: Iterable[tuple[str, float]] = (),
+    ):
+        self.window = window
+        self.max_size = max_size
+        self._keys: collections.OrderedDict[str, float] = collections.OrderedDict()
+
+        for key, at in keys:
+            self.add(key, at)
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def __iter__(self) -> typing.Iterator[tuple[str, float]]:
+        return iter(self._keys.items())
+
+    def expire(self, now: float) -> None:
+        while self._keys:
+            key, at = next(iter(self._keys.items()))
+            if at > now - self.window:
+                break
+            self._keys.popitem(last=False)
+
+    def seen(self, key: str, now: float) -> bool:
+        self.expire(now)
+        return key in self._keys
+
+    def add(self, key: str, at: float) -> None:
+        self._keys[key] = at
+        self._keys.move_to_end(key)
+        self.expire(at)
+        while len(self._keys) > self.max_size:
+            self._keys.popitem(last=False)
+
+
 @attr.s(slots=True, auto_attribs=True)
 class RunningAuction:
 
-    item: AuctionItem
+    items: tuple[AuctionItem, ...] = attr.ib(converter=tuple)
+    id: int = 0
+    clock: Clock = attr.ib(factory=MonotonicClock, repr=False, eq=False)
     status: Status = Status.Running
-    started_at: datetime.datetime = attr.ib(factory=datetime.datetime.utcnow)
-    last_bid: typing.Optional[datetime.datetime] = None
-    last_updated: typing.Optional[datetime.datetime] = None
-    bids: set[Bid] = attr.ib(factory=set)
-    results: typing.Optional[AuctionResults] = None
+    started_at: float = attr.ib(
+        default=attr.Factory(lambda self: self.clock.now(), takes_self=True)
+    )
+    last_bid: typing.Optional[float] = None
+    last_updated: typing.Optional[float] = None
+
+    # Once nobody is able to change the outcome of the auction anymore, there's no
+    # point in waiting around, so it gets closed at this time instead.
+    close_by: typing.Optional[float] = None
+
+    # Each item in the auction gets its own book of bids.
+    books: list[BidBook] = attr.ib(
+        default=attr.Factory(
+            lambda self: [BidBook() for _ in self.items], takes_self=True
+        ),
+        repr=False,
+    )
+    results: typing.Optional[tuple[AuctionResults, ...]] = None
+
+    # The version of the DKP that the results were worked out against, so that we
+    # can tell whether they still hold without working them out again.
+    results_version: typing.Optional[int] = None
+
+    # Working out the results is by far the most expensive thing we do with an
+    # auction, and we do it over and over again with the same inputs, so we cache
+    # the most recent results (and their rendered form), keyed by everything that
+    # they depend on.
+    _results_key: typing.Optional[tuple[tuple[int, ...], int, int]] = attr.ib(
+        default=None, init=False, repr=False, eq=False
+    )
+    _results_cache: typing.Optional[tuple[AuctionResults, ...]] = attr.ib(
+        default=None, init=False, repr=False, eq=False
+    )
+    _rendered_cache: typing.Optional[str] = attr.ib(
+        default=None, init=False, repr=False, eq=False
+    )
+
+    @property
+    def is_bundle(self) -> bool:
+        return len(self.items) > 1
+
+    @property
+    def description(self) -> str:
+        # Items in a bundle get numbered, so that people know which number to bid on
+        # to get the item that they want.
+        if not self.is_bundle:
+            return self.items[0].description
+        return ", ".join(
+            f"[{index}] {item.description}" for index, item in enumerate(self.items, 1)
+        )
+
+    def rebase(
+        self, before: DKPSnapshot, after: DKPSnapshot, changed: Container[str]
+    ) -> None:
+        # The results only depend on the DKP of the people who have bid, so if none
+        # of them changed between the two snapshots, then whatever we've got cached
+        # for the old one is just as good for the new one.
+        rebased = [book.rebase(before, after, changed) for book in self.books]
+        if not all(rebased):
+            return
+
+        if self._results_key is not None and self._results_key[1] == before.version:
+            mutations, _, member_treshold = self._results_key
+            self._results_key = (mutations, after.version, member_treshold)
+
+        # Likewise, if the auction has closed, its results still hold.
+        if self.results_version == before.version:
+            self.results_version = after.version
+
+    def current_results(
+        self, dkp: DKPSnapshot, member_treshold: int
+    ) -> tuple[AuctionResults, ...]:
+        key = (
+            tuple(book.mutations for book in self.books),
+            dkp.version,
+            member_treshold,
+        )
+        if self._results_cache is None or key != self._results_key:
+            self._results_cache = determine_results(
+                self, dkp, member_treshold=member_treshold
+            )
+            self._rendered_cache = None
+            self._results_key = key
+        return self._results_cache
+
+    def format_results(self, results: tuple[AuctionResults, ...]) -> str:
+        if not self.is_bundle:
+            return f"Results: {results[0]}"
+        return "Results:\n" + "\n".join(
+            f"[{index}] {item.description}: {item_results}"
+            for index, (item, item_results) in enumerate(zip(self.items, results), 1)
+        )
+
+    def render_results(self, dkp: DKPSnapshot, member_treshold: int) -> str:
+        results = self.current_results(dkp, member_treshold)
+        if self._rendered_cache is None:
+            self._rendered_cache = self.format_results(results)
+        return self._rendered_cache
+
+    def render_status(self, dkp: DKPSnapshot, member_treshold: int) -> str:
+        results = self.current_results(dkp, member_treshold)
+
+        title = f"{len(self.items)} items" if self.is_bundle else self.description
+        if self.status is Status.Running:
+            lines = [f"**{title}**: ending in {humanize_delta(self.time_left)}"]
+        else:
+            lines = [f"**{title}**: {self.status.name}"]
+
+        for index, (item, item_results) in enumerate(zip(self.items, results), 1):
+            summary = []
+            if item_results.winners:
+                leading = ", ".join(
+                    f"{bid.bidder} ({bid.bid})" for bid in item_results.winners
+                )
+                summary.append(f"Leading: {leading}")
+            if item_results.tied:
+                tied = ", ".join(
+                    f"{bid.bidder} ({bid.bid})" for bid in item_results.tied
+                )
+                summary.append(f"Tied: {tied}")
+            if not item_results.winners and not item_results.tied:
+                summary.append("No bids yet.")
+
+            if self.is_bundle:
+                lines.append(f"[{index}] {item.description}: {'; '.join(summary)}")
+            else:
+                lines.extend(summary)
+
+        return "\n".join(lines)
 
     @property
     def time_left(self) -> datetime.timedelta:
-        now = datetime.datetime.utcnow()
+        now = self.clock.now()
+
+        # If the outcome has already been decided, then none of the rules below
+        # matter, we're just waiting out the grace period.
+        if self.close_by is not None:
+            return datetime.timedelta(seconds=max(self.close_by - now, 0))
 
         # The logic here is kind of convulted, but it's basically inteded to roughly
         # encode the following rules:
@@ -130,13 +551,13 @@ class RunningAuction:
         # know that it will be AT LEAST this amount of time, which is close enough.
 
         # We'll start with the 90s minimum.
-        end = self.started_at + datetime.timedelta(seconds=90)
+        end = self.started_at + 90
 
         # Next we'll check to see what our end time is bsed off the last bid, if
         # we've had any bids, if that's further in the future then our default, then
         # that becomes our new end.
         if self.last_bid is not None:
-            bid_end = self.last_bid + datetime.timedelta(seconds=30)
+            bid_end = self.last_bid + 30
             if bid_end > end:
                 end = bid_end
 
@@ -148,7 +569,7 @@ class RunningAuction:
         if self.last_updated is not None and (
             self.last_bid is None or self.last_updated > self.last_bid
         ):
-            updated_end = self.last_updated + datetime.timedelta(seconds=15)
+            updated_end = self.last_updated + 15
             if updated_end > end:
                 end = updated_end
 
@@ -160,7 +581,7 @@ class RunningAuction:
         if self.last_updated is None or (
             self.last_bid is not None and self.last_updated < self.last_bid
         ):
-            updated_end = now + datetime.timedelta(seconds=15)
+            updated_end = now + 15
             if updated_end > end:
                 end = updated_end
 
@@ -168,7 +589,7 @@ class RunningAuction:
         # inthe future or not. If it is not in the future, then our remaining time
         # is 0, otherwise we'll return the remaining time.
         if end > now:
-            return end - now
+            return datetime.timedelta(seconds=end - now)
         else:
             return datetime.timedelta(seconds=0)
 
@@ -180,22 +601,58 @@ class RunningAuction:
             return False
 
         # Basic rules here are:
-        # 1. If the auction started > 30s ago
-        # 2. If the last bid was > 10s ago
-        # 3. If the last update was > 30s ago
-        now = datetime.datetime.utcnow()
+        # 1. If the auction started >= 30s ago
+        # 2. If the last bid was >= 10s ago
+        # 3. If the last update was >= 30s ago
+        #
+        # These are inclusive, so that an update is due at exactly the point in time
+        # that next_deadline says it is, otherwise waking up right on the deadline
+        # wouldn't find anything to do.
+        now = self.clock.now()
         if (
-            (now - self.started_at).total_seconds() > 30
-            and (self.last_bid is None or (now - self.last_bid).total_seconds() > 10)
-            and (
-                self.last_updated is None
-                or (now - self.last_updated).total_seconds() > 30
-            )
+            now - self.started_at >= 30
+            and (self.last_bid is None or now - self.last_bid >= 10)
+            and (self.last_updated is None or now - self.last_updated >= 30)
         ):
             return True
 
         return False
 
+    @property
+    def next_deadline(self) -> typing.Optional[float]:
+        # Returns the next point in time that something might need to happen to this
+        # auction (either an update being posted, or it closing), so that we don't
+        # have to keep polling it to find out. Only running auctions ever have
+        # anything happen to them on their own.
+        if self.status is not Status.Running:
+            return None
+
+        # These mirror the rules in needs_update, an update is due once all of
+        # them have passed.
+        update_at = self.started_at + 30
+        if self.last_bid is not None:
+            update_at = max(update_at, self.last_bid + 10)
+        if self.last_updated is not None:
+            update_at = max(update_at, self.last_updated + 30)
+
+        # These mirror the rules in time_left, except for the final one, which only
+        # applies when an update is still pending, in which case that update will
+        # always come due before the auction could close anyways.
+        close_at = self.started_at + 90
+        if self.last_bid is not None:
+            close_at = max(close_at, self.last_bid + 30)
+        if self.last_updated is not None and (
+            self.last_bid is None or self.last_updated > self.last_bid
+        ):
+            close_at = max(close_at, self.last_updated + 15)
+
+        # Unless the outcome has already been decided, in which case none of that
+        # matters.
+        if self.close_by is not None:
+            close_at = self.close_by
+
+        return min(update_at, close_at)
+
 
 @attr.s(slots=True, frozen=True, auto_attribs=True)
 class AuctionMessage:
@@ -204,6 +661,15 @@ class AuctionMessage:
     message: typing.Union[str, discord.Embed]
     hidden: bool = False
 
+    # When this is set, this message is the live status for the auction with this
+    # id, and should replace the previous status for that auction rather than being
+    # posted as a new message.
+    status_for: typing.Optional[int] = None
+
+    # The version of the channel's state that this message was produced from, so
+    # that anything consuming these can tell which of them are stale.
+    version: typing.Optional[int] = None
+
     def as_kwargs(self):
         if isinstance(self.message, discord.Embed):
             return {"embed": self.message}
@@ -214,7 +680,7 @@ class AuctionMessage:
 def validate_bid(
     bidder: str,
     bid_amount: int,
-    bids: Iterable[Bid],
+    bid_amounts: Container[int],
     dkp: typing.Mapping[str, CharacterDKP],
     *,
     valuable_threshold: int,
@@ -241,7 +707,7 @@ def validate_bid(
         # We do nothing here, because this exists just so that we don't reject
         # an "all in" bid because it doesn't match the "divisble by 5" rules.
         pass
-    elif bid_amount in {bid.bid for bid in bids}:
+    elif bid_amount in bid_amounts:
         # Again we do nothing here, because this only exists to prevent us from
         # progressing further down the elif chain, and allowing bids that match
         # already existing bids.
@@ -282,35 +748,36 @@ def _bid_key(dkp: typing.Mapping[str, CharacterDKP], member_treshold: int):
     return key_fn
 
 
-def _filter_bids(bids: Iterable[Bid]) -> Iterable[Bid]:
-    seen = set()
-    for bid in bids:
-        key = (bid.bidder, bid.id)
-        if key not in seen:
-            seen.add(key)
-            yield bid
-
-
 def determine_results(
     auction: RunningAuction,
     dkp: typing.Mapping[str, CharacterDKP],
     *,
     member_treshold=0,
-) -> AuctionResults:
+) -> tuple[AuctionResults, ...]:
     # This function *MUST NOT* modify the running auction, it should just
     # indicate what the results would be, if it ended right now (which, if the
     # auction has ended, that is the actual result).
-    need = auction.item.quantity
+    #
+    # Every item in the auction is resolved against its own bids, exactly as if
+    # they had each been auctioned on their own, just all at the same time.
+    return tuple(
+        _determine_item_results(item, book, dkp, member_treshold)
+        for item, book in zip(auction.items, auction.books)
+    )
+
+
+def _determine_item_results(
+    item: AuctionItem,
+    book: BidBook,
+    dkp: typing.Mapping[str, CharacterDKP],
+    member_treshold: int,
+) -> AuctionResults:
+    need = item.quantity
     winners = []
     tied = []
     rolled = 0
 
-    all_bids = _filter_bids(
-        sorted(auction.bids, key=_bid_key(dkp, member_treshold), reverse=True)
-    )
-    for _, b in itertools.groupby(all_bids, _bid_key(dkp, member_treshold)):
-        bids = list(b)
-
+    for bids in book.groups(dkp, member_treshold):
         # If the number of people at this bid+current dkp doesn't exceed the
         # number of items we have left to assign, then we can just award it to
         # all of them, and reduce the amount needed by that amount.
@@ -336,6 +803,22 @@ def determine_results(
     return AuctionResults(winners=winners, tied=tied, rolled=rolled)
 
 
+def stamp_version(fn):
+    # Marks every message with the version of its channel's state once it has been
+    # produced, i.e. after whatever changes the command itself made.
+    @functools.wraps(fn)
+    def wrapper(self, *args, **kwargs):
+        for message in fn(self, *args, **kwargs):
+            yield attr.evolve(message, version=self.version(message.channel))
+
+    return wrapper
+
+
+# How long a member we've fetched from discord is trusted for, before we fetch them
+# again to pick up any changes to their roles.
+MEMBER_CACHE_TTL = 30.0
+
+
 def check_auction_channels(fn):
     @functools.wraps(fn)
     def wrapper(self, channel, *args, **kwargs):
@@ -382,65 +865,648 @@ def check_auction_status(statuses):
 
 
 class Auctioneer:
-    def __init__(self, *args, channels, limits, **kwargs):
+    def __init__(
+        self,
+        *args,
+        channels,
+        limits,
+        clock=None,
+        live_status=False,
+        journal=None,
+        bundle_size=1,
+        early_close=False,
+        early_close_grace=15.0,
+        dedup_window=300.0,
+        dedup_max_keys=10000,
+        feed=None,
+        **kwargs,
+    ):
         super().__init__(*args, *kwargs)
 
-        self._pending_items: list[AuctionItem] = []
+        self.clock: Clock = MonotonicClock() if clock is None else clock
+        self.live_status = live_status
+        self.bundle_size = bundle_size
+        self.early_close = early_close
+        self.early_close_grace = early_close_grace
+        self.journal: typing.Optional[Journal] = journal
+        self.feed: typing.Optional[AuctionFeed] = feed
+        self._last_auction_id = 0
+
+        # Events that have happened, but haven't been published to the feed yet,
+        # since we don't publish anything until it's safely in the journal. Each one
+        # is numbered with its place in the journal, so that the feed's numbering
+        # carries on from one leader to the next, or just counted if we don't have
+        # a journal.
+        self._seq = 0
+        self._unpublished: list[tuple[int, str, str, int, dict]] = []
+
+        # Our clock only means anything within this process, so anything that we
+        # write to the journal uses wall clock times instead, which we translate
+        # back into our clock's time when we read them.
+        self._epoch = self.clock.wall() - self.clock.now()
+
+        self._configured_channels = tuple(channels)
+        self._queue = ItemQueue()
+        self._dedup_window = dedup_window
+        self._dedup_max_keys = dedup_max_keys
+        self._recent = RecentKeys(dedup_window, dedup_max_keys)
+
+        # How many auctions each channel has had, so that we can spread them evenly
+        # across all of our channels.
+        self._load: collections.Counter[str] = collections.Counter()
+
+        # How many times each channel's state has changed, which is included in
+        # every message we produce for that channel.
+        self._versions: collections.Counter[str] = collections.Counter()
         self._channels: dict[str, typing.Optional[RunningAuction]] = {
             channel: None for channel in channels
         }
         self._limits = limits
-        self._dkp: typing.Mapping[str, CharacterDKP] = {}
+        self._dkp = DKPSnapshot()
+
+        # A heap of (deadline, generation, channel) for every running auction, so
+        # that we know exactly when we next need to do something, rather than having
+        # to poll. Whenever an auction's deadline changes, we just push a new entry
+        # with a new generation, and any older entries for that channel get thrown
+        # away when they reach the top of the heap.
+        self._deadlines: list[tuple[float, int, str]] = []
+        self._armed: dict[str, int] = {}
+        self._generation = itertools.count()
 
     @property
     def has_running_auctions(self) -> bool:
         return any(self._channels.values())
 
-    def add(self, item: AuctionItem) -> None:
-        self._pending_items.append(item)
+    @property
+    def next_deadline(self) -> typing.Optional[float]:
+        # If we've got items waiting and somewhere to put them, then there's
+        # something to do right now.
+        if self._queue and not all(self._channels.values()):
+            return self.clock.now()
+
+        while self._deadlines:
+            deadline, generation, channel = self._deadlines[0]
+            if self._armed.get(channel) == generation:
+                return deadline
+            heapq.heappop(self._deadlines)
+
+        return None
+
+    def _arm(self, channel: str) -> None:
+        auction = self._channels.get(channel)
+        deadline = None if auction is None else auction.next_deadline
+        if deadline is None:
+            self._armed.pop(channel, None)
+            return
 
-    def update_dkp(self, dkp):
-        self._dkp.clear()
-        self._dkp.update(dkp)
+        generation = next(self._generation)
+        self._armed[channel] = generation
+        heapq.heappush(self._deadlines, (deadline, generation, channel))
+
+    def version(self, channel: str) -> int:
+        return self._versions[channel]
+
+    def rearm(self, channel: str) -> None:
+        # Gives a channel that due() returned, but that never got ticked, its
+        # deadline back.
+        self._arm(channel)
+
+    def is_auction_channel(self, channel: str) -> bool:
+        return channel in self._channels
+
+    def due(self) -> list[str]:
+        # Returns every channel whose auction has reached its deadline, each of which
+        # then needs to be passed to tick(). Once a channel has been returned, it
+        # won't be returned again until it has been ticked.
+        now = self.clock.now()
+        due = []
+        while self._deadlines and self._deadlines[0][0] <= now:
+            _, generation, channel = heapq.heappop(self._deadlines)
+            if self._armed.get(channel) == generation:
+                del self._armed[channel]
+                due.append(channel)
+        return due
+
+    def _to_wall(self, when: typing.Optional[float]) -> typing.Optional[float]:
+        return None if when is None else when + self._epoch
+
+    def _from_wall(self, when: typing.Optional[float]) -> typing.Optional[float]:
+        return None if when is None else when - self._epoch
+
+    def _now(self) -> float:
+        return typing.cast(float, self._to_wall(self.clock.now()))
+
+    def _commit(self, event: str, **data) -> None:
+        # Every change to our state goes through here, as an event that gets written
+        # to the journal (if we have one) and then applied. Since applying an event
+        # is all that ever changes our state, replaying the journal after a restart
+        # gets us back to exactly where we were.
+        if self.journal is not None:
+            self.journal.append(event, data)
+            self._seq = self.journal.seq
+        else:
+            self._seq += 1
+
+        # Only things that happen to an auction go out on the feed, and we need to
+        # know which auction it was before applying the event, since it might be
+        # the one that gets rid of it.
+        if self.feed is not None and "channel" in data:
+            auction = self._channels.get(data["channel"])
+            if event == "start":
+                auction_id = data["id"]
+            else:
+                auction_id = 0 if auction is None else auction.id
+            self._unpublished.append(
+                (self._seq, event, data["channel"], auction_id, data)
+            )
 
-    def run(self) -> Iterable[AuctionMessage]:
-        # Loop over any running auctions we have, posting updates and/or closing the
-        # auction as needed.
+        self._apply(event, data)
+
+    def publish(self, upto: typing.Optional[int] = None) -> None:
+        # Publishes every event up to and including the given sequence number (or
+        # all of them) to the feed, which should only ever be as far as the journal
+        # has made it to disk.
+        count = 0
+        for seq, *_ in self._unpublished:
+            if upto is not None and seq > upto:
+                break
+            count += 1
+        events, self._unpublished = (
+            self._unpublished[:count],
+            self._unpublished[count:],
+        )
+        if self.feed is not None:
+            for event in events:
+                self.feed.publish(*event)
+
+    def _apply(self, event: str, data: dict) -> None:
+        if event == "add":
+            self._queue.add(
+                cattr.structure(data["item"], AuctionItem), data.get("tier", 0)
+            )
+            if data.get("key") is not None:
+                self._recent.add(data["key"], data["at"])
+            return
+        elif event == "prioritize":
+            self._queue.set_tier(data["item"], data["tier"])
+            return
+        elif event == "bump":
+            self._queue.bump(data["item"])
+            return
+
+        channel = data["channel"]
+        self._versions[channel] += 1
+
+        if event == "start":
+            # Starting an auction takes the items off of the queue, unless it's being
+            # started again from an auction that was already running.
+            items = cattr.structure(data["items"], list[AuctionItem])
+            if data.get("pending", True):
+                for item in items:
+                    self._queue.remove(item)
+            self._load[channel] += 1
+            self._last_auction_id = max(self._last_auction_id, data["id"])
+            self._channels[channel] = RunningAuction(
+                items=items,
+                id=data["id"],
+                clock=self.clock,
+                started_at=self._from_wall(data["at"]),
+            )
+            self._arm(channel)
+            return
+
+        auction = self._channels.get(channel)
+        if auction is None:
+            logger.warning(f"Skipping {event} event for idle channel: {channel}")
+            return
+
+        if event == "bid":
+            bid = cattr.structure(data["bid"], Bid)
+            auction.books[bid.item].add(bid, self._dkp, self._limits.member)
+            auction.last_bid = self._from_wall(data["at"])
+        elif event == "update":
+            auction.last_updated = self._from_wall(data["at"])
+        elif event == "settle":
+            auction.close_by = self._from_wall(data["at"])
+        elif event == "close":
+            auction.status = Status.Finished
+            auction.results = cattr.structure(
+                data["results"], tuple[AuctionResults, ...]
+            )
+            auction.results_version = data.get("version")
+        elif event == "stop":
+            auction.status = Status.Stopped
+        elif event == "reopen":
+            auction.results = None
+            auction.results_version = None
+            auction.started_at = self._from_wall(data["at"])
+            auction.last_updated = None
+            auction.last_bid = None
+            auction.close_by = None
+            auction.status = Status.Running
+        elif event == "delete":
+            self._channels[channel] = None
+        elif event == "retire":
+            # The channel this auction was running in isn't one of our auction
+            # channels anymore, so its items go back to the front of the queue.
+            del self._channels[channel]
+            for item in reversed(auction.items):
+                self._queue.push_front(item)
+        elif event == "accept":
+            # TODO: Once accepting awards the item, this will need to record that.
+            pass
+        else:
+            raise ValueError(f"Unknown auction event: {event}")
+
+        self._arm(channel)
+
+    def dump(self) -> dict:
+        # Returns our entire state, in a form that can be written out as a snapshot
+        # of the journal, and handed back to recover() later.
+        channels = {}
         for channel, auction in self._channels.items():
-            # If there's no running auction here, we can just skip this channel.
             if auction is None:
-                logger.debug(f"No auction for channel: {channel}, skipping.")
+                channels[channel] = None
                 continue
 
-            # If this auction is ready to be closed, then we're going to close it.
-            # This has to come before anything else we do, because we don't want
-            # to update, then immediately close.
-            if not auction.time_left and auction.status is Status.Running:
-                auction.status = Status.Finished
-                auction.results = determine_results(
-                    auction, self._dkp, member_treshold=self._limits.member
-                )
-                yield AuctionMessage(
-                    channel=channel,
-                    message=f"Auction Closed. Results: {auction.results}",
-                )
+            channels[channel] = {
+                "items": cattr.unstructure(auction.items),
+                "id": auction.id,
+                "status": auction.status.name,
+                "started_at": self._to_wall(auction.started_at),
+                "last_bid": self._to_wall(auction.last_bid),
+                "last_updated": self._to_wall(auction.last_updated),
+                "close_by": self._to_wall(auction.close_by),
+                "bids": cattr.unstructure(
+                    [bid for book in auction.books for bid in book.history]
+                ),
+                "results": cattr.unstructure(auction.results),
+                "results_version": auction.results_version,
+            }
+
+        return {
+            "last_auction_id": self._last_auction_id,
+            "pending": cattr.unstructure(list(self._queue)),
+            "recent": [[key, at] for key, at in self._recent],
+            "load": dict(self._load),
+            "versions": dict(self._versions),
+            "channels": channels,
+        }
+
+    def restore(
+        self, state: typing.Optional[dict], events: Iterable[tuple[str, dict]]
+    ) -> None:
+        # Replaces our state with the one from a journal, the last snapshot, plus
+        # every event since then, none of which get written back to the journal,
+        # since they're already in it.
+        self._last_auction_id = 0
+        self._unpublished = []
+        self._queue = ItemQueue()
+        self._recent = RecentKeys(self._dedup_window, self._dedup_max_keys)
+        self._load = collections.Counter()
+        self._versions = collections.Counter()
+        self._channels = {channel: None for channel in self._configured_channels}
+        self._deadlines = []
+        self._armed = {}
+
+        if state is not None:
+            self._last_auction_id = state["last_auction_id"]
+            self._queue = ItemQueue(
+                cattr.structure(state["pending"], list[QueuedItem])
+            )
+            self._recent = RecentKeys(
+                self._dedup_window,
+                self._dedup_max_keys,
+                [(key, at) for key, at in state.get("recent", [])],
+            )
+            self._load = collections.Counter(state["load"])
+            self._versions = collections.Counter(state.get("versions", {}))
+            self._channels = {}
+            for channel, data in state["channels"].items():
+                self._channels[channel] = None if data is None else self._restore(data)
+
+        self.replay(events)
+
+    def replay(self, events: Iterable[tuple[str, dict]]) -> None:
+        for event, data in events:
+            self._apply(event, data)
+
+    def reconcile(self) -> None:
+        # Our auction channels might have been changed since the journal we were
+        # restored from was written, any new ones can just be added, but anything
+        # running in a channel that we don't use anymore has to go back in the queue.
+        for channel in self._configured_channels:
+            self._channels.setdefault(channel, None)
+        for channel, auction in list(self._channels.items()):
+            if channel not in self._configured_channels:
+                if auction is None:
+                    del self._channels[channel]
+                else:
+                    self._commit("retire", channel=channel)
+
+        for channel in self._channels:
+            self._arm(channel)
+
+    def recover(
+        self, state: typing.Optional[dict], events: Iterable[tuple[str, dict]]
+    ) -> None:
+        # Picks up where the journal left off, this has to happen before anything
+        # else is done with the auctioneer.
+        self.restore(state, events)
+        self.reconcile()
+
+    def _restore(self, data: dict) -> RunningAuction:
+        auction = RunningAuction(
+            items=cattr.structure(data["items"], list[AuctionItem]),
+            id=data["id"],
+            clock=self.clock,
+            status=Status[data["status"]],
+            started_at=self._from_wall(data["started_at"]),
+            last_bid=self._from_wall(data["last_bid"]),
+            last_updated=self._from_wall(data["last_updated"]),
+            close_by=self._from_wall(data["close_by"]),
+            results=cattr.structure(
+                data["results"], typing.Optional[tuple[AuctionResults, ...]]
+            ),
+            results_version=data.get("results_version"),
+        )
+        for bid in cattr.structure(data["bids"], list[Bid]):
+            auction.books[bid.item].add(bid, self._dkp, self._limits.member)
+        return auction
+
+    def add(
+        self, item: AuctionItem, tier: int = 0, key: typing.Optional[str] = None
+    ) -> bool:
+        # If this item came with an idempotency key that we've already seen, then
+        # it's a duplicate of something we've already added, and gets dropped.
+        now = self._now()
+        if key is not None and self._recent.seen(key, now):
+            logger.debug(f"Skipping duplicate item: {item.item} ({key})")
+            return False
+
+        self._commit("add", item=cattr.unstructure(item), tier=tier, key=key, at=now)
+        return True
+
+    @property
+    def queue(self) -> list[QueuedItem]:
+        return list(self._queue)
+
+    def prioritize(self, channel, item: str, tier: int) -> Iterable[AuctionMessage]:
+        if self._queue.get(item) is None:
+            yield AuctionMessage(
+                channel=channel,
+                message=f"There isn't a queued item called {item}.",
+                hidden=True,
+            )
+            return
 
-            # Check to see if we need to post an update for this auction to the
-            # channel.
-            if auction.needs_update:
-                auction.last_updated = datetime.datetime.utcnow()
-                results = determine_results(
-                    auction, self._dkp, member_treshold=self._limits.member
+        self._commit("prioritize", item=item, tier=tier)
+        yield AuctionMessage(
+            channel=channel,
+            message=f"Moved {item} to priority {tier}.",
+            hidden=True,
+        )
+
+    def bump(self, channel, item: str) -> Iterable[AuctionMessage]:
+        if self._queue.get(item) is None:
+            yield AuctionMessage(
+                channel=channel,
+                message=f"There isn't a queued item called {item}.",
+                hidden=True,
+            )
+            return
+
+        self._commit("bump", item=item)
+        yield AuctionMessage(
+            channel=channel,
+            message=f"Moved {item} to the front of the queue.",
+            hidden=True,
+        )
+
+    def show_queue(self, channel) -> Iterable[AuctionMessage]:
+        if not self._queue:
+            yield AuctionMessage(
+                channel=channel, message="There are no queued items.", hidden=True
+            )
+            return
+
+        lines = [
+            f"{position}. {queued.item.description} (priority {queued.tier}, "
+            f"added by {queued.item.added_by})"
+            for position, queued in enumerate(self._queue, 1)
+        ]
+        yield AuctionMessage(channel=channel, message="\n".join(lines), hidden=True)
+
+    def _best_possible_key(
+        self, name: str, dkp: DKPSnapshot, bid_amounts: Container[int]
+    ) -> typing.Optional[tuple]:
+        # Works out the best bid that this character could possibly make, under the
+        # same rules as validate_bid, and returns where it would sort. We don't know
+        # what rank they'd bid at, so we assume the best.
+        current = dkp.current(name)
+        limits = self._limits
+
+        if current <= limits.maximum:
+            # Going all in is always allowed.
+            bid = current
+        else:
+            # Otherwise it's the maximum, unless that isn't a valid bid, in which case
+            # it's whichever valid bid is closest to it.
+            bid = limits.maximum
+            if bid >= limits.valuable and bid % 5 and bid not in bid_amounts:
+                bid = max(
+                    [
+                        bid - bid % 5,
+                        limits.valuable - 1,
+                        *(amount for amount in bid_amounts if amount < bid),
+                    ]
                 )
+
+        if bid < limits.minimum:
+            return None
+
+        return (1 if bid >= limits.member else 0, bid, current)
+
+    def _is_settled(self, auction: RunningAuction, dkp: DKPSnapshot) -> bool:
+        # An auction is settled once every item has enough clear winners, and there
+        # isn't anyone else who could bid enough to beat, or even tie, any of them.
+        key_fn = _bid_key(dkp, self._limits.member)
+        results = auction.current_results(dkp, self._limits.member)
+
+        for book, item_results in zip(auction.books, results):
+            if item_results.tied or item_results.rolled:
+                return False
+
+            # Without any winners, there's nobody for anyone else to have to beat,
+            # so nothing is decided yet.
+            if not item_results.winners:
+                return False
+
+            weakest = min(key_fn(bid) for bid in item_results.winners)
+            winners = {bid.bidder for bid in item_results.winners}
+
+            # Nobody can bid more than they have, so once we get down to people who
+            # don't have enough to match the weakest winner (or to get the priority
+            # that mains get, if they didn't), nobody left can either.
+            flag, amount, _ = weakest
+            floor = amount if flag else min(amount, self._limits.member)
+
+            for name in dkp.ranked():
+                if dkp.current(name) < floor:
+                    break
+                if name in winners:
+                    continue
+                best = self._best_possible_key(name, dkp, book.amounts)
+                if best is not None and best >= weakest:
+                    return False
+
+        return True
+
+    def _settle(
+        self, channel: str, auction: RunningAuction, dkp: DKPSnapshot
+    ) -> Iterable[AuctionMessage]:
+        # Checks whether the outcome of this auction is decided, and if it is, then
+        # sets it to close once the grace period is up. Since DKP can change, an
+        # auction that was decided can also go back to running normally.
+        if not self.early_close or auction.status is not Status.Running:
+            return
+
+        settled = self._is_settled(auction, dkp)
+        if settled and auction.close_by is None:
+            self._commit(
+                "settle", channel=channel, at=self._now() + self.early_close_grace
+            )
+            yield AuctionMessage(
+                channel=channel,
+                message=(
+                    f"Nobody can outbid the current leaders for {auction.description}, "
+                    f"closing in {humanize_delta(auction.time_left)}."
+                ),
+            )
+        elif not settled and auction.close_by is not None:
+            self._commit("settle", channel=channel, at=None)
+
+    def _status(
+        self,
+        channel: str,
+        auction: RunningAuction,
+        dkp: typing.Optional[DKPSnapshot] = None,
+    ) -> AuctionMessage:
+        if dkp is None:
+            dkp = self._dkp
+        return AuctionMessage(
+            channel=channel,
+            message=auction.render_status(dkp, self._limits.member),
+            status_for=auction.id,
+        )
+
+    @property
+    def dkp_version(self) -> int:
+        return self._dkp.version
+
+    def update_dkp(
+        self,
+        dkp: typing.Mapping[str, CharacterDKP],
+        changes: typing.Optional[Iterable[DKPChange]] = None,
+        *,
+        since: typing.Optional[int] = None,
+    ) -> None:
+        # Snapshots are immutable, so we can just hold onto a reference to the one
+        # we've been given, rather than copying it. Anything that is in the middle of
+        # using the old snapshot will just keep using it until it's done.
+        if not isinstance(dkp, DKPSnapshot):
+            dkp = DKPSnapshot(dkp.values(), version=self._dkp.version + 1)
+
+        # Versions only ever move forward, if we've somehow been handed an older
+        # snapshot than the one we already have, then we'll just ignore it.
+        if dkp is self._dkp or dkp.version < self._dkp.version:
+            return
+
+        previous, self._dkp = self._dkp, dkp
+
+        # If we've been told exactly who changed since the snapshot we had, then any
+        # auction that none of them have bid in can carry its books and results
+        # straight over, rather than working them all out again on the next tick.
+        # Those changes are only any good if they start from the snapshot we had.
+        if changes is None or since != previous.version:
+            return
+
+        changed = {change.name for change in changes}
+        for auction in self._channels.values():
+            if auction is not None:
+                auction.rebase(previous, dkp, changed)
+
+    def run(self) -> Iterable[AuctionMessage]:
+        # We grab the current DKP snapshot once, so that this entire pass is computed
+        # against the same data, even if a new snapshot gets swapped in while our
+        # caller is off sending the messages we've yielded.
+        dkp = self._dkp
+
+        for channel in self.due():
+            yield from self.tick(channel, dkp)
+
+    @stamp_version
+    def tick(
+        self, channel: str, dkp: typing.Optional[DKPSnapshot] = None
+    ) -> Iterable[AuctionMessage]:
+        # Posts updates and/or closes the auction in a channel whose deadline has
+        # come up.
+        if dkp is None:
+            dkp = self._dkp
+
+        auction = self._channels.get(channel)
+
+        # If there's no running auction here, we can just skip this channel.
+        if auction is None:
+            logger.debug(f"No auction for channel: {channel}, skipping.")
+            return
+
+        # The DKP might have changed since we last looked, which can change
+        # whether or not this auction has been decided already.
+        yield from self._settle(channel, auction, dkp)
+
+        # If this auction is ready to be closed, then we're going to close it.
+        # This has to come before anything else we do, because we don't want
+        # to update, then immediately close.
+        if not auction.time_left and auction.status is Status.Running:
+            self._commit(
+                "close",
+                channel=channel,
+                results=cattr.unstructure(
+                    auction.current_results(dkp, self._limits.member)
+                ),
+                version=dkp.version,
+            )
+            yield AuctionMessage(
+                channel=channel,
+                message=(
+                    "Auction Closed. "
+                    f"{auction.render_results(dkp, self._limits.member)}"
+                ),
+            )
+            if self.live_status:
+                yield self._status(channel, auction, dkp)
+
+        # Check to see if we need to post an update for this auction to the
+        # channel.
+        if auction.needs_update:
+            self._commit("update", channel=channel, at=self._now())
+            if self.live_status:
+                yield self._status(channel, auction, dkp)
+            else:
                 yield AuctionMessage(
                     channel=channel,
                     message=(
-                        f"This is an update for {auction.item.description} "
+                        f"This is an update for {auction.description} "
                         f"ending in {humanize_delta(auction.time_left)}.\n"
-                        f"Results: {results}"
+                        f"{auction.render_results(dkp, self._limits.member)}"
                     ),
                 )
 
+        # Whatever we did (or didn't do), this auction now has a new deadline.
+        self._arm(channel)
+
+    @stamp_version
     @check_auction_channels
     @check_auction_status(
         {
@@ -455,15 +1521,32 @@ class Auctioneer:
         }
     )
     def bid(
-        self, channel, bidder, bid_amount: int, bid_id: int, rank: BidderRank
+        self,
+        channel,
+        bidder,
+        bid_amount: int,
+        bid_id: int,
+        rank: BidderRank,
+        item: int = 0,
     ) -> Iterable[AuctionMessage]:
         # Grab the item that is currently being bid in our channel.
         auction = typing.cast(RunningAuction, self._channels[channel])
 
+        if not 0 <= item < len(auction.items):
+            yield AuctionMessage(
+                channel=channel,
+                message=(
+                    f"Error: Invalid Bid (there is no item {item + 1} in this "
+                    "auction)."
+                ),
+                hidden=True,
+            )
+            return
+
         valid, error = validate_bid(
             bidder,
             bid_amount,
-            auction.bids,
+            auction.books[item].amounts,
             self._dkp,
             valuable_threshold=self._limits.valuable,
             minimum=self._limits.minimum,
@@ -475,13 +1558,24 @@ class Auctioneer:
 
         # Add our bid to the system, extending the time left before the auction
         # ends if required.
-        bid = Bid(bidder=bidder, bid=bid_amount, id=bid_id, rank=rank)
-        auction.bids.add(bid)
-        auction.last_bid = datetime.datetime.utcnow()
+        bid = Bid(bidder=bidder, bid=bid_amount, id=bid_id, rank=rank, item=item)
+        self._commit(
+            "bid", channel=channel, bid=cattr.unstructure(bid), at=self._now()
+        )
+
+        settle = list(self._settle(channel, auction, self._dkp))
 
         yield AuctionMessage(channel=channel, message="Bid Accepted!", hidden=True)
-        yield AuctionMessage(channel=channel, message=f"{bid.bidder} has bid {bid.bid}")
+        if self.live_status:
+            yield self._status(channel, auction)
+        else:
+            message = f"{bid.bidder} has bid {bid.bid}"
+            if auction.is_bundle:
+                message += f" on [{item + 1}] {auction.items[item].description}"
+            yield AuctionMessage(channel=channel, message=message)
+        yield from settle
 
+    @stamp_version
     @check_auction_channels
     @check_auction_status(
         {
@@ -491,16 +1585,19 @@ class Auctioneer:
     )
     def stop(self, channel) -> Iterable[AuctionMessage]:
         auction = typing.cast(RunningAuction, self._channels[channel])
-        auction.status = Status.Stopped
+        self._commit("stop", channel=channel)
 
         yield AuctionMessage(
             channel=channel, message="Auction has been stopped", hidden=True
         )
         yield AuctionMessage(
             channel=channel,
-            message=f"Auction for {auction.item.description} has been stopped.",
+            message=f"Auction for {auction.description} has been stopped.",
         )
+        if self.live_status:
+            yield self._status(channel, auction)
 
+    @stamp_version
     @check_auction_channels
     @check_auction_status(
         {
@@ -513,10 +1610,13 @@ class Auctioneer:
         auction = typing.cast(RunningAuction, self._channels[channel])
 
         # We're going to compute the results again, and see if they differ, if they
-        # do, we're going to refuse to accept the auction without a -force flag.
-        results = determine_results(
-            auction, self._dkp, member_treshold=self._limits.member
-        )
+        # do, we're going to refuse to accept the auction without a -force flag. A
+        # finished auction can't take any more bids, so if the DKP is still the
+        # version that it closed with, there's nothing to compute at all.
+        if auction.results_version == self.dkp_version:
+            results = auction.results
+        else:
+            results = auction.current_results(self._dkp, self._limits.member)
         if not force and auction.results != results:
             # TODO: Mention the ability to reopen + force accept the new results.
             yield AuctionMessage(
@@ -529,13 +1629,21 @@ class Auctioneer:
             )
         else:
             # TODO: Award the item in the DKP system.
+            self._commit(
+                "accept",
+                channel=channel,
+                results=cattr.unstructure(results),
+                force=force,
+            )
             yield AuctionMessage(
                 channel=channel, message="Auction Accepted", hidden=True
             )
             yield AuctionMessage(
-                channel=channel, message=f"Auction Accepted: {results}"
+                channel=channel,
+                message=f"Auction Accepted. {auction.format_results(results)}",
             )
 
+    @stamp_version
     @check_auction_channels
     @check_auction_status(
         {
@@ -549,73 +1657,94 @@ class Auctioneer:
         # We're going to leave any existing bids alone, however we're going to reset the
         # auction so it runs for the full duration again, just with the bids in the same
         # state that they are now.
-        auction.results = None
-        auction.started_at = datetime.datetime.utcnow()
-        auction.last_updated = None
-        auction.last_bid = None
-        auction.status = Status.Running
+        self._commit("reopen", channel=channel, at=self._now())
 
         yield AuctionMessage(channel=channel, message="Reopening Bidding", hidden=True)
         yield AuctionMessage(
             channel=channel,
             message=(
-                f"Reopening Bids for {auction.item.description}, "
+                f"Reopening Bids for {auction.description}, "
                 f"ending in {humanize_delta(auction.time_left)}"
             ),
         )
+        if self.live_status:
+            yield self._status(channel, auction)
 
+    @stamp_version
     @check_auction_channels
     def restart(self, channel) -> Iterable[AuctionMessage]:
-        # Grab the item that is currently being bid in our channel.
-        auction = typing.cast(RunningAuction, self._channels[channel])
+        # Grab the items that are currently being bid on in our channel.
+        items = typing.cast(RunningAuction, self._channels[channel]).items
 
-        # To restart the auction, we can just create a new RunningAuction with the same
-        # item, and the same channel.
-        item = auction.item
-        auction = RunningAuction(item=item)
-        self._channels[channel] = auction
+        # To restart the auction, we can just start a new auction with the same
+        # items, in the same channel.
+        self._commit(
+            "start",
+            channel=channel,
+            id=self._last_auction_id + 1,
+            items=cattr.unstructure(items),
+            at=self._now(),
+            pending=False,
+        )
+        auction = typing.cast(RunningAuction, self._channels[channel])
 
         yield AuctionMessage(channel=channel, message="Restarted Auction", hidden=True)
         yield AuctionMessage(
             channel=channel,
             message=(
-                f"Restarting Bids for {item.description}, "
+                f"Restarting Bids for {auction.description}, "
                 f"ending in {humanize_delta(auction.time_left)}"
             ),
         )
+        if self.live_status:
+            yield self._status(channel, auction)
 
+    @stamp_version
     @check_auction_channels
     def delete(self, channel) -> Iterable[AuctionMessage]:
         # Grab the item that is currently being bid in our channel.
         auction = typing.cast(RunningAuction, self._channels[channel])
 
-        self._channels[channel] = None
+        self._commit("delete", channel=channel)
 
         yield AuctionMessage(channel=channel, message="Auction Deleted", hidden=True)
         yield AuctionMessage(
             channel=channel,
-            message=f"Auction for {auction.item.description} has been deleted.",
+            message=f"Auction for {auction.description} has been deleted.",
         )
 
+    @stamp_version
     def next(self) -> Iterable[AuctionMessage]:
-        while self._pending_items and not all(self._channels.values()):
+        while self._queue and not all(self._channels.values()):
             # If we've gotten here, then we have items to auction, and we have available
-            # channels to auction them in, so let's go ahead and pick one of each.
-            item = self._pending_items.pop(0)
-            channel = random.choice(
-                [channel for channel, item in self._channels.items() if item is None]
+            # channels to auction them in, so let's go ahead and pick some of each. We
+            # take however many items go in a bundle from the front of the queue, and
+            # put them in whichever free channel has had the fewest auctions so far.
+            items = [queued.item for queued in self._queue.front(self.bundle_size)]
+            channel = min(
+                (channel for channel, auction in self._channels.items() if not auction),
+                key=lambda channel: self._load[channel],
             )
 
-            # We have an item and a channel, now we'll actually start the auction.
-            auction = RunningAuction(item=item)
-            self._channels[channel] = auction
+            # We have our items and a channel, now we'll actually start the auction.
+            self._commit(
+                "start",
+                channel=channel,
+                id=self._last_auction_id + 1,
+                items=cattr.unstructure(items),
+                at=self._now(),
+            )
+            auction = typing.cast(RunningAuction, self._channels[channel])
+            added_by = ", ".join(dict.fromkeys(item.added_by for item in items))
             yield AuctionMessage(
                 channel=channel,
                 message=(
-                    f"Starting Bid for {item.description} by {item.added_by}, "
+                    f"Starting Bid for {auction.description} by {added_by}, "
                     f"ending in {humanize_delta(auction.time_left)}"
                 ),
             )
+            if self.live_status:
+                yield self._status(channel, auction)
 
 
 class Role(enum.Enum):
@@ -628,13 +1757,96 @@ class Role(enum.Enum):
     Member = "member"
 
 
+class RoleIndex:
+    # Works out which of the roles we care about each member has, as a bitmask, so
+    # that checking permissions (or figuring out someone's rank) doesn't mean
+    # resolving roles by name and scanning lists every time. Each role we're asked
+    # about gets its own bit, and each discord role maps to the bits of the roles
+    # that it satisfies.
+    #
+    # Only the role -> bits map is cached, and it needs to be rebuilt whenever the
+    # server's roles change. Members' masks are always computed from the roles they
+    # have right now, since we don't get told when a member's roles change (that
+    # needs the members intent, which we don't have).
+
+    def __init__(self, roles):
+        self._roles = roles
+        self._server = None
+        self._bits: dict[typing.Union[Role, str, int], int] = {}
+        self._role_bits: dict[int, int] = {}
+
+        for role in Role:
+            self.bit(role)
+
+    def bit(self, role: typing.Union[Role, str, int]) -> int:
+        if role not in self._bits:
+            self._bits[role] = 1 << len(self._bits)
+            self.rebuild()
+        return self._bits[role]
+
+    def mask_for(self, roles: Iterable[typing.Union[Role, str, int]]) -> int:
+        mask = 0
+        for role in roles:
+            mask |= self.bit(role)
+        return mask
+
+    def rebuild(self, server=None) -> None:
+        if server is not None:
+            self._server = server
+
+        self._role_bits.clear()
+
+        if self._server is None:
+            return
+
+        # When multiple roles share the same name, we want the first one, to match
+        # what looking them up one at a time would give us.
+        by_name = {}
+        for discord_role in self._server.roles:
+            by_name.setdefault(discord_role.name, discord_role)
+
+        for role, bit in self._bits.items():
+            lookup_role = role
+            if isinstance(role, Role):
+                lookup_role = getattr(self._roles, role.value)
+
+            if isinstance(lookup_role, str):
+                discord_role = by_name.get(lookup_role)
+            else:
+                discord_role = self._server.get_role(lookup_role)
+
+            if discord_role is not None:
+                self._role_bits[discord_role.id] = (
+                    self._role_bits.get(discord_role.id, 0) | bit
+                )
+
+    def resolve(self, role: typing.Union[Role, str, int]):
+        bit = self.bit(role)
+        for role_id, bits in self._role_bits.items():
+            if bits & bit:
+                return self._server.get_role(role_id)
+        return None
+
+    def mask(self, member) -> int:
+        mask = 0
+        for discord_role in getattr(member, "roles", ()):
+            mask |= self._role_bits.get(discord_role.id, 0)
+        return mask
+
+    def has_any(self, member, roles: Iterable[typing.Union[Role, str, int]]) -> bool:
+        # We have to work out the bits we need first, since asking about a role we
+        # haven't seen before will rebuild the index.
+        required = self.mask_for(roles)
+        return bool(self.mask(member) & required)
+
+
 def check_roles(*roles: typing.Union[Role, str, int]):
+    roles = tuple(role for role in roles if role is not None)
+
     def deco(fn):
         @functools.wraps(fn)
         async def wrapper(self, ctx: SlashContext, *args, **kwargs):
-            if not set(ctx.author.roles) & {
-                self.get_role(role) for role in roles if role is not None
-            }:
+            if not self.roles.has_any(ctx.author, roles):
                 await ctx.send(
                     hidden=True,
                     content=(
@@ -649,72 +1861,465 @@ def check_roles(*roles: typing.Union[Role, str, int]):
     return deco
 
 
+async def _collect(messages: Iterable[AuctionMessage]) -> list[AuctionMessage]:
+    return list(messages)
+
+
 class Auction(Cog):
     def __init__(self, bot):
         self.bot = bot
+        self.journal = None
+        self.feed = AuctionFeed(
+            history=self.bot.config.auction.feed_history,
+            buffer=self.bot.config.auction.feed_buffer,
+        )
         self.auctioneer = Auctioneer(
             channels=self.bot.config.auction.channels,
             limits=self.bot.config.auction.limits,
+            live_status=self.bot.config.auction.live_status,
+            bundle_size=self.bot.config.auction.bundle_size,
+            early_close=self.bot.config.auction.early_close,
+            early_close_grace=self.bot.config.auction.early_close_grace,
+            dedup_window=self.bot.config.auction.dedup_window,
+            dedup_max_keys=self.bot.config.auction.dedup_max_keys,
+            feed=self.feed,
         )
         self.dkp = self.bot.get_cog("DKP")
         self.server = None
-        self._role_mappings = {}
-        self._run_auction.start()
+        self.roles = RoleIndex(self.bot.config.auction.roles)
+        self.dispatcher = Dispatcher()
+        self.actors = ChannelActors()
+        self._channels: dict[str, discord.abc.GuildChannel] = {}
+        self._status_messages: dict[str, tuple[int, discord.Message]] = {}
+        self._members: dict[int, tuple[float, discord.Member]] = {}
+        self._wakeup = asyncio.Event()
+        self._auctions_running = False
+        self._ticks: set[asyncio.Task] = set()
+        self._runner = None
+        self._journaler = None
+        self._follower = None
+
+        # A standby can only take over from the journal, so if we're going to be
+        # failing over, we need one, even while we're the one in charge.
+        if self.bot.config.failover.enabled and self.bot.config.auction.journal is None:
+            raise RuntimeError("Failover requires an auction journal")
+
+        # If we're the one in charge, we pick up wherever the journal left off, and
+        # start running auctions, otherwise we follow along with whoever is in
+        # charge, so that we're ready to take over from them.
+        if self.bot.is_leader:
+            self._lead()
+        else:
+            self._follow()
+
+    def cog_unload(self):
+        for task in [self._runner, self._journaler, self._follower, *self._ticks]:
+            if task is not None:
+                task.cancel()
+        self.bot.loop.create_task(self.dispatcher.close())
+        self.bot.loop.create_task(self.actors.close())
+        self.feed.close()
+        if self.journal is not None:
+            self.bot.loop.create_task(self.journal.close())
+
+    def _lead(self, synced: typing.Optional[int] = None):
+        if self.bot.config.auction.journal is not None:
+            self.journal = Journal(
+                self.bot.config.auction.journal,
+                snapshot_every=self.bot.config.auction.journal_snapshot_every,
+            )
+            state, events = self.journal.load()
+
+            # If we've been following along, and we've already seen everything in
+            # the journal, then our auctioneer is already up to date, otherwise we
+            # need to rebuild it from the journal.
+            if synced != self.journal.seq:
+                self.auctioneer.restore(state, events)
+
+            self.auctioneer.journal = self.journal
+
+            # We don't have anything that happened while somebody else was in
+            # charge, so the feed has to start over from here.
+            self.feed.reset(self.journal.seq)
+
+            self.auctioneer.reconcile()
+            self._journaler = self.bot.loop.create_task(self._run_journal())
+
+        self._runner = self.bot.loop.create_task(self._run_auction())
+
+    def _follow(self):
+        # Without a journal, there's nothing for us to follow, and if we carried on
+        # anyways we'd take over with none of the leader's auctions or bids.
+        if self.bot.config.auction.journal is None:
+            raise RuntimeError("Cannot run as a standby without an auction journal")
+
+        self._follower = self.bot.loop.create_task(self._run_follower())
+
+    async def _run_follower(self):
+        loop = asyncio.get_running_loop()
+        standby = JournalFollower(self.bot.config.auction.journal)
+        synced = None
+
+        while True:
+            # Once we're in charge, we take one last look at the journal, so that we
+            # pick up anything the old leader wrote right before it stopped.
+            leading = self.bot.is_leader
+
+            try:
+                reset, state, events = await loop.run_in_executor(None, standby.poll)
+                if reset:
+                    self.auctioneer.restore(state, events)
+                else:
+                    self.auctioneer.replay(events)
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Error while following the auction journal")
+
+                # We don't know what state that left us in, so we'll start over.
+                standby = JournalFollower(self.bot.config.auction.journal)
+                synced = None
+            else:
+                synced = standby.seq
+
+            if leading:
+                break
+
+            await asyncio.sleep(self.bot.config.failover.poll_interval)
+
+        self._follower = None
+        self._lead(synced)
+
+    @Cog.listener(name="on_leadership_acquired")
+    async def _on_leadership_acquired(self):
+        # If we're following the journal, it will notice that we're in charge now,
+        # and take over once it has caught up.
+        if self._follower is None:
+            self._lead()
+
+    @Cog.listener(name="on_leadership_lost")
+    async def _on_leadership_lost(self):
+        for task in [self._runner, self._journaler, *self._ticks]:
+            if task is not None:
+                task.cancel()
+        self._runner = self._journaler = None
+        await self.actors.close()
+
+        # Anyone watching needs to go and find whoever is in charge now.
+        self.feed.close()
+
+        # Somebody else is writing to the journal now, so anything we haven't
+        # written yet has to be thrown away, but since nobody was told about any of
+        # it, it's as if it never happened.
+        if self.journal is not None:
+            self.auctioneer.journal = None
+            journal, self.journal = self.journal, None
+            await journal.close(flush=False)
+
+        self._follow()
+
+    def wakeup(self):
+        self._wakeup.set()
 
     @Cog.listener(name="on_ready")
     async def _on_ready(self):
         self.server = self.bot.get_guild(self.bot.config.discord.server_id)
+        self.roles.rebuild(self.server)
 
-    def get_role(self, role: typing.Union[Role, str, int]):
-        if role not in self._role_mappings:
-            lookup_role = role
-            if isinstance(role, Role):
-                lookup_role = getattr(self.bot.config.auction.roles, role.value)
+    @Cog.listener(name="on_guild_role_create")
+    async def _on_guild_role_create(self, role):
+        if role.guild == self.server:
+            self.roles.rebuild()
 
-            if isinstance(lookup_role, str):
-                for discord_role in self.server.roles:
-                    if discord_role.name == lookup_role:
-                        self._role_mappings[role] = discord_role
-                        break
-                else:
-                    self._role_mappings[role] = None
-            else:
-                self._role_mappings[role] = self.server.get_role(lookup_role)
+    @Cog.listener(name="on_guild_role_update")
+    async def _on_guild_role_update(self, before, after):
+        if after.guild == self.server:
+            self.roles.rebuild()
 
-        return self._role_mappings[role]
+    @Cog.listener(name="on_guild_role_delete")
+    async def _on_guild_role_delete(self, role):
+        if role.guild == self.server:
+            self.roles.rebuild()
 
-    async def add_auction_item(self, item, quantity, added_by):
+    def get_role(self, role: typing.Union[Role, str, int]):
+        return self.roles.resolve(role)
+
+    def bidder_rank(self, member) -> typing.Optional[BidderRank]:
+        mask = self.roles.mask(member)
+        if mask & self.roles.bit(Role.Recruit):
+            return BidderRank.Recruit
+        elif mask & self.roles.bit(Role.Raider):
+            return BidderRank.Raider
+        elif mask & self.roles.bit(Role.Member):
+            return BidderRank.Member
+        return None
+
+    async def add_auction_item(self, item, quantity, added_by, key=None) -> bool:
+        [added] = await self.add_auction_items(
+            [AuctionItem(item=item, quantity=quantity, added_by=added_by)], [key]
+        )
+        return added
+
+    async def add_auction_items(
+        self,
+        items: Iterable[AuctionItem],
+        keys: typing.Optional[Iterable[typing.Optional[str]]] = None,
+    ) -> list[bool]:
+        # Returns whether each item was added, or dropped as a duplicate.
         # TODO: Fetch Item data
         # TODO: Add ACL
-        self.auctioneer.add(
-            AuctionItem(item=item, quantity=quantity, added_by=added_by)
-        )
+        if keys is None:
+            keys = itertools.repeat(None)
+        added = [self.auctioneer.add(item, key=key) for item, key in zip(items, keys)]
+        await self._sync_journal()
+        self.wakeup()
+        return added
+
+    async def _sync_dkp(self):
+        # We ask for the changes since whatever snapshot we've already got, so the
+        # auctioneer only has to look again at auctions where something changed.
+        since = self.auctioneer.dkp_version
+        dkp, changes = await self.dkp.get_dkp_changes(since)
+        self.auctioneer.update_dkp(dkp, changes, since=since)
 
-    @tasks.loop(seconds=5)
     async def _run_auction(self):
+        await self.bot.wait_until_ready()
+
+        config = self.bot.config.auction
+        backoff = 0.0
+
+        while True:
+            # Clear this before doing anything, so that anything which changes while
+            # we're off sending messages will wake us right back up again.
+            self._wakeup.clear()
+
+            try:
+                await self._run_auction_once()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Error while running auctions")
+
+                # Whatever went wrong (say, the DKP couldn't be fetched) is likely to
+                # go wrong again, and if there are items waiting for a free channel
+                # the deadline is always right now, so without backing off we'd just
+                # spin. Nothing that wakes us up is going to fix it either, so this
+                # doesn't wait on that.
+                backoff = min(
+                    max(backoff * 2, config.error_backoff), config.error_backoff_max
+                )
+                await asyncio.sleep(backoff)
+                continue
+            else:
+                backoff = 0.0
+
+            # Sleep until the next time that the auctioneer has something to do, or
+            # until something happens that might have changed that.
+            deadline = self.auctioneer.next_deadline
+            if deadline is None:
+                timeout = None
+            else:
+                timeout = max(deadline - self.auctioneer.clock.now(), 0)
+
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _run_journal(self):
+        while True:
+            await asyncio.sleep(self.bot.config.auction.journal_flush_interval)
+
+            # Most events will already have been flushed by the time we get here,
+            # by whoever was waiting to tell someone about them, this just makes
+            # sure that nothing sits in the buffer for long.
+            try:
+                if self.journal.needs_snapshot:
+                    await self.journal.snapshot(self.auctioneer.dump)
+                else:
+                    await self.journal.flush()
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("Error while writing the auction journal")
+
+    async def _sync_journal(self):
+        # We don't want to tell anybody about something that we might forget about
+        # if we crashed right now, so this waits until everything that has happened
+        # so far is safely in the journal. Once it is, it can go out on the feed.
+        #
+        # Other things can happen while we're waiting, so we only publish as far as
+        # has actually made it to disk, and leave the rest for whoever syncs next.
+        if self.journal is not None:
+            await self.journal.sync()
+            self.auctioneer.publish(self.journal.durable)
+        else:
+            self.auctioneer.publish()
+
+    def _check_auctions_running(self):
+        # Lets anyone who cares (like the DKP refresh) know as soon as we go from
+        # having no auctions running to having some, rather than them having to
+        # notice it themselves.
+        running = self.auctioneer.has_running_auctions
+        if running and not self._auctions_running:
+            self.bot.dispatch("auctions_started")
+        self._auctions_running = running
+
+    async def _run_auction_once(self):
+        # An auction might have been started (or reopened) by a command since we
+        # last looked.
+        self._check_auctions_running()
+
         # Update our DKP to catch any changes
         if self.auctioneer.has_running_auctions:
-            self.auctioneer.update_dkp(await self.dkp.get_dkp())
+            await self._sync_dkp()
+
+        # Progress through any running auctions, each of which is handed off to its
+        # channel's actor, so that it happens in between whatever commands are
+        # already waiting on that channel, rather than in the middle of one. We don't
+        # wait on any of them, otherwise one busy channel would hold up every other
+        # channel's deadlines, and starting new auctions.
+        for channel in self.auctioneer.due():
+            task = self.bot.loop.create_task(self._tick(channel))
+            task.add_done_callback(functools.partial(self._tick_done, channel))
+            self._ticks.add(task)
+
+        # Then keep starting new auctions until we're not starting any more. This
+        # only ever touches channels that don't have an auction, so there's nothing
+        # in them for it to get in the middle of.
+        messages = list(self.auctioneer.next())
+        self._check_auctions_running()
+
+        await self._sync_journal()
+        for message in messages:
+            self.broadcast(message)
+
+    def _tick_done(self, channel: str, task: asyncio.Task):
+        self._ticks.discard(task)
+        if task.cancelled():
+            return
 
-        # Progress through any running auctions
-        for message in self.auctioneer.run():
-            channel = discord.utils.get(self.server.channels, name=message.channel)
-            await channel.send(**message.as_kwargs())
+        # A tick gives its channel a new deadline once it's done, but one that
+        # failed part way through might not have, and we don't want to forget about
+        # the channel entirely. It gets another go once we've backed off a little,
+        # rather than straight away, since it's likely to just fail again.
+        exc = task.exception()
+        if exc is not None:
+            logger.error(
+                "Error while running the auction in %s", channel, exc_info=exc
+            )
+            self.bot.loop.call_later(
+                self.bot.config.auction.error_backoff, self._rearm, channel
+            )
+            return
 
-        # Keep starting new auctions until we're not starting any more.
-        for message in self.auctioneer.next():
-            channel = discord.utils.get(self.server.channels, name=message.channel)
-            await channel.send(**message.as_kwargs())
+        # Otherwise the tick gave its channel a new deadline, which might be sooner
+        # than whatever we're currently waiting on.
+        self.wakeup()
 
-    @_run_auction.before_loop
-    async def _before_run_auction(self):
-        await self.bot.wait_until_ready()
+    def _rearm(self, channel: str):
+        if self._runner is not None:
+            self.auctioneer.rearm(channel)
+            self.wakeup()
+
+    async def _tick(self, channel: str):
+        messages = await self.actors.submit(
+            channel, functools.partial(_collect, self.auctioneer.tick(channel))
+        )
+
+        await self._sync_journal()
+        for message in messages:
+            self.broadcast(message)
+
+    def broadcast(self, message: AuctionMessage) -> None:
+        # Status messages are coalesced, so that a burst of bids only results in a
+        # single edit, rather than one per bid. They're coalesced per auction though,
+        # since the final status of an auction that just closed shouldn't get
+        # replaced by the first status of the one that took over its channel.
+        if message.status_for is not None:
+            self.dispatcher.submit_latest(
+                message.channel,
+                ("status", message.status_for),
+                functools.partial(self._write_status, message),
+                delay=self.bot.config.auction.status_interval,
+            )
+        else:
+            channel = self.get_channel(message.channel)
+            self.dispatcher.submit(
+                message.channel,
+                functools.partial(channel.send, **message.as_kwargs()),
+            )
+
+    async def _write_status(self, message: AuctionMessage):
+        # If we've already posted the status for this auction, then we just edit
+        # it, otherwise this is a new auction, and it gets a new status message.
+        existing = self._status_messages.get(message.channel)
+        if existing is not None and existing[0] == message.status_for:
+            try:
+                await existing[1].edit(**message.as_kwargs())
+                return
+            except discord.NotFound:
+                # Somebody deleted our status message, so we'll just post another.
+                pass
+
+        sent = await self.get_channel(message.channel).send(**message.as_kwargs())
+        self._status_messages[message.channel] = (message.status_for, sent)
+
+    async def _reply(self, ctx: SlashContext, messages: Iterable[AuctionMessage]):
+        # The command is run by the actor for the channel it came from, so that it
+        # doesn't interleave with anything else happening in that channel.
+        await self._respond(
+            ctx,
+            await self.actors.submit(
+                ctx.channel.name, functools.partial(_collect, messages)
+            ),
+        )
+
+    async def _respond(self, ctx: SlashContext, messages: list[AuctionMessage]):
+        # The command has already run to completion before we send anything, so that
+        # we only have to wait on the journal once. We do that outside of the
+        # channel's actor, so that a burst of commands can share a single fsync.
+        await self._sync_journal()
+
+        for message in messages:
+            if message.status_for is not None:
+                self.broadcast(message)
+            else:
+                await smart_send(
+                    ctx, self.dispatcher, hidden=message.hidden, **message.as_kwargs()
+                )
+
+        # Anything that goes through the auctioneer might have moved an auction's
+        # deadline, so we'll get the scheduler to take another look.
+        self.wakeup()
+
+    def get_channel(self, name: str):
+        channel = self._channels.get(name)
+        if channel is None:
+            channel = discord.utils.get(self.server.channels, name=name)
+            self._channels[name] = channel
+        return channel
+
+    @Cog.listener(name="on_guild_channel_create")
+    async def _on_guild_channel_create(self, channel):
+        self._channels.clear()
+
+    @Cog.listener(name="on_guild_channel_update")
+    async def _on_guild_channel_update(self, before, after):
+        self._channels.clear()
+
+    @Cog.listener(name="on_guild_channel_delete")
+    async def _on_guild_channel_delete(self, channel):
+        self._channels.clear()
 
     async def _do_bid(
-        self, ctx: SlashContext, bid: int, rank: BidderRank, id_: int = 0
+        self,
+        ctx: SlashContext,
+        bid: int,
+        rank: BidderRank,
+        id_: int = 0,
+        item: int = 1,
     ):
-        self.auctioneer.update_dkp(await self.dkp.get_dkp())
-
         # We need to get this person's ingame character name, if they haven't linked a
         # character, then they're not allowed to bid anything.
         character = await self.dkp.get_character(ctx.author.id)
@@ -726,11 +2331,135 @@ class Auction(Cog):
                     "account."
                 ),
             )
-        else:
-            for message in self.auctioneer.bid(
-                ctx.channel.name, character, bid, id_, rank
-            ):
-                await smart_send(ctx, hidden=message.hidden, **message.as_kwargs())
+            return
+
+        _, messages = await self._submit_bid(
+            ctx.channel.name, character, bid, id_, rank, item
+        )
+        await self._respond(ctx, messages)
+
+    async def _submit_bid(
+        self,
+        channel: str,
+        character: str,
+        bid: int,
+        id_: int,
+        rank: BidderRank,
+        item: int,
+    ) -> tuple[bool, list[AuctionMessage]]:
+        # Returns whether the bid was accepted, along with everything the auctioneer
+        # had to say about it.
+        async def place_bid():
+            # Refreshing the DKP happens inside the channel's actor, so the bid is
+            # validated against exactly the DKP we fetched for it, and nothing else
+            # can get in between the two.
+            await self._sync_dkp()
+
+            # A bid only ever changes the state of the auction if it was accepted.
+            version = self.auctioneer.version(channel)
+
+            # Items are numbered from 1 for people, but from 0 for the auctioneer.
+            messages = list(
+                self.auctioneer.bid(channel, character, bid, id_, rank, item - 1)
+            )
+            return self.auctioneer.version(channel) != version, messages
+
+        return await self.actors.submit(channel, place_bid)
+
+    async def _fetch_member(self, user: int) -> typing.Optional[discord.Member]:
+        # We don't get told about members (or their roles) changing, so we can't
+        # rely on discord.py's member cache, and have to ask discord for them. We
+        # hold onto what we get for a little while though, since someone who is
+        # bidding is likely to bid again.
+        now = self.auctioneer.clock.now()
+        cached = self._members.get(user)
+        if cached is not None and now - cached[0] < MEMBER_CACHE_TTL:
+            return cached[1]
+
+        try:
+            member = await self.server.fetch_member(user)
+        except discord.NotFound:
+            self._members.pop(user, None)
+            return None
+
+        # Drop anything that has gone stale, so this doesn't just grow forever.
+        for key, (fetched_at, _) in list(self._members.items()):
+            if now - fetched_at >= MEMBER_CACHE_TTL:
+                del self._members[key]
+        self._members[user] = (now, member)
+        return member
+
+    async def place_bid(
+        self,
+        channel: str,
+        character: str,
+        bid: int,
+        id_: int = 0,
+        item: int = 1,
+        *,
+        alt: bool = False,
+    ) -> tuple[bool, list[AuctionMessage]]:
+        # Places a bid for a character, rather than for a discord user, for bids that
+        # come from outside of discord (like a /tell in game). The character still
+        # has to be linked to someone who is allowed to bid, and their rank comes
+        # from their roles, the same as it would for /bid.
+        #
+        # Anything can come in over the wire, and every channel we submit to gets an
+        # actor of its own that sticks around, so we only accept bids for one of our
+        # auction channels.
+        if not self.auctioneer.is_auction_channel(channel):
+            return False, [
+                AuctionMessage(
+                    channel=channel,
+                    message="This isn't an auction channel. Try Again.",
+                    hidden=True,
+                )
+            ]
+
+        user = await self.dkp.get_user(character)
+        linked = member = None
+        if user is not None and self.server is not None:
+            linked = await self.dkp.get_character(user)
+            member = await self._fetch_member(user)
+        if linked is None or member is None:
+            return False, [
+                AuctionMessage(
+                    channel=channel,
+                    message=(
+                        f"Error: {character} is not linked to a discord account."
+                    ),
+                    hidden=True,
+                )
+            ]
+
+        rank = self.bidder_rank(member)
+        if rank is None:
+            return False, [
+                AuctionMessage(
+                    channel=channel,
+                    message="Couldn't determine your bidding rank, contact an officer.",
+                    hidden=True,
+                )
+            ]
+        if alt:
+            rank = BidderRank.Alt
+
+        accepted, messages = await self._submit_bid(
+            channel, linked, bid, id_, rank, item
+        )
+
+        # There's nobody to reply to, so anything that isn't just for the bidder gets
+        # posted to the channel instead, and the rest is handed back.
+        await self._sync_journal()
+        replies = []
+        for message in messages:
+            if message.hidden:
+                replies.append(message)
+            else:
+                self.broadcast(message)
+        self.wakeup()
+
+        return accepted, replies
 
     @cog_ext.cog_slash(
         name="bid",
@@ -748,26 +2477,27 @@ class Auction(Cog):
                 option_type=OptionType.INTEGER,
                 required=False,
             ),
+            create_option(
+                name="item",
+                description="the number of the item to bid on (default: 1)",
+                option_type=OptionType.INTEGER,
+                required=False,
+            ),
         ],
     )
     @check_roles(Role.Officer, Role.Raider, Role.Recruit, Role.Member)
-    async def _bid(self, ctx: SlashContext, bid: int, id_: int = 0):
+    async def _bid(self, ctx: SlashContext, bid: int, id_: int = 0, item: int = 1):
         await ctx.defer(hidden=True)
 
-        if self.get_role(Role.Recruit) in ctx.author.roles:
-            rank = BidderRank.Recruit
-        elif self.get_role(Role.Raider) in ctx.author.roles:
-            rank = BidderRank.Raider
-        elif self.get_role(Role.Member) in ctx.author.roles:
-            rank = BidderRank.Member
-        else:
+        rank = self.bidder_rank(ctx.author)
+        if rank is None:
             await ctx.send(
                 content="Couldn't determine your bidding rank, contact an officer.",
                 hidden=True,
             )
             return
 
-        await self._do_bid(ctx, bid, rank, id_)
+        await self._do_bid(ctx, bid, rank, id_, item)
 
     @cog_ext.cog_slash(
         name="bid-alt",
@@ -785,12 +2515,20 @@ class Auction(Cog):
                 option_type=OptionType.INTEGER,
                 required=False,
             ),
+            create_option(
+                name="item",
+                description="the number of the item to bid on (default: 1)",
+                option_type=OptionType.INTEGER,
+                required=False,
+            ),
         ],
     )
     @check_roles(Role.Officer, Role.Raider, Role.Recruit, Role.Member)
-    async def _bidalt(self, ctx: SlashContext, bid: int, id_: int = 0):
+    async def _bidalt(
+        self, ctx: SlashContext, bid: int, id_: int = 0, item: int = 1
+    ):
         await ctx.defer(hidden=True)
-        await self._do_bid(ctx, bid, BidderRank.Alt, id_)
+        await self._do_bid(ctx, bid, BidderRank.Alt, id_, item)
 
     @cog_ext.cog_subcommand(
         base="auction", name="stop", description="Stop a running auction"
@@ -799,8 +2537,7 @@ class Auction(Cog):
     async def _auction_stop(self, ctx: SlashContext):
         await ctx.defer(hidden=True)
 
-        for message in self.auctioneer.stop(ctx.channel.name):
-            await smart_send(ctx, hidden=message.hidden, **message.as_kwargs())
+        await self._reply(ctx, self.auctioneer.stop(ctx.channel.name))
 
     @cog_ext.cog_subcommand(
         base="auction",
@@ -820,8 +2557,9 @@ class Auction(Cog):
     async def _auction_accept(self, ctx: SlashContext, force: str = "no"):
         await ctx.defer(hidden=True)
 
-        for message in self.auctioneer.accept(ctx.channel.name, force=force == "yes"):
-            await smart_send(ctx, hidden=message.hidden, **message.as_kwargs())
+        await self._reply(
+            ctx, self.auctioneer.accept(ctx.channel.name, force=force == "yes")
+        )
 
     @cog_ext.cog_subcommand(
         base="auction",
@@ -832,8 +2570,7 @@ class Auction(Cog):
     async def _auction_reopen(self, ctx: SlashContext):
         await ctx.defer(hidden=True)
 
-        for message in self.auctioneer.reopen(ctx.channel.name):
-            await smart_send(ctx, hidden=message.hidden, **message.as_kwargs())
+        await self._reply(ctx, self.auctioneer.reopen(ctx.channel.name))
 
     @cog_ext.cog_subcommand(
         base="auction", name="delete", description="Delete an auction"
@@ -842,8 +2579,62 @@ class Auction(Cog):
     async def _auction_delete(self, ctx: SlashContext):
         await ctx.defer(hidden=True)
 
-        for message in self.auctioneer.delete(ctx.channel.name):
-            await smart_send(ctx, hidden=message.hidden, **message.as_kwargs())
+        await self._reply(ctx, self.auctioneer.delete(ctx.channel.name))
+
+    @cog_ext.cog_subcommand(
+        base="auction", name="queue", description="List the items waiting to auction"
+    )
+    @check_roles(Role.Officer)
+    async def _auction_queue(self, ctx: SlashContext):
+        await ctx.defer(hidden=True)
+
+        await self._reply(ctx, self.auctioneer.show_queue(ctx.channel.name))
+
+    @cog_ext.cog_subcommand(
+        base="auction",
+        name="priority",
+        description="Change the priority of a queued item, higher goes first",
+        options=[
+            create_option(
+                name="item",
+                description="the queued item",
+                option_type=OptionType.STRING,
+                required=True,
+            ),
+            create_option(
+                name="priority",
+                description="the new priority for the item (default: 0)",
+                option_type=OptionType.INTEGER,
+                required=True,
+            ),
+        ],
+    )
+    @check_roles(Role.Officer)
+    async def _auction_priority(self, ctx: SlashContext, item: str, priority: int):
+        await ctx.defer(hidden=True)
+
+        await self._reply(
+            ctx, self.auctioneer.prioritize(ctx.channel.name, item, priority)
+        )
+
+    @cog_ext.cog_subcommand(
+        base="auction",
+        name="bump",
+        description="Move a queued item to the front of the queue",
+        options=[
+            create_option(
+                name="item",
+                description="the queued item",
+                option_type=OptionType.STRING,
+                required=True,
+            ),
+        ],
+    )
+    @check_roles(Role.Officer)
+    async def _auction_bump(self, ctx: SlashContext, item: str):
+        await ctx.defer(hidden=True)
+
+        await self._reply(ctx, self.auctioneer.bump(ctx.channel.name, item))
 
     @cog_ext.cog_subcommand(
         base="auction",
@@ -856,5 +2647,4 @@ class Auction(Cog):
     async def _auction_restart(self, ctx: SlashContext):
         await ctx.defer(hidden=True)
 
-        for message in self.auctioneer.restart(ctx.channel.name):
-            await smart_send(ctx, hidden=message.hidden, **message.as_kwargs())
+        await self._reply(ctx, self.auctioneer.restart(ctx.channel.name))
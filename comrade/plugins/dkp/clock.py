@@ -0,0 +1,50 @@
+import abc
+import time
+
+
+class Clock(abc.ABC):
+    # The auction engine never looks at the time directly, it asks a clock. Times
+    # are plain floats, counted in seconds from some arbitrary point, and are only
+    # meaningful relative to other times from the same clock.
+
+    @abc.abstractmethod
+    def now(self) -> float:
+        ...
+
+    # The wall clock time, which is only used to line our times up with those from
+    # some other clock, like one from before the bot was restarted.
+    def wall(self) -> float:
+        return time.time()
+
+
+class MonotonicClock(Clock):
+    # Backed by the monotonic clock, so that the wall clock being stepped (say, by
+    # NTP) can't extend or cut short a running auction.
+
+    def now(self) -> float:
+        return time.monotonic()
+
+
+class VirtualClock(Clock):
+    # A clock that only moves when it's told to, which lets us drive the auction
+    # engine through as much simulated time as we want, as fast as we want.
+
+    def __init__(self, start: float = 0.0):
+        self._now = start
+
+    def now(self) -> float:
+        return self._now
+
+    def wall(self) -> float:
+        return self._now
+
+    def advance(self, seconds: float) -> float:
+        if seconds < 0:
+            raise ValueError("Cannot move a clock backwards")
+        self._now += seconds
+        return self._now
+
+    def advance_to(self, when: float) -> float:
+        if when > self._now:
+            self._now = when
+        return self._now
@@ -0,0 +1,140 @@
+import asyncio
+import enum
+import itertools
+import logging
+import typing
+
+from .actors import _cancelling
+
+
+logger = logging.getLogger(__name__)
+
+
+class Priority(enum.IntEnum):
+    def __repr__(self):
+        return "<%s.%s>" % (self.__class__.__name__, self.name)
+
+    # Lower values go first.
+    Interaction = 0
+    Broadcast = 1
+
+
+class Dispatcher:
+    # Sends outbound messages through a separate worker for each channel, so that
+    # messages within a channel still go out in the order they were sent, but a
+    # slow (or rate limited) channel doesn't hold up every other channel.
+    #
+    # Within a channel, replies to interactions jump ahead of any broadcasts that
+    # are still waiting to go out, since someone is actively waiting on those.
+
+    def __init__(self):
+        self._queues: dict[str, asyncio.PriorityQueue] = {}
+        self._workers: dict[str, asyncio.Task] = {}
+        self._latest: dict[tuple[str, typing.Hashable], typing.Callable] = {}
+        self._timers: dict[tuple[str, typing.Hashable], asyncio.TimerHandle] = {}
+        self._seq = itertools.count()
+        self._closing = False
+
+    def submit(
+        self,
+        channel: str,
+        send: typing.Callable[[], typing.Awaitable[typing.Any]],
+        *,
+        priority: Priority = Priority.Broadcast,
+    ) -> asyncio.Future:
+        queue = self._queues.get(channel)
+        if queue is None:
+            queue = self._queues[channel] = asyncio.PriorityQueue()
+            self._workers[channel] = asyncio.create_task(self._worker(channel, queue))
+
+        fut = asyncio.get_running_loop().create_future()
+
+        # Most callers never look at the result of a broadcast, and the worker
+        # already logs any failures, so we don't want an unretrieved exception
+        # warning for every one of them.
+        fut.add_done_callback(_consume)
+
+        queue.put_nowait((priority, next(self._seq), send, fut))
+        return fut
+
+    def submit_latest(
+        self,
+        channel: str,
+        key: typing.Hashable,
+        send: typing.Callable[[], typing.Awaitable[typing.Any]],
+        *,
+        delay: float,
+        priority: Priority = Priority.Broadcast,
+    ) -> None:
+        # Holds onto the send for up to delay seconds, and if another send with the
+        # same key comes in before then, it replaces this one. This lets a burst of
+        # changes to the same thing go out as a single message.
+        first = (channel, key) not in self._latest
+        self._latest[(channel, key)] = send
+        if first:
+            self._timers[(channel, key)] = asyncio.get_running_loop().call_later(
+                delay, self._flush_latest, channel, key, priority
+            )
+
+    def _flush_latest(self, channel: str, key: typing.Hashable, priority: Priority):
+        self._timers.pop((channel, key), None)
+        send = self._latest.pop((channel, key), None)
+        if send is not None:
+            self.submit(channel, send, priority=priority)
+
+    async def _worker(self, channel: str, queue: asyncio.PriorityQueue):
+        while True:
+            _, _, send, fut = await queue.get()
+            try:
+                if fut.cancelled():
+                    continue
+
+                try:
+                    result = await send()
+                except asyncio.CancelledError:
+                    fut.cancel()
+
+                    # Same as with our actors, a send being cancelled only means
+                    # that send is over, unless we're being cancelled ourselves.
+                    if self._closing or _cancelling():
+                        raise
+                except Exception as exc:
+                    logger.exception(f"Failed to send message to {channel}")
+                    fut.set_exception(exc)
+                else:
+                    fut.set_result(result)
+            finally:
+                queue.task_done()
+
+    async def join(self) -> None:
+        await asyncio.gather(*(queue.join() for queue in self._queues.values()))
+
+    async def close(self) -> None:
+        # Anything that is still being held onto is just dropped, otherwise it would
+        # go out once its timer fired, and start up a worker again after we've shut
+        # everything down.
+        for timer in self._timers.values():
+            timer.cancel()
+        self._timers.clear()
+        self._latest.clear()
+
+        self._closing = True
+        for worker in self._workers.values():
+            worker.cancel()
+        await asyncio.gather(*self._workers.values(), return_exceptions=True)
+        self._closing = False
+
+        # Anything that never got sent is cancelled, so that nobody is left waiting
+        # on it forever.
+        for queue in self._queues.values():
+            while not queue.empty():
+                _, _, _, fut = queue.get_nowait()
+                fut.cancel()
+
+        self._queues.clear()
+        self._workers.clear()
+
+
+def _consume(fut: asyncio.Future) -> None:
+    if not fut.cancelled():
+        fut.exception()
@@ -1,8 +1,11 @@
+import asyncio
 import datetime
+import logging
 import string
 import secrets
 import typing
 
+from discord.ext import tasks
 from discord.ext.commands import Cog
 from discord_slash import cog_ext, SlashContext
 from discord_slash.model import SlashCommandOptionType as OptionType
@@ -11,9 +14,11 @@ from sqlalchemy import Table, Column, Integer, String, DateTime, sql
 
 
 from comrade import db
-from comrade.plugins.dkp.provider import DKPProvider, CharacterDKP
+from comrade.plugins.dkp.provider import DKPProvider, DKPChange, DKPSnapshot
 
 
+logger = logging.getLogger(__name__)
+
 pending_claims = Table(
     "pending_claims",
     db.metadata,
@@ -47,28 +52,184 @@ linked_characters = Table(
 )
 
 
+class CharacterIndex:
+    # An in memory copy of the linked_characters table, indexed in both directions,
+    # so that figuring out who someone is doesn't require a trip to the database.
+    # This has to be kept up to date by anything that changes linked_characters.
+
+    def __init__(self):
+        self.loaded = False
+        self._by_user: dict[int, str] = {}
+        self._by_character: dict[str, int] = {}
+
+    def load(self, links: typing.Iterable[tuple[int, str]]) -> None:
+        self._by_user.clear()
+        self._by_character.clear()
+        for discord_user, character in links:
+            self._by_user[discord_user] = character
+            self._by_character[character] = discord_user
+        self.loaded = True
+
+    def link(self, discord_user: int, character: str) -> None:
+        # A discord user can only have one character, and a character can only
+        # belong to one discord user, so we need to clear out any existing links
+        # on either side first.
+        self.unlink_character(character)
+        self.unlink_user(discord_user)
+
+        self._by_user[discord_user] = character
+        self._by_character[character] = discord_user
+
+    def unlink_character(self, character: str) -> None:
+        discord_user = self._by_character.pop(character, None)
+        if discord_user is not None:
+            self._by_user.pop(discord_user, None)
+
+    def unlink_user(self, discord_user: int) -> None:
+        character = self._by_user.pop(discord_user, None)
+        if character is not None:
+            self._by_character.pop(character, None)
+
+    def character(self, discord_user: int) -> typing.Optional[str]:
+        return self._by_user.get(discord_user)
+
+    def user(self, character: str) -> typing.Optional[int]:
+        return self._by_character.get(character.lower())
+
+
 class DKP(Cog):
     def __init__(self, bot):
         self.bot = bot
         self.provider = DKPProvider(self.bot.config.dkp)
+        self.characters = CharacterIndex()
+        self._characters_lock = asyncio.Lock()
+        self._refresh_dkp.change_interval(
+            seconds=self.bot.config.dkp.refresh_interval_idle
+        )
 
-    async def get_dkp(self) -> typing.Mapping[str, CharacterDKP]:
-        return await self.provider.list_dkp()
+        # Only whoever is in charge keeps polling EQDKP, a standby would just be
+        # doubling the load on it for a snapshot that nothing is bidding against.
+        if self.bot.is_leader:
+            self._refresh_dkp.start()
 
-    async def get_character(self, user_id: int) -> typing.Optional[str]:
-        async with self.bot.db.begin() as tx:
-            linked = (
-                await tx.execute(
-                    sql.select(linked_characters).where(
-                        linked_characters.c.discord_user == user_id
+    def cog_unload(self):
+        self._refresh_dkp.cancel()
+        self.bot.loop.create_task(self.provider.close())
+
+    @property
+    def refresh_interval(self) -> float:
+        # While there are auctions running, people are going to be bidding and we
+        # want their DKP to be as accurate as possible, otherwise we can take it
+        # easy on EQDKP.
+        auction = self.bot.get_cog("Auction")
+        if auction is not None and auction.auctioneer.has_running_auctions:
+            return self.bot.config.dkp.refresh_interval_active
+        return self.bot.config.dkp.refresh_interval_idle
+
+    @tasks.loop()
+    async def _refresh_dkp(self):
+        try:
+            await self.provider.refresh()
+        except Exception:
+            # We don't want a single failure talking to EQDKP to kill our refresh
+            # loop, we'll just keep serving the last snapshot and try again later.
+            logger.exception("Failed to refresh DKP")
+
+        self._refresh_dkp.change_interval(seconds=self.refresh_interval)
+
+    @_refresh_dkp.before_loop
+    async def _before_refresh_dkp(self):
+        await self.bot.wait_until_ready()
+
+    async def get_dkp(
+        self, *, max_age: typing.Optional[float] = None
+    ) -> DKPSnapshot:
+        # Our background refresh keeps a snapshot in memory, so normally we just
+        # answer from that. We only go out to EQDKP ourselves when we don't have a
+        # snapshot yet, or it's older than we're willing to accept.
+        #
+        # Without the background refresh (say, on a standby) there's nothing keeping
+        # our snapshot fresh, so we leave it up to the provider, which will fetch on
+        # demand, at most once every cache_ttl.
+        if not self._refresh_dkp.is_running():
+            return await self.provider.list_dkp(max_age=max_age)
+
+        if max_age is None:
+            max_age = self.bot.config.dkp.max_staleness
+
+        snapshot = self.provider.snapshot
+        if snapshot is not None and (
+            max_age is None or (self.provider.age or 0) <= max_age
+        ):
+            return snapshot
+
+        return await self.provider.list_dkp(max_age=max_age)
+
+    async def get_dkp_changes(
+        self, since: int, *, max_age: typing.Optional[float] = None
+    ) -> tuple[DKPSnapshot, typing.Optional[list[DKPChange]]]:
+        # Make sure our snapshot is fresh enough, and then return it along with
+        # everything that changed between the given version and it, or None if the
+        # caller needs to start over from the full snapshot.
+        snapshot = await self.get_dkp(max_age=max_age)
+        return snapshot, self.provider.changes_since(since, snapshot.version)
+
+    @Cog.listener(name="on_ready")
+    async def _on_ready(self):
+        try:
+            await self.load_characters()
+        except Exception:
+            # This can fail if our tables haven't been created yet, in which case
+            # we'll just try again the first time someone needs a character.
+            logger.exception("Failed to load linked characters")
+
+    @Cog.listener(name="on_leadership_acquired")
+    async def _on_leadership_acquired(self):
+        if not self._refresh_dkp.is_running():
+            self._refresh_dkp.start()
+
+        # Whoever was in charge before us might have linked characters that we
+        # haven't seen, so we need to start over from the database.
+        try:
+            await self.load_characters(reload=True)
+        except Exception:
+            logger.exception("Failed to reload linked characters")
+
+    @Cog.listener(name="on_leadership_lost")
+    async def _on_leadership_lost(self):
+        self._refresh_dkp.cancel()
+
+    @Cog.listener(name="on_auctions_started")
+    async def _on_auctions_started(self):
+        # People are about to start bidding, so rather than waiting out whatever is
+        # left of our idle interval, we refresh right away, which also puts us onto
+        # the active interval.
+        self._refresh_dkp.restart()
+
+    async def load_characters(self, *, reload: bool = False) -> None:
+        async with self._characters_lock:
+            if self.characters.loaded and not reload:
+                return
+
+            async with self.bot.db.connect() as conn:
+                result = await conn.execute(
+                    sql.select(
+                        linked_characters.c.discord_user, linked_characters.c.character
                     )
                 )
-            ).first()
+                self.characters.load(result.all())
+
+    async def get_character(self, user_id: int) -> typing.Optional[str]:
+        if not self.characters.loaded:
+            await self.load_characters()
+
+        return self.characters.character(user_id)
 
-        if linked is None:
-            return None
+    async def get_user(self, character: str) -> typing.Optional[int]:
+        if not self.characters.loaded:
+            await self.load_characters()
 
-        return linked._mapping["character"]
+        return self.characters.user(character)
 
     @cog_ext.cog_subcommand(
         base="dkp",
@@ -104,7 +265,7 @@ class DKP(Cog):
             return
 
         # We have a character name now, so we'll look up their DKP using our DKP Provider.
-        dkp = await self.provider.current_dkp(character)
+        dkp = (await self.get_dkp()).get(character.lower())
         if dkp is None:
             # If we weren't able to locate a character in the DKP system, then that's also
             # an error we need to bail out with.
@@ -0,0 +1,165 @@
+import asyncio
+import collections
+import typing
+
+import attr
+
+
+@attr.s(slots=True, frozen=True, auto_attribs=True)
+class FeedEvent:
+
+    seq: int
+    event: str
+    channel: str
+    auction_id: int
+    data: dict
+
+
+class FeedGap(Exception):
+    pass
+
+
+class FeedClosed(Exception):
+    pass
+
+
+class SubscriberDropped(Exception):
+    def __init__(self, seq: int):
+        super().__init__(f"Fell too far behind, resume from {seq}")
+        self.seq = seq
+
+
+class Subscription:
+    # A single subscriber's view of the feed, with its own bounded buffer. If the
+    # subscriber can't keep up, and its buffer fills, it gets dropped rather than
+    # holding anything up, and once it has read whatever it had buffered, it gets
+    # told where to resume from.
+
+    def __init__(
+        self, feed: "AuctionFeed", size: int, seq: int, backlog: list[FeedEvent]
+    ):
+        self._feed = feed
+        self._events = collections.deque(backlog)
+        self._ready = asyncio.Event()
+        self._seq = seq
+
+        # Anything we're replaying doesn't count against the buffer, otherwise
+        # resuming after being dropped would just get us dropped again.
+        self._size = size + len(backlog)
+
+        self.dropped = False
+        self.closed = False
+        self.feed_closed = False
+
+    def _push(self, event: FeedEvent) -> None:
+        if len(self._events) >= self._size:
+            self.dropped = True
+            self.close()
+            return
+
+        self._events.append(event)
+        self._ready.set()
+
+    def close(self) -> None:
+        self._feed._subscribers.discard(self)
+        self.closed = True
+        self._ready.set()
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self) -> FeedEvent:
+        while not self._events:
+            if self.dropped:
+                raise SubscriberDropped(self._seq)
+            if self.feed_closed:
+                raise FeedClosed("The feed has closed")
+            if self.closed:
+                raise StopAsyncIteration
+            self._ready.clear()
+            await self._ready.wait()
+
+        event = self._events.popleft()
+        self._seq = event.seq
+        return event
+
+
+class AuctionFeed:
+    # Fans out everything that happens to our auctions to anyone who is watching,
+    # without ever waiting on any of them. Every event carries its sequence number
+    # from the journal, and we hold onto the most recent ones, so a subscriber that
+    # was dropped (or just disconnected, or is now talking to a different leader)
+    # can pick up where it left off.
+    #
+    # Not everything in the journal goes out on the feed, so there can be gaps in
+    # the sequence numbers, which is why we keep track of how far back we can go
+    # separately from the events themselves.
+
+    def __init__(self, *, history: int = 1000, buffer: int = 100):
+        self.buffer = buffer
+        self._seq = 0
+        self._floor = 0
+        self._history: collections.deque[FeedEvent] = collections.deque(
+            maxlen=history
+        )
+        self._subscribers: set[Subscription] = set()
+
+    @property
+    def seq(self) -> int:
+        return self._seq
+
+    def reset(self, seq: int) -> None:
+        # Starts the feed over from the given sequence number, forgetting everything
+        # before it, for when we've missed out on some events (say, because someone
+        # else was in charge).
+        self._history.clear()
+        self._seq = self._floor = seq
+
+    def publish(
+        self, seq: int, event: str, channel: str, auction_id: int, data: dict
+    ) -> None:
+        # Once our history is full, we're about to forget the oldest event, so
+        # nobody can resume from before it anymore.
+        if len(self._history) == self._history.maxlen:
+            self._floor = self._history[0].seq if self._history else seq
+
+        self._seq = seq
+        feed_event = FeedEvent(
+            seq=seq,
+            event=event,
+            channel=channel,
+            auction_id=auction_id,
+            data=data,
+        )
+        self._history.append(feed_event)
+
+        for subscriber in list(self._subscribers):
+            subscriber._push(feed_event)
+
+    def subscribe(self, since: typing.Optional[int] = None) -> Subscription:
+        # Subscribes to everything after the given sequence number, or to just the
+        # new events if there isn't one. If we no longer have everything since then
+        # (or never did, because it came from before we started), there's no way
+        # to pick up from there, and the subscriber has to start over.
+        backlog = []
+        if since is None:
+            since = self._seq
+        else:
+            if since > self._seq or since < self._floor:
+                raise FeedGap(
+                    f"Cannot resume from {since}, only {self._floor} to {self._seq} "
+                    "are available"
+                )
+            backlog = [event for event in self._history if event.seq > since]
+
+        subscriber = Subscription(self, self.buffer, since, backlog)
+        self._subscribers.add(subscriber)
+        return subscriber
+
+    def close(self) -> None:
+        # Unlike a subscriber going away on its own, everyone who is still watching
+        # gets told that the feed itself is gone (say, because we're no longer in
+        # charge), so they know to go and find it somewhere else.
+        for subscriber in list(self._subscribers):
+            subscriber.feed_closed = True
+            subscriber.close()
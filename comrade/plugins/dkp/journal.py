@@ -0,0 +1,270 @@
+import asyncio
+import json
+import logging
+import os
+import typing
+
+
+logger = logging.getLogger(__name__)
+
+
+def _read_snapshot(path: str) -> tuple[typing.Any, int]:
+    try:
+        with open(path, "rb") as fp:
+            snapshot = json.load(fp)
+    except FileNotFoundError:
+        return None, 0
+    return snapshot["state"], snapshot["seq"]
+
+
+def _read_log(path: str, offset: int = 0) -> bytes:
+    try:
+        with open(path, "rb") as fp:
+            fp.seek(offset)
+            return fp.read()
+    except FileNotFoundError:
+        return b""
+
+
+def _parse_log(data: bytes, seq: int) -> tuple[list[tuple[str, dict]], int, int]:
+    # Returns every event in the log after the given sequence number, along with
+    # the sequence number of the last one, and how much of the log we've read.
+    events = []
+    offset = 0
+    while offset < len(data):
+        # If we crashed part way through writing out a batch, then the last record
+        # might be incomplete, in which case we just stop there, since it was never
+        # synced, nobody can have been told that it happened.
+        end = data.find(b"\n", offset)
+        if end == -1:
+            break
+        try:
+            record = json.loads(data[offset:end])
+        except ValueError:
+            break
+        offset = end + 1
+
+        # The log might still have events in it that were already included in the
+        # snapshot, if we crashed between writing the snapshot and truncating the
+        # log.
+        if record["seq"] <= seq:
+            continue
+
+        events.append((record["event"], record["data"]))
+        seq = record["seq"]
+
+    return events, seq, offset
+
+
+class Journal:
+    # An append-only log of everything that happens to our auctions, so that if the
+    # bot gets restarted in the middle of a raid, it can pick up exactly where it
+    # left off, rather than losing every bid and queued item.
+    #
+    # Events are buffered in memory as they come in, and written out (and fsynced)
+    # in batches, so that a burst of bids only costs us a single fsync. Anything
+    # that needs to know an event is actually on disk (like telling someone their
+    # bid was accepted) can wait on sync().
+    #
+    # Every so often the entire state gets written out as a snapshot, and the log
+    # gets truncated, so that recovering only has to replay whatever happened since
+    # the last snapshot.
+
+    def __init__(self, path: str, *, snapshot_every: int = 1000):
+        self.path = path
+        self.snapshot_path = f"{path}.snapshot"
+        self.snapshot_every = snapshot_every
+
+        self._fp: typing.Optional[typing.BinaryIO] = None
+        self._buffer: list[bytes] = []
+        self._seq = 0
+        self._durable = 0
+        self._since_snapshot = 0
+        self._lock = asyncio.Lock()
+
+    @property
+    def needs_snapshot(self) -> bool:
+        return self._since_snapshot >= self.snapshot_every
+
+    @property
+    def seq(self) -> int:
+        return self._seq
+
+    @property
+    def durable(self) -> int:
+        return self._durable
+
+    def load(self) -> tuple[typing.Any, list[tuple[str, dict]]]:
+        # Returns the most recent snapshot (or None if we've never taken one), and
+        # every event that has been logged since that snapshot was taken.
+        state, seq = _read_snapshot(self.snapshot_path)
+        data = _read_log(self.path)
+        events, seq, offset = _parse_log(data, seq)
+
+        self._fp = open(self.path, "ab")
+        if offset < len(data):
+            logger.warning(
+                "Discarding %d bytes of incomplete journal entries from %s",
+                len(data) - offset,
+                self.path,
+            )
+            os.ftruncate(self._fp.fileno(), offset)
+
+        self._seq = self._durable = seq
+        self._since_snapshot = len(events)
+
+        return state, events
+
+    def append(self, event: str, data: dict) -> None:
+        self._seq += 1
+        self._since_snapshot += 1
+        self._buffer.append(
+            json.dumps(
+                {"seq": self._seq, "event": event, "data": data},
+                separators=(",", ":"),
+            ).encode("utf8")
+            + b"\n"
+        )
+
+    async def flush(self) -> None:
+        async with self._lock:
+            if not self._buffer:
+                return
+            if self._fp is None:
+                raise RuntimeError("Cannot write to a closed journal")
+
+            buffer, self._buffer = self._buffer, []
+            seq = self._seq
+
+            await asyncio.get_running_loop().run_in_executor(
+                None, self._write, buffer
+            )
+            self._durable = seq
+
+    async def sync(self) -> None:
+        # Waits until everything that has been appended so far is on disk. If a
+        # flush is already in progress, then we'll wait for it, and only flush
+        # ourselves if it didn't include everything that we're waiting on.
+        if self._durable < self._seq:
+            await self.flush()
+
+    async def snapshot(self, dump: typing.Callable[[], typing.Any]) -> None:
+        async with self._lock:
+            # We have to grab the state once we're holding the lock, and without
+            # yielding to anything else, otherwise it might not match up with the
+            # events that we've logged so far.
+            state = dump()
+            seq = self._seq
+            self._buffer = []
+            self._since_snapshot = 0
+
+            await asyncio.get_running_loop().run_in_executor(
+                None, self._write_snapshot, seq, state
+            )
+            self._durable = seq
+
+    async def close(self, *, flush: bool = True) -> None:
+        if flush:
+            await self.flush()
+        async with self._lock:
+            if self._fp is not None:
+                self._fp.close()
+                self._fp = None
+
+    def _write(self, buffer: list[bytes]) -> None:
+        self._fp.write(b"".join(buffer))
+        self._fp.flush()
+        os.fsync(self._fp.fileno())
+
+    def _write_snapshot(self, seq: int, state: typing.Any) -> None:
+        # The snapshot gets written to a temporary file, then moved into place, so
+        # that we always have a complete snapshot on disk, even if we crash half way
+        # through writing a new one.
+        data = json.dumps({"seq": seq, "state": state}, separators=(",", ":"))
+        tmp_path = f"{self.snapshot_path}.tmp"
+        with open(tmp_path, "wb") as fp:
+            fp.write(data.encode("utf8"))
+            fp.flush()
+            os.fsync(fp.fileno())
+        os.replace(tmp_path, self.snapshot_path)
+
+        # The rename has to make it to disk too, or we might come back up with the
+        # old snapshot, and a log that has already been truncated.
+        dirfd = os.open(
+            os.path.dirname(os.path.abspath(self.snapshot_path)), os.O_RDONLY
+        )
+        try:
+            os.fsync(dirfd)
+        finally:
+            os.close(dirfd)
+
+        # Everything that was in the log (and everything that we were still holding
+        # onto in our buffer) is covered by the snapshot now, so we can start over.
+        os.ftruncate(self._fp.fileno(), 0)
+        os.fsync(self._fp.fileno())
+
+
+class JournalFollower:
+    # Follows along with a journal that some other process is writing to, handing
+    # back whatever has been added to it since the last time we looked.
+    #
+    # The writer can replace the snapshot and truncate the log at any point, so we
+    # keep an eye on the snapshot, and if it changes, or if what we read from the
+    # log doesn't follow on from what we've already seen, we just start over from
+    # the new snapshot.
+
+    def __init__(self, path: str):
+        self.path = path
+        self.snapshot_path = f"{path}.snapshot"
+
+        self._snapshot_id: typing.Optional[tuple[int, int]] = None
+        self._offset = 0
+        self._seq = 0
+        self._loaded = False
+
+    @property
+    def seq(self) -> int:
+        return self._seq
+
+    def _stat_snapshot(self) -> typing.Optional[tuple[int, int]]:
+        try:
+            stat = os.stat(self.snapshot_path)
+        except FileNotFoundError:
+            return None
+        return stat.st_ino, stat.st_mtime_ns
+
+    def poll(self) -> tuple[bool, typing.Any, list[tuple[str, dict]]]:
+        # Returns (reset, state, events). When reset is True, then anything that
+        # had been built from this journal has to be thrown away, and rebuilt from
+        # state and events, otherwise events just need to be applied on top of it.
+        snapshot_id = self._stat_snapshot()
+        if self._loaded and snapshot_id == self._snapshot_id:
+            data = _read_log(self.path, self._offset)
+            events, seq, offset = _parse_log(data, self._seq)
+
+            # If the snapshot changed while we were reading the log, then the log
+            # might have been truncated and written over, so what we read can't be
+            # trusted.
+            if self._stat_snapshot() == snapshot_id and (
+                not events or seq - len(events) == self._seq
+            ):
+                self._offset += offset
+                self._seq = seq
+                return False, None, events
+
+        while True:
+            snapshot_id = self._stat_snapshot()
+            state, seq = _read_snapshot(self.snapshot_path)
+            data = _read_log(self.path)
+            events, last_seq, offset = _parse_log(data, seq)
+
+            # Same as above, if the snapshot has changed underneath us, then we
+            # raced with the writer taking a new snapshot, and need to try again.
+            if self._stat_snapshot() != snapshot_id:
+                continue
+
+            self._snapshot_id = snapshot_id
+            self._offset = offset
+            self._seq = last_seq
+            self._loaded = True
+            return True, state, events
@@ -1,6 +1,15 @@
+import array
+import asyncio
+import codecs
+import collections
+import hashlib
+import json
+import time
 import urllib.parse
 import typing
 
+from collections.abc import Iterable, Iterator, Mapping
+
 import aiohttp
 import attr
 
@@ -20,12 +29,443 @@ class CharacterDKP:
     adjustments: int = 0
 
 
+@attr.s(slots=True, frozen=True, auto_attribs=True)
+class DKPChange:
+
+    name: str
+    before: typing.Optional[CharacterDKP] = None
+    after: typing.Optional[CharacterDKP] = None
+
+
+class DKPSnapshot(Mapping):
+    # An immutable snapshot of everyone's DKP, stored as a name -> row table, with
+    # each of the numbers stored in its own column. This is a lot smaller than a
+    # dict full of CharacterDKP objects, makes whole roster operations cheap, and
+    # since it never changes once it has been built, it can be handed around and
+    # swapped by reference rather than being copied.
+
+    __slots__ = (
+        "version",
+        "_index",
+        "_names",
+        "_current",
+        "_earned",
+        "_spent",
+        "_adjustments",
+        "_ranked",
+        "_sorted",
+    )
+
+    _typecode = "q"
+
+    def __init__(self, characters: Iterable[CharacterDKP] = (), *, version: int = 0):
+        self.version = version
+        self._index: dict[str, int] = {}
+        self._names: list[str] = []
+        self._current = array.array(self._typecode)
+        self._earned = array.array(self._typecode)
+        self._spent = array.array(self._typecode)
+        self._adjustments = array.array(self._typecode)
+        self._ranked: typing.Optional[tuple[str, ...]] = None
+        self._sorted: typing.Optional[tuple[str, ...]] = None
+
+        for dkp in characters:
+            self._add(dkp)
+
+    def _add(self, dkp: CharacterDKP) -> None:
+        # This should only ever be called while a snapshot is being built, before
+        # it has been handed out to anyone.
+        row = self._index.get(dkp.name)
+        if row is None:
+            self._index[dkp.name] = len(self._names)
+            self._names.append(dkp.name)
+            self._current.append(dkp.current)
+            self._earned.append(dkp.earned)
+            self._spent.append(dkp.spent)
+            self._adjustments.append(dkp.adjustments)
+        else:
+            self._current[row] = dkp.current
+            self._earned[row] = dkp.earned
+            self._spent[row] = dkp.spent
+            self._adjustments[row] = dkp.adjustments
+
+    def __getitem__(self, name: str) -> CharacterDKP:
+        return self._character(self._index[name])
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._names)
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def __contains__(self, name: object) -> bool:
+        return name in self._index
+
+    def __repr__(self) -> str:
+        return f"<{self.__class__.__name__} version={self.version} size={len(self)}>"
+
+    def _character(self, row: int) -> CharacterDKP:
+        return CharacterDKP(
+            name=self._names[row],
+            current=self._current[row],
+            earned=self._earned[row],
+            spent=self._spent[row],
+            adjustments=self._adjustments[row],
+        )
+
+    def row(self, name: str) -> typing.Optional[tuple[int, int, int, int]]:
+        index = self._index.get(name)
+        if index is None:
+            return None
+        return (
+            self._current[index],
+            self._earned[index],
+            self._spent[index],
+            self._adjustments[index],
+        )
+
+    def current(self, name: str, default: int = 0) -> int:
+        # This is the hot path for bidding, so we avoid building a CharacterDKP just
+        # to read a single number out of it.
+        index = self._index.get(name)
+        if index is None:
+            return default
+        return self._current[index]
+
+    def total(self) -> int:
+        return sum(self._current)
+
+    def ranked(self) -> tuple[str, ...]:
+        # Snapshots never change once they've been built, so we only ever have to
+        # sort them once.
+        if self._ranked is None:
+            rows = sorted(
+                range(len(self._current)), key=self._current.__getitem__, reverse=True
+            )
+            self._ranked = tuple(self._names[row] for row in rows)
+        return self._ranked
+
+    def sorted(self) -> tuple[str, ...]:
+        # Everyone's name in alphabetical order, which gives us a stable order to
+        # page through the snapshot in.
+        if self._sorted is None:
+            self._sorted = tuple(sorted(self._names))
+        return self._sorted
+
+
+def diff_dkp(before: DKPSnapshot, after: DKPSnapshot) -> list[DKPChange]:
+    # We compare the raw rows, so that we only pay for building CharacterDKP objects
+    # for the (usually very few) characters that have actually changed.
+    changes = [
+        DKPChange(
+            name=name,
+            before=before[name] if name in before else None,
+            after=after[name],
+        )
+        for name in after
+        if before.row(name) != after.row(name)
+    ]
+    changes.extend(
+        DKPChange(name=name, before=before[name])
+        for name in before
+        if name not in after
+    )
+    return changes
+
+
+class PointsDecoder:
+    # The EQDKP points payload is a single JSON object that contains a bunch of
+    # things we don't care about, plus a "players" object with an entry for every
+    # character that has ever existed, each of which has their points in every pool.
+    #
+    # Rather than parsing the whole thing into one giant nested dict, and then
+    # throwing most of it away, this decodes the payload incrementally as chunks of
+    # it arrive, only ever holding a single player in memory, and turning that
+    # player directly into a CharacterDKP (or dropping them).
+
+    _whitespace = " \t\n\r"
+    _delimiters = _whitespace + ",:}]"
+
+    def __init__(self, pool_id: int):
+        self.pool_name = f"multidkp_points:{pool_id}"
+
+        self._decoder = codecs.getincrementaldecoder("utf-8")()
+        self._json = json.JSONDecoder()
+        self._buf = ""
+        self._pos = 0
+        self._eof = False
+        self._state = self._start
+
+    def feed(self, data: bytes) -> Iterable[CharacterDKP]:
+        self._buf = self._buf[self._pos :] + self._decoder.decode(data)
+        self._pos = 0
+        return self._run()
+
+    def close(self) -> Iterable[CharacterDKP]:
+        self._buf = self._buf[self._pos :] + self._decoder.decode(b"", final=True)
+        self._pos = 0
+        self._eof = True
+        yield from self._run()
+
+        if self._state != self._done:
+            raise ValueError("Incomplete EQDKP points payload")
+
+    def _run(self) -> Iterable[CharacterDKP]:
+        # Each state consumes as much of the buffer as it can, and returns either
+        # the next state, or None if it needs more data to make progress.
+        while self._state != self._done:
+            result = self._state()
+            if result is None:
+                return
+            self._state, player = result
+            if player is not None:
+                yield player
+
+    def _skip(self) -> typing.Optional[str]:
+        while self._pos < len(self._buf) and self._buf[self._pos] in self._whitespace:
+            self._pos += 1
+        if self._pos < len(self._buf):
+            return self._buf[self._pos]
+        return None
+
+    def _expect(self, char: str) -> bool:
+        found = self._skip()
+        if found is None:
+            return False
+        if found != char:
+            raise ValueError(f"Expected {char!r} in EQDKP payload, found {found!r}")
+        self._pos += 1
+        return True
+
+    def _value(self) -> tuple[bool, typing.Any]:
+        if self._skip() is None:
+            return False, None
+
+        try:
+            value, end = self._json.raw_decode(self._buf, self._pos)
+        except json.JSONDecodeError:
+            # We can't tell the difference between a value that is invalid, and
+            # one that we just haven't received all of yet, so until we've hit the
+            # end of the payload, we'll assume we just need more data.
+            if self._eof:
+                raise
+            return False, None
+
+        # A number that runs right up to the end of the buffer might just have been
+        # cut in half (or cut off right before its fraction or exponent), so unless
+        # we can see the delimiter that comes after it, we need more data.
+        if not self._eof and (
+            end == len(self._buf) or self._buf[end] not in self._delimiters
+        ):
+            return False, None
+
+        self._pos = end
+        return True, value
+
+    def _key(self, close: str) -> typing.Optional[tuple[bool, typing.Optional[str]]]:
+        # Reads the next key in an object, returning (True, None) when the object
+        # has been closed instead, and None if we need more data.
+        start = self._pos
+        found = self._skip()
+        if found is None:
+            return None
+        if found == close:
+            self._pos += 1
+            return True, None
+        if found == ",":
+            self._pos += 1
+
+        ok, key = self._value()
+        if not ok or not self._expect(":"):
+            self._pos = start
+            return None
+        return False, key
+
+    def _start(self):
+        if not self._expect("{"):
+            return None
+        return self._top_level, None
+
+    def _top_level(self):
+        start = self._pos
+        result = self._key("}")
+        if result is None:
+            return None
+
+        closed, key = result
+        if closed:
+            return self._done, None
+        if key == "players":
+            return self._players_start, None
+
+        # Anything that isn't our list of players, we just skip over.
+        ok, _ = self._value()
+        if not ok:
+            self._pos = start
+            return None
+        return self._top_level, None
+
+    def _players_start(self):
+        found = self._skip()
+        if found is None:
+            return None
+
+        # PHP encodes an empty associative array as an empty list, so a guild with
+        # no players at all will give us [] instead of {}.
+        if found != "{":
+            ok, _ = self._value()
+            if not ok:
+                return None
+            return self._top_level, None
+
+        self._pos += 1
+        return self._players, None
+
+    def _players(self):
+        start = self._pos
+        result = self._key("}")
+        if result is None:
+            return None
+
+        closed, _ = result
+        if closed:
+            return self._top_level, None
+
+        ok, player = self._value()
+        if not ok:
+            self._pos = start
+            return None
+        return self._players, self._decode_player(player)
+
+    def _done(self):
+        return None
+
+    def _decode_player(self, p: dict) -> typing.Optional[CharacterDKP]:
+        if p["active"] != "1" or p["hidden"]:
+            return None
+
+        points = p["points"][self.pool_name]
+        return CharacterDKP(
+            name=p["name"].lower(),
+            current=int(points["points_current"]),
+            earned=int(points["points_earned"]),
+            spent=int(points["points_spent"]),
+            adjustments=int(points["points_adjustment"]),
+        )
+
+
 class DKPProvider:
     def __init__(self, config: DKPConfig):
         self.config = config
         self.db = create_async_engine(self.config.database, echo=True)
 
-    async def list_dkp(self) -> typing.Mapping[str, CharacterDKP]:
+        self._session: typing.Optional[aiohttp.ClientSession] = None
+        self._snapshot: typing.Optional[DKPSnapshot] = None
+        self._fetched_at: typing.Optional[float] = None
+        self._inflight: typing.Optional[asyncio.Future] = None
+
+        # These are used to make conditional requests to EQDKP, so that a roster
+        # which hasn't changed since our last refresh doesn't have to be parsed again.
+        self._etag: typing.Optional[str] = None
+        self._last_modified: typing.Optional[str] = None
+        self._digest: typing.Optional[bytes] = None
+
+        # Every time the roster actually changes, we bump our version and record the
+        # per character changes, so that consumers can catch up incrementally rather
+        # than re-copying the entire roster.
+        self.version = 0
+        self._changes: collections.deque[tuple[int, list[DKPChange]]] = (
+            collections.deque(maxlen=self.config.change_history)
+        )
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        # We keep a single session around for the lifetime of the provider, so that
+        # the underlying connection pool can keep our connection to EQDKP alive
+        # between refreshes instead of doing a new TCP/TLS handshake every time.
+        if self._session is None or self._session.closed:
+            self._session = aiohttp.ClientSession(
+                connector=aiohttp.TCPConnector(
+                    limit_per_host=self.config.max_connections,
+                    keepalive_timeout=self.config.keepalive_timeout,
+                ),
+                timeout=aiohttp.ClientTimeout(total=self.config.request_timeout),
+            )
+        return self._session
+
+    async def close(self) -> None:
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+
+    @property
+    def snapshot(self) -> typing.Optional[DKPSnapshot]:
+        return self._snapshot
+
+    @property
+    def age(self) -> typing.Optional[float]:
+        if self._fetched_at is None:
+            return None
+        return time.monotonic() - self._fetched_at
+
+    async def list_dkp(
+        self, *, max_age: typing.Optional[float] = None
+    ) -> DKPSnapshot:
+        if max_age is None:
+            max_age = self.config.cache_ttl
+
+        # If we have a snapshot that is new enough, then we can just answer straight
+        # out of memory without ever touching EQDKP.
+        age = self.age
+        if self._snapshot is not None and age is not None and age <= max_age:
+            return self._snapshot
+
+        # Otherwise we need to refresh, but if somebody else is already refreshing
+        # then we'll just wait on their fetch rather than starting another identical
+        # request of our own.
+        if self._inflight is None:
+            self._inflight = asyncio.ensure_future(self._refresh())
+            self._inflight.add_done_callback(self._clear_inflight)
+
+        # We shield the shared fetch, so that one caller being cancelled (for instance
+        # an interaction timing out) doesn't cancel the fetch for everyone else.
+        return await asyncio.shield(self._inflight)
+
+    async def refresh(self) -> DKPSnapshot:
+        return await self.list_dkp(max_age=0)
+
+    def changes_since(
+        self, version: int, until: typing.Optional[int] = None
+    ) -> typing.Optional[list[DKPChange]]:
+        # Returns every change after the given version, up to and including until
+        # (or the latest version), so a caller that is holding onto a particular
+        # snapshot gets exactly the changes that lead up to it.
+        if until is None:
+            until = self.version
+        if version == until:
+            return []
+
+        # If we no longer have the history going back far enough (or at all), then
+        # the caller has to fall back to taking the entire snapshot.
+        if (
+            not self._changes
+            or version > until
+            or version < self._changes[0][0] - 1
+        ):
+            return None
+
+        return [
+            change
+            for change_version, changes in self._changes
+            if version < change_version <= until
+            for change in changes
+        ]
+
+    def _clear_inflight(self, fut: asyncio.Future) -> None:
+        if self._inflight is fut:
+            self._inflight = None
+
+    async def _refresh(self) -> DKPSnapshot:
         url = "?".join(
             [
                 urllib.parse.urljoin(self.config.url, "api.php"),
@@ -33,26 +473,70 @@ class DKPProvider:
             ]
         )
 
-        # TODO: This shoudl have a persistent session, not throwing one away every
-        #       time.
-        async with aiohttp.ClientSession() as session:
-            async with session.get(url) as resp:
-                data = await resp.json()
-
-        # The EQDKP data structure is kinda wonky and weird, we're going to massage
-        # it into something that works better for us.
-        pool_name = f"multidkp_points:{self.config.dkp_pool_id}"
-        return {
-            p["name"].lower(): CharacterDKP(
-                name=p["name"].lower(),
-                current=int(p["points"][pool_name]["points_current"]),
-                earned=int(p["points"][pool_name]["points_earned"]),
-                spent=int(p["points"][pool_name]["points_spent"]),
-                adjustments=int(p["points"][pool_name]["points_adjustment"]),
-            )
-            for p in data.get("players", {}).values()
-            if p["active"] == "1" and not p["hidden"]
-        }
+        headers = {}
+        if self._snapshot is not None:
+            if self._etag is not None:
+                headers["If-None-Match"] = self._etag
+            if self._last_modified is not None:
+                headers["If-Modified-Since"] = self._last_modified
+
+        async with self.session.get(url, headers=headers) as resp:
+            # If EQDKP tells us nothing has changed, then our existing snapshot is
+            # still good, and is now just as fresh as if we had fetched it again.
+            if resp.status == 304 and self._snapshot is not None:
+                self._fetched_at = time.monotonic()
+                return self._snapshot
+
+            resp.raise_for_status()
+
+            # We decode the roster as it streams in, hashing it as we go, so that we
+            # never have to hold the entire payload in memory, and the decoding is
+            # spread out over the download, rather than happening all in one go.
+            hasher = hashlib.blake2b(digest_size=16)
+            decoder = PointsDecoder(self.config.dkp_pool_id)
+            snapshot = DKPSnapshot(version=self.version + 1)
+            async for chunk in resp.content.iter_chunked(self.config.chunk_size):
+                hasher.update(chunk)
+                for dkp in decoder.feed(chunk):
+                    snapshot._add(dkp)
+
+                # If the body has already been buffered, then nothing above actually
+                # waits, so we make sure that we give everything else a turn.
+                await asyncio.sleep(0)
+            for dkp in decoder.close():
+                snapshot._add(dkp)
+
+            self._etag = resp.headers.get("ETag")
+            self._last_modified = resp.headers.get("Last-Modified")
+
+        # Not every EQDKP install sends validators, so as a fallback we compare the
+        # hash of the body, and if it's unchanged we throw away what we decoded, and
+        # don't need to bother diffing it.
+        digest = hasher.digest()
+        if digest == self._digest and self._snapshot is not None:
+            self._fetched_at = time.monotonic()
+            return self._snapshot
+
+        if self._snapshot is not None:
+            changes = diff_dkp(self._snapshot, snapshot)
+        else:
+            changes = None
+
+        # We only bump the version when the roster has actually changed, a new body
+        # that parses into the same roster (say, a different generation timestamp)
+        # isn't interesting to anyone.
+        if changes is None or changes:
+            self.version += 1
+            if changes is None:
+                self._changes.clear()
+            else:
+                self._changes.append((self.version, changes))
+            self._snapshot = snapshot
+
+        self._digest = digest
+        self._fetched_at = time.monotonic()
+
+        return self._snapshot
 
     async def current_dkp(self, character: str) -> typing.Optional[CharacterDKP]:
         return (await self.list_dkp()).get(character.lower(), None)
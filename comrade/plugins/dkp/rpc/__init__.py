@@ -1,9 +1,19 @@
+import asyncio
+import bisect
+import functools
 import hmac
 import logging
+import typing
+
+import cattr
+import grpc
 
 from sqlalchemy import sql
 
+from comrade.plugins.dkp.auction import AuctionItem, AuctionResults, Bid
 from comrade.plugins.dkp.dkp import pending_claims, linked_characters
+from comrade.plugins.dkp.feed import FeedClosed, FeedEvent, FeedGap, SubscriberDropped
+from comrade.plugins.dkp.provider import CharacterDKP, DKPSnapshot
 
 from . import auction_pb2_grpc, auction_pb2
 from . import dkp_pb2_grpc, dkp_pb2
@@ -12,22 +22,305 @@ from . import dkp_pb2_grpc, dkp_pb2
 logger = logging.getLogger(__name__)
 
 
+def leader_only(fn):
+    # When we're running as a standby, we turn away anything that would change our
+    # state, so that the caller goes and finds the process that's actually in charge.
+    @functools.wraps(fn)
+    async def wrapper(self, request, context):
+        if not self.bot.is_leader:
+            await context.abort(grpc.StatusCode.UNAVAILABLE, "Not the leader")
+        return await fn(self, request, context)
+
+    return wrapper
+
+
+_STATUSES = {
+    "stop": "stopped",
+    "reopen": "running",
+    "delete": "deleted",
+    "retire": "retired",
+}
+
+
+def _auction_bid(bid: Bid) -> auction_pb2.AuctionEventBid:
+    return auction_pb2.AuctionEventBid(
+        bidder=bid.bidder, rank=bid.rank.name, bid=bid.bid, id=bid.id, item=bid.item
+    )
+
+
+def _auction_results(data: list) -> list[auction_pb2.AuctionEventResults]:
+    return [
+        auction_pb2.AuctionEventResults(
+            winners=[_auction_bid(bid) for bid in results.winners],
+            tied=[_auction_bid(bid) for bid in results.tied],
+            rolled=results.rolled,
+        )
+        for results in cattr.structure(data, list[AuctionResults])
+    ]
+
+
+def _auction_event(event: FeedEvent) -> typing.Optional[auction_pb2.AuctionEvent]:
+    # Turns an event from the auctioneer into what we send to anyone watching, or
+    # None if it isn't something that they care about.
+    message = auction_pb2.AuctionEvent(
+        seq=event.seq, channel=event.channel, auction_id=event.auction_id
+    )
+
+    if event.event == "start":
+        message.type = auction_pb2.STARTED
+        message.items.extend(
+            auction_pb2.AuctionEventItem(
+                item=item.item, quantity=item.quantity, added_by=item.added_by
+            )
+            for item in cattr.structure(event.data["items"], list[AuctionItem])
+        )
+    elif event.event == "bid":
+        message.type = auction_pb2.BID_ACCEPTED
+        message.bid.CopyFrom(_auction_bid(cattr.structure(event.data["bid"], Bid)))
+    elif event.event == "close":
+        message.type = auction_pb2.RESULTS
+        message.results.extend(_auction_results(event.data["results"]))
+    elif event.event == "accept":
+        message.type = auction_pb2.ACCEPTED
+        message.results.extend(_auction_results(event.data["results"]))
+    elif event.event == "settle":
+        message.type = auction_pb2.STATUS_CHANGED
+        message.status = "running" if event.data["at"] is None else "closing"
+    elif event.event in _STATUSES:
+        message.type = auction_pb2.STATUS_CHANGED
+        message.status = _STATUSES[event.event]
+    else:
+        return None
+
+    return message
+
+
+class IngestQueueFull(Exception):
+    pass
+
+
+class IngestUnavailable(Exception):
+    pass
+
+
 class Auction(auction_pb2_grpc.AuctionServicer):
     def __init__(self, bot, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
         self.bot = bot
 
+        # Items (and their idempotency keys) that have come in, but haven't been
+        # added to the auction queue yet, along with a future for each call that
+        # gets resolved once they have. This is bounded, so that if we can't keep
+        # up, callers get told to back off, rather than it growing forever.
+        self._pending: list[
+            tuple[list[tuple[AuctionItem, typing.Optional[str]]], asyncio.Future]
+        ] = []
+        self._pending_items = 0
+        self._ingest_ready = asyncio.Event()
+        self._ingester = None
+
+    def _ingest(
+        self, items: list[tuple[AuctionItem, typing.Optional[str]]]
+    ) -> asyncio.Future:
+        # Either all of the items get queued or none of them do, so that a caller
+        # that gets turned away knows it can just send the whole thing again.
+        limit = self.bot.config.rpc.ingest_queue_size
+        if self._pending_items + len(items) > limit:
+            raise IngestQueueFull(
+                f"Too many items waiting to be added ({self._pending_items} of "
+                f"{limit}), try again later"
+            )
+
+        if self._ingester is None:
+            self._ingester = asyncio.create_task(self._run_ingester())
+
+        fut = asyncio.get_running_loop().create_future()
+        self._pending.append((items, fut))
+        self._pending_items += len(items)
+        self._ingest_ready.set()
+        return fut
+
+    async def _run_ingester(self):
+        while True:
+            await self._ingest_ready.wait()
+
+            # Everything that has come in since the last time around gets added in
+            # one go, so a whole burst of items only has to wait on the journal once.
+            pending, self._pending = self._pending, []
+            self._pending_items = 0
+            self._ingest_ready.clear()
+
+            # If whoever was waiting on some of these has given up, then we don't
+            # add them, the same as if they'd never been sent.
+            pending = [(items, fut) for items, fut in pending if not fut.cancelled()]
+            if not pending:
+                continue
+
+            # If the auction cog has gone away while these were waiting, then we
+            # turn them away rather than holding onto them until it comes back, so
+            # that whoever sent them can retry them (maybe against someone else).
+            auction = self.bot.get_cog("Auction")
+            if auction is None:
+                logger.warning("No auction cog found, turning away new items")
+                for _, fut in pending:
+                    fut.set_exception(IngestUnavailable("Auctions are not loaded"))
+                continue
+
+            # If we've lost the lead while these were waiting, then we can't add
+            # them, whoever is in charge now has to.
+            if not self.bot.is_leader:
+                for _, fut in pending:
+                    fut.set_result(None)
+                continue
+
+            try:
+                added = await auction.add_auction_items(
+                    [item for items, _ in pending for item, _ in items],
+                    [key for items, _ in pending for _, key in items],
+                )
+            except asyncio.CancelledError:
+                raise
+            except Exception as exc:
+                logger.exception("Error while adding auction items")
+                for _, fut in pending:
+                    if not fut.done():
+                        fut.set_exception(exc)
+            else:
+                # Each caller gets back whether each of their items was added, or
+                # was dropped as a duplicate.
+                offset = 0
+                for items, fut in pending:
+                    if not fut.done():
+                        fut.set_result(added[offset : offset + len(items)])
+                    offset += len(items)
+
+    async def _add_items(self, requests, context) -> list[bool]:
+        # An item nobody can win can never be settled or awarded, so it isn't worth
+        # auctioning, and we'd rather tell whoever sent it than accept it.
+        for request in requests:
+            if request.quantity < 1:
+                await context.abort(
+                    grpc.StatusCode.INVALID_ARGUMENT,
+                    f"Quantity for {request.item!r} must be at least 1",
+                )
+
+        items = [
+            (
+                AuctionItem(
+                    item=request.item,
+                    quantity=request.quantity,
+                    added_by=request.added_by,
+                ),
+                request.idempotency_key or None,
+            )
+            for request in requests
+        ]
+        if not items:
+            return []
+
+        # There's no point queueing anything if there's nothing to add it to.
+        if self.bot.get_cog("Auction") is None:
+            await context.abort(grpc.StatusCode.UNAVAILABLE, "Auctions are not loaded")
+
+        try:
+            fut = self._ingest(items)
+        except IngestQueueFull as exc:
+            await context.abort(grpc.StatusCode.RESOURCE_EXHAUSTED, str(exc))
+
+        try:
+            added = await fut
+        except IngestUnavailable as exc:
+            await context.abort(grpc.StatusCode.UNAVAILABLE, str(exc))
+        if added is None:
+            await context.abort(grpc.StatusCode.UNAVAILABLE, "Not the leader")
+
+        return added
+
+    @leader_only
     async def AddItem(self, request, context):
+        [added] = await self._add_items([request], context)
+        return auction_pb2.AddItemResponse(duplicate=not added)
+
+    @leader_only
+    async def AddItems(self, request_iterator, context):
+        # We read the whole stream before queueing anything, so that it gets added
+        # all or nothing, the same as a batch, but we won't read more than could
+        # ever fit in the queue.
+        limit = self.bot.config.rpc.ingest_queue_size
+        requests = []
+        async for request in request_iterator:
+            requests.append(request)
+            if len(requests) > limit:
+                await context.abort(
+                    grpc.StatusCode.RESOURCE_EXHAUSTED,
+                    f"Too many items in one call (the limit is {limit})",
+                )
+
+        added = await self._add_items(requests, context)
+        return auction_pb2.AddItemsResponse(
+            added=sum(added), duplicates=len(added) - sum(added)
+        )
+
+    @leader_only
+    async def BatchAddItems(self, request, context):
+        added = await self._add_items(request.items, context)
+        return auction_pb2.AddItemsResponse(
+            added=sum(added), duplicates=len(added) - sum(added)
+        )
+
+    async def _place_bid(self, request, context):
         auction = self.bot.get_cog("Auction")
         if auction is None:
-            logger.warn(f"No auction cog found, discarding item: ")
-        else:
-            await auction.add_auction_item(
-                request.item, request.quantity, request.added_by
-            )
+            await context.abort(grpc.StatusCode.UNAVAILABLE, "Auctions are not loaded")
 
-        return auction_pb2.AddItemResponse()
+        accepted, replies = await auction.place_bid(
+            request.channel,
+            request.character,
+            request.bid,
+            request.id,
+            request.item or 1,
+            alt=request.alt,
+        )
+        return auction_pb2.PlaceBidResponse(
+            accepted=accepted,
+            message="\n".join(str(reply.message) for reply in replies),
+            version=max((reply.version or 0 for reply in replies), default=0),
+        )
+
+    @leader_only
+    async def PlaceBid(self, request, context):
+        return await self._place_bid(request, context)
+
+    @leader_only
+    async def PlaceBids(self, request_iterator, context):
+        # Bids are handled one at a time, in the order they were sent, so that a bid
+        # which replaces an earlier one from the same bidder always lands after it.
+        async for request in request_iterator:
+            await context.write(await self._place_bid(request, context))
+
+    @leader_only
+    async def WatchAuctions(self, request, context):
+        auction = self.bot.get_cog("Auction")
+        if auction is None:
+            await context.abort(grpc.StatusCode.UNAVAILABLE, "Auctions are not loaded")
+
+        try:
+            subscription = auction.feed.subscribe(request.since or None)
+        except FeedGap as exc:
+            await context.abort(grpc.StatusCode.OUT_OF_RANGE, str(exc))
+
+        try:
+            async for event in subscription:
+                message = _auction_event(event)
+                if message is not None:
+                    await context.write(message)
+        except SubscriberDropped as exc:
+            await context.abort(grpc.StatusCode.RESOURCE_EXHAUSTED, str(exc))
+        except FeedClosed:
+            await context.abort(grpc.StatusCode.UNAVAILABLE, "Not the leader")
+        finally:
+            subscription.close()
 
 
 def AuctionService(*args, **kwargs):
@@ -38,13 +331,30 @@ def AuctionService(*args, **kwargs):
     )
 
 
+def _character_dkp(dkp: CharacterDKP) -> dkp_pb2.CharacterDKP:
+    return dkp_pb2.CharacterDKP(
+        name=dkp.name,
+        current=dkp.current,
+        earned=dkp.earned,
+        spent=dkp.spent,
+        adjustments=dkp.adjustments,
+    )
+
+
 class DKP(dkp_pb2_grpc.DKPServicer):
     def __init__(self, bot, *args, **kwargs):
         super().__init__(*args, **kwargs)
 
         self.bot = bot
 
+    # The link goes into the database, but the in memory index that bids are
+    # checked against belongs to whoever is in charge, and a standby only reloads
+    # its index when it takes over, so a link made on a standby would go unnoticed
+    # by the leader until the next failover.
+    @leader_only
     async def LinkCharacter(self, request, context):
+        linked = None
+
         async with self.bot.db.begin() as tx:
             claim = (
                 await tx.execute(
@@ -84,9 +394,81 @@ class DKP(dkp_pb2_grpc.DKPServicer):
                             character=claim["character"],
                         )
                     )
+                    linked = (claim["discord_user"], claim["character"])
+
+        # Now that the link has actually been committed, we'll update the in memory
+        # index of linked characters to match.
+        dkp = self.bot.get_cog("DKP")
+        if linked is not None and dkp is not None:
+            dkp.characters.link(*linked)
 
         return dkp_pb2.LinkCharacterResponse()
 
+    async def _snapshot(self, context) -> tuple[DKPSnapshot, float]:
+        # Everything here is answered from whatever snapshot of the DKP we've
+        # already got in memory, rather than going out to EQDKP.
+        dkp = self.bot.get_cog("DKP")
+        if dkp is None:
+            await context.abort(grpc.StatusCode.UNAVAILABLE, "DKP is not loaded")
+
+        snapshot = await dkp.get_dkp()
+        return snapshot, dkp.provider.age or 0.0
+
+    async def GetDKP(self, request, context):
+        snapshot, age = await self._snapshot(context)
+
+        name = request.character.lower()
+        if name not in snapshot:
+            await context.abort(
+                grpc.StatusCode.NOT_FOUND,
+                f"{request.character} does not appear in the DKP system",
+            )
+
+        return dkp_pb2.GetDKPResponse(
+            dkp=_character_dkp(snapshot[name]), version=snapshot.version, age=age
+        )
+
+    async def BatchGetDKP(self, request, context):
+        snapshot, age = await self._snapshot(context)
+
+        response = dkp_pb2.BatchGetDKPResponse(version=snapshot.version, age=age)
+        for character in request.characters:
+            name = character.lower()
+            if name in snapshot:
+                response.dkp.append(_character_dkp(snapshot[name]))
+            else:
+                response.missing.append(character)
+        return response
+
+    async def ListDKP(self, request, context):
+        # Every page comes from the same snapshot, and if the caller picks back up
+        # with a page token, we carry on from the same place in whatever snapshot we
+        # have by then, and the version tells them that it changed.
+        snapshot, age = await self._snapshot(context)
+
+        page_size = min(request.page_size or 100, 1000)
+        if page_size < 0:
+            await context.abort(
+                grpc.StatusCode.INVALID_ARGUMENT, "page_size cannot be negative"
+            )
+
+        names = snapshot.sorted()
+        start = bisect.bisect_right(names, request.page_token)
+
+        while True:
+            page = names[start : start + page_size]
+            start += page_size
+            await context.write(
+                dkp_pb2.ListDKPResponse(
+                    dkp=[_character_dkp(snapshot[name]) for name in page],
+                    version=snapshot.version,
+                    age=age,
+                    next_page_token=page[-1] if page and start < len(names) else "",
+                )
+            )
+            if start >= len(names):
+                break
+
 
 def DKPService(*args, **kwargs):
     return (
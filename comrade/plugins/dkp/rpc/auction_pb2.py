@@ -2,6 +2,7 @@
 # Generated by the protocol buffer compiler.  DO NOT EDIT!
 # source: comrade/plugins/dkp/rpc/auction.proto
 """Generated protocol buffer code."""
+from google.protobuf.internal import enum_type_wrapper
 from google.protobuf import descriptor as _descriptor
 from google.protobuf import message as _message
 from google.protobuf import reflection as _reflection
@@ -19,10 +20,57 @@ DESCRIPTOR = _descriptor.FileDescriptor(
   syntax='proto3',
   serialized_options=None,
   create_key=_descriptor._internal_create_key,
-  serialized_pb=b'\n%comrade/plugins/dkp/rpc/auction.proto\x12\x07\x61uction\"B\n\x0e\x41\x64\x64ItemRequest\x12\x10\n\x08\x61\x64\x64\x65\x64_by\x18\x01 \x01(\t\x12\x0c\n\x04item\x18\x02 \x01(\t\x12\x10\n\x08quantity\x18\x03 \x01(\x05\"\x11\n\x0f\x41\x64\x64ItemResponse2I\n\x07\x41uction\x12>\n\x07\x41\x64\x64Item\x12\x17.auction.AddItemRequest\x1a\x18.auction.AddItemResponse\"\x00\x62\x06proto3'
+  serialized_pb=b'\n%comrade/plugins/dkp/rpc/auction.proto\x12\x07\x61uction\"[\n\x0e\x41\x64\x64ItemRequest\x12\x10\n\x08\x61\x64\x64\x65\x64_by\x18\x01 \x01(\t\x12\x0c\n\x04item\x18\x02 \x01(\t\x12\x10\n\x08quantity\x18\x03 \x01(\x05\x12\x17\n\x0fidempotency_key\x18\x04 \x01(\t\"$\n\x0f\x41\x64\x64ItemResponse\x12\x11\n\tduplicate\x18\x01 \x01(\x08\">\n\x14\x42\x61tchAddItemsRequest\x12&\n\x05items\x18\x01 \x03(\x0b\x32\x17.auction.AddItemRequest\"5\n\x10\x41\x64\x64ItemsResponse\x12\r\n\x05\x61\x64\x64\x65\x64\x18\x01 \x01(\x05\x12\x12\n\nduplicates\x18\x02 \x01(\x05\"i\n\x0fPlaceBidRequest\x12\x0f\n\x07\x63hannel\x18\x01 \x01(\t\x12\x11\n\tcharacter\x18\x02 \x01(\t\x12\x0b\n\x03\x62id\x18\x03 \x01(\x05\x12\n\n\x02id\x18\x04 \x01(\x05\x12\x0c\n\x04item\x18\x05 \x01(\x05\x12\x0b\n\x03\x61lt\x18\x06 \x01(\x08\"F\n\x10PlaceBidResponse\x12\x10\n\x08\x61\x63\x63\x65pted\x18\x01 \x01(\x08\x12\x0f\n\x07message\x18\x02 \x01(\t\x12\x0f\n\x07version\x18\x03 \x01(\x03\"%\n\x14WatchAuctionsRequest\x12\r\n\x05since\x18\x01 \x01(\x04\"D\n\x10\x41uctionEventItem\x12\x0c\n\x04item\x18\x01 \x01(\t\x12\x10\n\x08quantity\x18\x02 \x01(\x05\x12\x10\n\x08\x61\x64\x64\x65\x64_by\x18\x03 \x01(\t\"V\n\x0f\x41uctionEventBid\x12\x0e\n\x06\x62idder\x18\x01 \x01(\t\x12\x0c\n\x04rank\x18\x02 \x01(\t\x12\x0b\n\x03\x62id\x18\x03 \x01(\x05\x12\n\n\x02id\x18\x04 \x01(\x05\x12\x0c\n\x04item\x18\x05 \x01(\x05\"x\n\x13\x41uctionEventResults\x12)\n\x07winners\x18\x01 \x03(\x0b\x32\x18.auction.AuctionEventBid\x12&\n\x04tied\x18\x02 \x03(\x0b\x32\x18.auction.AuctionEventBid\x12\x0e\n\x06rolled\x18\x03 \x01(\x05\"\xf9\x01\n\x0c\x41uctionEvent\x12\x0b\n\x03seq\x18\x01 \x01(\x04\x12\'\n\x04type\x18\x02 \x01(\x0e\x32\x19.auction.AuctionEventType\x12\x0f\n\x07\x63hannel\x18\x03 \x01(\t\x12\x12\n\nauction_id\x18\x04 \x01(\x05\x12(\n\x05items\x18\x05 \x03(\x0b\x32\x19.auction.AuctionEventItem\x12%\n\x03\x62id\x18\x06 \x01(\x0b\x32\x18.auction.AuctionEventBid\x12\x0e\n\x06status\x18\x07 \x01(\t\x12-\n\x07results\x18\x08 \x03(\x0b\x32\x1c.auction.AuctionEventResults*`\n\x10\x41uctionEventType\x12\x0b\n\x07STARTED\x10\x00\x12\x10\n\x0c\x42ID_ACCEPTED\x10\x01\x12\x12\n\x0eSTATUS_CHANGED\x10\x02\x12\x0b\n\x07RESULTS\x10\x03\x12\x0c\n\x08\x41\x43\x43\x45PTED\x10\x04\x32\xb0\x03\n\x07\x41uction\x12>\n\x07\x41\x64\x64Item\x12\x17.auction.AddItemRequest\x1a\x18.auction.AddItemResponse\"\x00\x12\x42\n\x08\x41\x64\x64Items\x12\x17.auction.AddItemRequest\x1a\x19.auction.AddItemsResponse\"\x00(\x01\x12K\n\rBatchAddItems\x12\x1d.auction.BatchAddItemsRequest\x1a\x19.auction.AddItemsResponse\"\x00\x12\x41\n\x08PlaceBid\x12\x18.auction.PlaceBidRequest\x1a\x19.auction.PlaceBidResponse\"\x00\x12\x46\n\tPlaceBids\x12\x18.auction.PlaceBidRequest\x1a\x19.auction.PlaceBidResponse\"\x00(\x01\x30\x01\x12I\n\rWatchAuctions\x12\x1d.auction.WatchAuctionsRequest\x1a\x15.auction.AuctionEvent\"\x00\x30\x01\x62\x06proto3'
 )
 
 
+_AUCTIONEVENTTYPE = _descriptor.EnumDescriptor(
+  name='AuctionEventType',
+  full_name='auction.AuctionEventType',
+  filename=None,
+  file=DESCRIPTOR,
+  create_key=_descriptor._internal_create_key,
+  values=[
+    _descriptor.EnumValueDescriptor(
+      name='STARTED', index=0, number=0,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='BID_ACCEPTED', index=1, number=1,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='STATUS_CHANGED', index=2, number=2,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='RESULTS', index=3, number=3,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+    _descriptor.EnumValueDescriptor(
+      name='ACCEPTED', index=4, number=4,
+      serialized_options=None,
+      type=None,
+      create_key=_descriptor._internal_create_key),
+  ],
+  containing_type=None,
+  serialized_options=None,
+  serialized_start=1050,
+  serialized_end=1146,
+)
+_sym_db.RegisterEnumDescriptor(_AUCTIONEVENTTYPE)
+
+AuctionEventType = enum_type_wrapper.EnumTypeWrapper(_AUCTIONEVENTTYPE)
+STARTED = 0
+BID_ACCEPTED = 1
+STATUS_CHANGED = 2
+RESULTS = 3
+ACCEPTED = 4
+
 
 
 _ADDITEMREQUEST = _descriptor.Descriptor(
@@ -54,6 +102,13 @@ _ADDITEMREQUEST = _descriptor.Descriptor(
       message_type=None, enum_type=None, containing_type=None,
       is_extension=False, extension_scope=None,
       serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='idempotency_key', full_name='auction.AddItemRequest.idempotency_key', index=3,
+      number=4, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
   ],
   extensions=[
   ],
@@ -67,7 +122,7 @@ _ADDITEMREQUEST = _descriptor.Descriptor(
   oneofs=[
   ],
   serialized_start=50,
-  serialized_end=116,
+  serialized_end=141,
 )
 
 
@@ -79,6 +134,462 @@ _ADDITEMRESPONSE = _descriptor.Descriptor(
   containing_type=None,
   create_key=_descriptor._internal_create_key,
   fields=[
+    _descriptor.FieldDescriptor(
+      name='duplicate', full_name='auction.AddItemResponse.duplicate', index=0,
+      number=1, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=143,
+  serialized_end=179,
+)
+
+
+_BATCHADDITEMSREQUEST = _descriptor.Descriptor(
+  name='BatchAddItemsRequest',
+  full_name='auction.BatchAddItemsRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='items', full_name='auction.BatchAddItemsRequest.items', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=181,
+  serialized_end=243,
+)
+
+
+_ADDITEMSRESPONSE = _descriptor.Descriptor(
+  name='AddItemsResponse',
+  full_name='auction.AddItemsResponse',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='added', full_name='auction.AddItemsResponse.added', index=0,
+      number=1, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='duplicates', full_name='auction.AddItemsResponse.duplicates', index=1,
+      number=2, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=245,
+  serialized_end=298,
+)
+
+
+_PLACEBIDREQUEST = _descriptor.Descriptor(
+  name='PlaceBidRequest',
+  full_name='auction.PlaceBidRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='channel', full_name='auction.PlaceBidRequest.channel', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='character', full_name='auction.PlaceBidRequest.character', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='bid', full_name='auction.PlaceBidRequest.bid', index=2,
+      number=3, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='id', full_name='auction.PlaceBidRequest.id', index=3,
+      number=4, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='item', full_name='auction.PlaceBidRequest.item', index=4,
+      number=5, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='alt', full_name='auction.PlaceBidRequest.alt', index=5,
+      number=6, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=300,
+  serialized_end=405,
+)
+
+
+_PLACEBIDRESPONSE = _descriptor.Descriptor(
+  name='PlaceBidResponse',
+  full_name='auction.PlaceBidResponse',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='accepted', full_name='auction.PlaceBidResponse.accepted', index=0,
+      number=1, type=8, cpp_type=7, label=1,
+      has_default_value=False, default_value=False,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='message', full_name='auction.PlaceBidResponse.message', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='version', full_name='auction.PlaceBidResponse.version', index=2,
+      number=3, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=407,
+  serialized_end=477,
+)
+
+
+_WATCHAUCTIONSREQUEST = _descriptor.Descriptor(
+  name='WatchAuctionsRequest',
+  full_name='auction.WatchAuctionsRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='since', full_name='auction.WatchAuctionsRequest.since', index=0,
+      number=1, type=4, cpp_type=4, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=479,
+  serialized_end=516,
+)
+
+
+_AUCTIONEVENTITEM = _descriptor.Descriptor(
+  name='AuctionEventItem',
+  full_name='auction.AuctionEventItem',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='item', full_name='auction.AuctionEventItem.item', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='quantity', full_name='auction.AuctionEventItem.quantity', index=1,
+      number=2, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='added_by', full_name='auction.AuctionEventItem.added_by', index=2,
+      number=3, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=518,
+  serialized_end=586,
+)
+
+
+_AUCTIONEVENTBID = _descriptor.Descriptor(
+  name='AuctionEventBid',
+  full_name='auction.AuctionEventBid',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='bidder', full_name='auction.AuctionEventBid.bidder', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='rank', full_name='auction.AuctionEventBid.rank', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='bid', full_name='auction.AuctionEventBid.bid', index=2,
+      number=3, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='id', full_name='auction.AuctionEventBid.id', index=3,
+      number=4, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='item', full_name='auction.AuctionEventBid.item', index=4,
+      number=5, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=588,
+  serialized_end=674,
+)
+
+
+_AUCTIONEVENTRESULTS = _descriptor.Descriptor(
+  name='AuctionEventResults',
+  full_name='auction.AuctionEventResults',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='winners', full_name='auction.AuctionEventResults.winners', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='tied', full_name='auction.AuctionEventResults.tied', index=1,
+      number=2, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='rolled', full_name='auction.AuctionEventResults.rolled', index=2,
+      number=3, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=676,
+  serialized_end=796,
+)
+
+
+_AUCTIONEVENT = _descriptor.Descriptor(
+  name='AuctionEvent',
+  full_name='auction.AuctionEvent',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='seq', full_name='auction.AuctionEvent.seq', index=0,
+      number=1, type=4, cpp_type=4, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='type', full_name='auction.AuctionEvent.type', index=1,
+      number=2, type=14, cpp_type=8, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='channel', full_name='auction.AuctionEvent.channel', index=2,
+      number=3, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='auction_id', full_name='auction.AuctionEvent.auction_id', index=3,
+      number=4, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='items', full_name='auction.AuctionEvent.items', index=4,
+      number=5, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='bid', full_name='auction.AuctionEvent.bid', index=5,
+      number=6, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='status', full_name='auction.AuctionEvent.status', index=6,
+      number=7, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='results', full_name='auction.AuctionEvent.results', index=7,
+      number=8, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
   ],
   extensions=[
   ],
@@ -91,12 +602,29 @@ _ADDITEMRESPONSE = _descriptor.Descriptor(
   extension_ranges=[],
   oneofs=[
   ],
-  serialized_start=118,
-  serialized_end=135,
+  serialized_start=799,
+  serialized_end=1048,
 )
 
+_BATCHADDITEMSREQUEST.fields_by_name['items'].message_type = _ADDITEMREQUEST
+_AUCTIONEVENTRESULTS.fields_by_name['winners'].message_type = _AUCTIONEVENTBID
+_AUCTIONEVENTRESULTS.fields_by_name['tied'].message_type = _AUCTIONEVENTBID
+_AUCTIONEVENT.fields_by_name['type'].enum_type = _AUCTIONEVENTTYPE
+_AUCTIONEVENT.fields_by_name['items'].message_type = _AUCTIONEVENTITEM
+_AUCTIONEVENT.fields_by_name['bid'].message_type = _AUCTIONEVENTBID
+_AUCTIONEVENT.fields_by_name['results'].message_type = _AUCTIONEVENTRESULTS
 DESCRIPTOR.message_types_by_name['AddItemRequest'] = _ADDITEMREQUEST
 DESCRIPTOR.message_types_by_name['AddItemResponse'] = _ADDITEMRESPONSE
+DESCRIPTOR.message_types_by_name['BatchAddItemsRequest'] = _BATCHADDITEMSREQUEST
+DESCRIPTOR.message_types_by_name['AddItemsResponse'] = _ADDITEMSRESPONSE
+DESCRIPTOR.message_types_by_name['PlaceBidRequest'] = _PLACEBIDREQUEST
+DESCRIPTOR.message_types_by_name['PlaceBidResponse'] = _PLACEBIDRESPONSE
+DESCRIPTOR.message_types_by_name['WatchAuctionsRequest'] = _WATCHAUCTIONSREQUEST
+DESCRIPTOR.message_types_by_name['AuctionEventItem'] = _AUCTIONEVENTITEM
+DESCRIPTOR.message_types_by_name['AuctionEventBid'] = _AUCTIONEVENTBID
+DESCRIPTOR.message_types_by_name['AuctionEventResults'] = _AUCTIONEVENTRESULTS
+DESCRIPTOR.message_types_by_name['AuctionEvent'] = _AUCTIONEVENT
+DESCRIPTOR.enum_types_by_name['AuctionEventType'] = _AUCTIONEVENTTYPE
 _sym_db.RegisterFileDescriptor(DESCRIPTOR)
 
 AddItemRequest = _reflection.GeneratedProtocolMessageType('AddItemRequest', (_message.Message,), {
@@ -113,6 +641,69 @@ AddItemResponse = _reflection.GeneratedProtocolMessageType('AddItemResponse', (_
   })
 _sym_db.RegisterMessage(AddItemResponse)
 
+BatchAddItemsRequest = _reflection.GeneratedProtocolMessageType('BatchAddItemsRequest', (_message.Message,), {
+  'DESCRIPTOR' : _BATCHADDITEMSREQUEST,
+  '__module__' : 'comrade.plugins.dkp.rpc.auction_pb2'
+  # @@protoc_insertion_point(class_scope:auction.BatchAddItemsRequest)
+  })
+_sym_db.RegisterMessage(BatchAddItemsRequest)
+
+AddItemsResponse = _reflection.GeneratedProtocolMessageType('AddItemsResponse', (_message.Message,), {
+  'DESCRIPTOR' : _ADDITEMSRESPONSE,
+  '__module__' : 'comrade.plugins.dkp.rpc.auction_pb2'
+  # @@protoc_insertion_point(class_scope:auction.AddItemsResponse)
+  })
+_sym_db.RegisterMessage(AddItemsResponse)
+
+PlaceBidRequest = _reflection.GeneratedProtocolMessageType('PlaceBidRequest', (_message.Message,), {
+  'DESCRIPTOR' : _PLACEBIDREQUEST,
+  '__module__' : 'comrade.plugins.dkp.rpc.auction_pb2'
+  # @@protoc_insertion_point(class_scope:auction.PlaceBidRequest)
+  })
+_sym_db.RegisterMessage(PlaceBidRequest)
+
+PlaceBidResponse = _reflection.GeneratedProtocolMessageType('PlaceBidResponse', (_message.Message,), {
+  'DESCRIPTOR' : _PLACEBIDRESPONSE,
+  '__module__' : 'comrade.plugins.dkp.rpc.auction_pb2'
+  # @@protoc_insertion_point(class_scope:auction.PlaceBidResponse)
+  })
+_sym_db.RegisterMessage(PlaceBidResponse)
+
+WatchAuctionsRequest = _reflection.GeneratedProtocolMessageType('WatchAuctionsRequest', (_message.Message,), {
+  'DESCRIPTOR' : _WATCHAUCTIONSREQUEST,
+  '__module__' : 'comrade.plugins.dkp.rpc.auction_pb2'
+  # @@protoc_insertion_point(class_scope:auction.WatchAuctionsRequest)
+  })
+_sym_db.RegisterMessage(WatchAuctionsRequest)
+
+AuctionEventItem = _reflection.GeneratedProtocolMessageType('AuctionEventItem', (_message.Message,), {
+  'DESCRIPTOR' : _AUCTIONEVENTITEM,
+  '__module__' : 'comrade.plugins.dkp.rpc.auction_pb2'
+  # @@protoc_insertion_point(class_scope:auction.AuctionEventItem)
+  })
+_sym_db.RegisterMessage(AuctionEventItem)
+
+AuctionEventBid = _reflection.GeneratedProtocolMessageType('AuctionEventBid', (_message.Message,), {
+  'DESCRIPTOR' : _AUCTIONEVENTBID,
+  '__module__' : 'comrade.plugins.dkp.rpc.auction_pb2'
+  # @@protoc_insertion_point(class_scope:auction.AuctionEventBid)
+  })
+_sym_db.RegisterMessage(AuctionEventBid)
+
+AuctionEventResults = _reflection.GeneratedProtocolMessageType('AuctionEventResults', (_message.Message,), {
+  'DESCRIPTOR' : _AUCTIONEVENTRESULTS,
+  '__module__' : 'comrade.plugins.dkp.rpc.auction_pb2'
+  # @@protoc_insertion_point(class_scope:auction.AuctionEventResults)
+  })
+_sym_db.RegisterMessage(AuctionEventResults)
+
+AuctionEvent = _reflection.GeneratedProtocolMessageType('AuctionEvent', (_message.Message,), {
+  'DESCRIPTOR' : _AUCTIONEVENT,
+  '__module__' : 'comrade.plugins.dkp.rpc.auction_pb2'
+  # @@protoc_insertion_point(class_scope:auction.AuctionEvent)
+  })
+_sym_db.RegisterMessage(AuctionEvent)
+
 
 
 _AUCTION = _descriptor.ServiceDescriptor(
@@ -122,8 +713,8 @@ _AUCTION = _descriptor.ServiceDescriptor(
   index=0,
   serialized_options=None,
   create_key=_descriptor._internal_create_key,
-  serialized_start=137,
-  serialized_end=210,
+  serialized_start=1149,
+  serialized_end=1581,
   methods=[
   _descriptor.MethodDescriptor(
     name='AddItem',
@@ -135,6 +726,56 @@ _AUCTION = _descriptor.ServiceDescriptor(
     serialized_options=None,
     create_key=_descriptor._internal_create_key,
   ),
+  _descriptor.MethodDescriptor(
+    name='AddItems',
+    full_name='auction.Auction.AddItems',
+    index=1,
+    containing_service=None,
+    input_type=_ADDITEMREQUEST,
+    output_type=_ADDITEMSRESPONSE,
+    serialized_options=None,
+    create_key=_descriptor._internal_create_key,
+  ),
+  _descriptor.MethodDescriptor(
+    name='BatchAddItems',
+    full_name='auction.Auction.BatchAddItems',
+    index=2,
+    containing_service=None,
+    input_type=_BATCHADDITEMSREQUEST,
+    output_type=_ADDITEMSRESPONSE,
+    serialized_options=None,
+    create_key=_descriptor._internal_create_key,
+  ),
+  _descriptor.MethodDescriptor(
+    name='PlaceBid',
+    full_name='auction.Auction.PlaceBid',
+    index=3,
+    containing_service=None,
+    input_type=_PLACEBIDREQUEST,
+    output_type=_PLACEBIDRESPONSE,
+    serialized_options=None,
+    create_key=_descriptor._internal_create_key,
+  ),
+  _descriptor.MethodDescriptor(
+    name='PlaceBids',
+    full_name='auction.Auction.PlaceBids',
+    index=4,
+    containing_service=None,
+    input_type=_PLACEBIDREQUEST,
+    output_type=_PLACEBIDRESPONSE,
+    serialized_options=None,
+    create_key=_descriptor._internal_create_key,
+  ),
+  _descriptor.MethodDescriptor(
+    name='WatchAuctions',
+    full_name='auction.Auction.WatchAuctions',
+    index=5,
+    containing_service=None,
+    input_type=_WATCHAUCTIONSREQUEST,
+    output_type=_AUCTIONEVENT,
+    serialized_options=None,
+    create_key=_descriptor._internal_create_key,
+  ),
 ])
 _sym_db.RegisterServiceDescriptor(_AUCTION)
 
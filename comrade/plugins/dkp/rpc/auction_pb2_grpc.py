@@ -21,6 +21,31 @@ class AuctionStub(object):
             request_serializer=comrade_dot_plugins_dot_dkp_dot_rpc_dot_auction__pb2.AddItemRequest.SerializeToString,
             response_deserializer=comrade_dot_plugins_dot_dkp_dot_rpc_dot_auction__pb2.AddItemResponse.FromString,
         )
+        self.AddItems = channel.stream_unary(
+            "/auction.Auction/AddItems",
+            request_serializer=comrade_dot_plugins_dot_dkp_dot_rpc_dot_auction__pb2.AddItemRequest.SerializeToString,
+            response_deserializer=comrade_dot_plugins_dot_dkp_dot_rpc_dot_auction__pb2.AddItemsResponse.FromString,
+        )
+        self.BatchAddItems = channel.unary_unary(
+            "/auction.Auction/BatchAddItems",
+            request_serializer=comrade_dot_plugins_dot_dkp_dot_rpc_dot_auction__pb2.BatchAddItemsRequest.SerializeToString,
+            response_deserializer=comrade_dot_plugins_dot_dkp_dot_rpc_dot_auction__pb2.AddItemsResponse.FromString,
+        )
+        self.PlaceBid = channel.unary_unary(
+            "/auction.Auction/PlaceBid",
+            request_serializer=comrade_dot_plugins_dot_dkp_dot_rpc_dot_auction__pb2.PlaceBidRequest.SerializeToString,
+            response_deserializer=comrade_dot_plugins_dot_dkp_dot_rpc_dot_auction__pb2.PlaceBidResponse.FromString,
+        )
+        self.PlaceBids = channel.stream_stream(
+            "/auction.Auction/PlaceBids",
+            request_serializer=comrade_dot_plugins_dot_dkp_dot_rpc_dot_auction__pb2.PlaceBidRequest.SerializeToString,
+            response_deserializer=comrade_dot_plugins_dot_dkp_dot_rpc_dot_auction__pb2.PlaceBidResponse.FromString,
+        )
+        self.WatchAuctions = channel.unary_stream(
+            "/auction.Auction/WatchAuctions",
+            request_serializer=comrade_dot_plugins_dot_dkp_dot_rpc_dot_auction__pb2.WatchAuctionsRequest.SerializeToString,
+            response_deserializer=comrade_dot_plugins_dot_dkp_dot_rpc_dot_auction__pb2.AuctionEvent.FromString,
+        )
 
 
 class AuctionServicer(object):
@@ -32,6 +57,36 @@ class AuctionServicer(object):
         context.set_details("Method not implemented!")
         raise NotImplementedError("Method not implemented!")
 
+    def AddItems(self, request_iterator, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
+    def BatchAddItems(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
+    def PlaceBid(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
+    def PlaceBids(self, request_iterator, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
+    def WatchAuctions(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
 
 def add_AuctionServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -40,6 +95,31 @@ def add_AuctionServicer_to_server(servicer, server):
             request_deserializer=comrade_dot_plugins_dot_dkp_dot_rpc_dot_auction__pb2.AddItemRequest.FromString,
             response_serializer=comrade_dot_plugins_dot_dkp_dot_rpc_dot_auction__pb2.AddItemResponse.SerializeToString,
         ),
+        "AddItems": grpc.stream_unary_rpc_method_handler(
+            servicer.AddItems,
+            request_deserializer=comrade_dot_plugins_dot_dkp_dot_rpc_dot_auction__pb2.AddItemRequest.FromString,
+            response_serializer=comrade_dot_plugins_dot_dkp_dot_rpc_dot_auction__pb2.AddItemsResponse.SerializeToString,
+        ),
+        "BatchAddItems": grpc.unary_unary_rpc_method_handler(
+            servicer.BatchAddItems,
+            request_deserializer=comrade_dot_plugins_dot_dkp_dot_rpc_dot_auction__pb2.BatchAddItemsRequest.FromString,
+            response_serializer=comrade_dot_plugins_dot_dkp_dot_rpc_dot_auction__pb2.AddItemsResponse.SerializeToString,
+        ),
+        "PlaceBid": grpc.unary_unary_rpc_method_handler(
+            servicer.PlaceBid,
+            request_deserializer=comrade_dot_plugins_dot_dkp_dot_rpc_dot_auction__pb2.PlaceBidRequest.FromString,
+            response_serializer=comrade_dot_plugins_dot_dkp_dot_rpc_dot_auction__pb2.PlaceBidResponse.SerializeToString,
+        ),
+        "PlaceBids": grpc.stream_stream_rpc_method_handler(
+            servicer.PlaceBids,
+            request_deserializer=comrade_dot_plugins_dot_dkp_dot_rpc_dot_auction__pb2.PlaceBidRequest.FromString,
+            response_serializer=comrade_dot_plugins_dot_dkp_dot_rpc_dot_auction__pb2.PlaceBidResponse.SerializeToString,
+        ),
+        "WatchAuctions": grpc.unary_stream_rpc_method_handler(
+            servicer.WatchAuctions,
+            request_deserializer=comrade_dot_plugins_dot_dkp_dot_rpc_dot_auction__pb2.WatchAuctionsRequest.FromString,
+            response_serializer=comrade_dot_plugins_dot_dkp_dot_rpc_dot_auction__pb2.AuctionEvent.SerializeToString,
+        ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
         "auction.Auction", rpc_method_handlers
@@ -79,3 +159,148 @@ class Auction(object):
             timeout,
             metadata,
         )
+
+    @staticmethod
+    def AddItems(
+        request_iterator,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.stream_unary(
+            request_iterator,
+            target,
+            "/auction.Auction/AddItems",
+            comrade_dot_plugins_dot_dkp_dot_rpc_dot_auction__pb2.AddItemRequest.SerializeToString,
+            comrade_dot_plugins_dot_dkp_dot_rpc_dot_auction__pb2.AddItemsResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+        )
+
+    @staticmethod
+    def BatchAddItems(
+        request,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            "/auction.Auction/BatchAddItems",
+            comrade_dot_plugins_dot_dkp_dot_rpc_dot_auction__pb2.BatchAddItemsRequest.SerializeToString,
+            comrade_dot_plugins_dot_dkp_dot_rpc_dot_auction__pb2.AddItemsResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+        )
+
+    @staticmethod
+    def PlaceBid(
+        request,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            "/auction.Auction/PlaceBid",
+            comrade_dot_plugins_dot_dkp_dot_rpc_dot_auction__pb2.PlaceBidRequest.SerializeToString,
+            comrade_dot_plugins_dot_dkp_dot_rpc_dot_auction__pb2.PlaceBidResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+        )
+
+    @staticmethod
+    def PlaceBids(
+        request_iterator,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.stream_stream(
+            request_iterator,
+            target,
+            "/auction.Auction/PlaceBids",
+            comrade_dot_plugins_dot_dkp_dot_rpc_dot_auction__pb2.PlaceBidRequest.SerializeToString,
+            comrade_dot_plugins_dot_dkp_dot_rpc_dot_auction__pb2.PlaceBidResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+        )
+
+    @staticmethod
+    def WatchAuctions(
+        request,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            "/auction.Auction/WatchAuctions",
+            comrade_dot_plugins_dot_dkp_dot_rpc_dot_auction__pb2.WatchAuctionsRequest.SerializeToString,
+            comrade_dot_plugins_dot_dkp_dot_rpc_dot_auction__pb2.AuctionEvent.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+        )
@@ -19,7 +19,7 @@ DESCRIPTOR = _descriptor.FileDescriptor(
   syntax='proto3',
   serialized_options=None,
   create_key=_descriptor._internal_create_key,
-  serialized_pb=b'\n!comrade/plugins/dkp/rpc/dkp.proto\x12\x03\x64kp\"7\n\x14LinkCharacterRequest\x12\x11\n\tcharacter\x18\x01 \x01(\t\x12\x0c\n\x04\x63ode\x18\x02 \x01(\t\"\x17\n\x15LinkCharacterResponse2O\n\x03\x44KP\x12H\n\rLinkCharacter\x12\x19.dkp.LinkCharacterRequest\x1a\x1a.dkp.LinkCharacterResponse\"\x00\x62\x06proto3'
+  serialized_pb=b'\n!comrade/plugins/dkp/rpc/dkp.proto\x12\x03\x64kp\"7\n\x14LinkCharacterRequest\x12\x11\n\tcharacter\x18\x01 \x01(\t\x12\x0c\n\x04\x63ode\x18\x02 \x01(\t\"\x17\n\x15LinkCharacterResponse\"a\n\x0c\x43haracterDKP\x12\x0c\n\x04name\x18\x01 \x01(\t\x12\x0f\n\x07\x63urrent\x18\x02 \x01(\x03\x12\x0e\n\x06\x65\x61rned\x18\x03 \x01(\x03\x12\r\n\x05spent\x18\x04 \x01(\x03\x12\x13\n\x0b\x61\x64justments\x18\x05 \x01(\x03\"\"\n\rGetDKPRequest\x12\x11\n\tcharacter\x18\x01 \x01(\t\"N\n\x0eGetDKPResponse\x12\x1e\n\x03\x64kp\x18\x01 \x01(\x0b\x32\x11.dkp.CharacterDKP\x12\x0f\n\x07version\x18\x02 \x01(\x04\x12\x0b\n\x03\x61ge\x18\x03 \x01(\x01\"(\n\x12\x42\x61tchGetDKPRequest\x12\x12\n\ncharacters\x18\x01 \x03(\t\"d\n\x13\x42\x61tchGetDKPResponse\x12\x1e\n\x03\x64kp\x18\x01 \x03(\x0b\x32\x11.dkp.CharacterDKP\x12\x0f\n\x07missing\x18\x02 \x03(\t\x12\x0f\n\x07version\x18\x03 \x01(\x04\x12\x0b\n\x03\x61ge\x18\x04 \x01(\x01\"7\n\x0eListDKPRequest\x12\x11\n\tpage_size\x18\x01 \x01(\x05\x12\x12\n\npage_token\x18\x02 \x01(\t\"h\n\x0fListDKPResponse\x12\x1e\n\x03\x64kp\x18\x01 \x03(\x0b\x32\x11.dkp.CharacterDKP\x12\x0f\n\x07version\x18\x02 \x01(\x04\x12\x0b\n\x03\x61ge\x18\x03 \x01(\x01\x12\x17\n\x0fnext_page_token\x18\x04 \x01(\t2\x82\x02\n\x03\x44KP\x12H\n\rLinkCharacter\x12\x19.dkp.LinkCharacterRequest\x1a\x1a.dkp.LinkCharacterResponse\"\x00\x12\x33\n\x06GetDKP\x12\x12.dkp.GetDKPRequest\x1a\x13.dkp.GetDKPResponse\"\x00\x12\x42\n\x0b\x42\x61tchGetDKP\x12\x17.dkp.BatchGetDKPRequest\x1a\x18.dkp.BatchGetDKPResponse\"\x00\x12\x38\n\x07ListDKP\x12\x13.dkp.ListDKPRequest\x1a\x14.dkp.ListDKPResponse\"\x00\x30\x01\x62\x06proto3'
 )
 
 
@@ -88,8 +88,333 @@ _LINKCHARACTERRESPONSE = _descriptor.Descriptor(
   serialized_end=122,
 )
 
+
+_CHARACTERDKP = _descriptor.Descriptor(
+  name='CharacterDKP',
+  full_name='dkp.CharacterDKP',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='name', full_name='dkp.CharacterDKP.name', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='current', full_name='dkp.CharacterDKP.current', index=1,
+      number=2, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='earned', full_name='dkp.CharacterDKP.earned', index=2,
+      number=3, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='spent', full_name='dkp.CharacterDKP.spent', index=3,
+      number=4, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='adjustments', full_name='dkp.CharacterDKP.adjustments', index=4,
+      number=5, type=3, cpp_type=2, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=124,
+  serialized_end=221,
+)
+
+
+_GETDKPREQUEST = _descriptor.Descriptor(
+  name='GetDKPRequest',
+  full_name='dkp.GetDKPRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='character', full_name='dkp.GetDKPRequest.character', index=0,
+      number=1, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=223,
+  serialized_end=257,
+)
+
+
+_GETDKPRESPONSE = _descriptor.Descriptor(
+  name='GetDKPResponse',
+  full_name='dkp.GetDKPResponse',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='dkp', full_name='dkp.GetDKPResponse.dkp', index=0,
+      number=1, type=11, cpp_type=10, label=1,
+      has_default_value=False, default_value=None,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='version', full_name='dkp.GetDKPResponse.version', index=1,
+      number=2, type=4, cpp_type=4, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='age', full_name='dkp.GetDKPResponse.age', index=2,
+      number=3, type=1, cpp_type=5, label=1,
+      has_default_value=False, default_value=float(0),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=259,
+  serialized_end=337,
+)
+
+
+_BATCHGETDKPREQUEST = _descriptor.Descriptor(
+  name='BatchGetDKPRequest',
+  full_name='dkp.BatchGetDKPRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='characters', full_name='dkp.BatchGetDKPRequest.characters', index=0,
+      number=1, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=339,
+  serialized_end=379,
+)
+
+
+_BATCHGETDKPRESPONSE = _descriptor.Descriptor(
+  name='BatchGetDKPResponse',
+  full_name='dkp.BatchGetDKPResponse',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='dkp', full_name='dkp.BatchGetDKPResponse.dkp', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='missing', full_name='dkp.BatchGetDKPResponse.missing', index=1,
+      number=2, type=9, cpp_type=9, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='version', full_name='dkp.BatchGetDKPResponse.version', index=2,
+      number=3, type=4, cpp_type=4, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='age', full_name='dkp.BatchGetDKPResponse.age', index=3,
+      number=4, type=1, cpp_type=5, label=1,
+      has_default_value=False, default_value=float(0),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=381,
+  serialized_end=481,
+)
+
+
+_LISTDKPREQUEST = _descriptor.Descriptor(
+  name='ListDKPRequest',
+  full_name='dkp.ListDKPRequest',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='page_size', full_name='dkp.ListDKPRequest.page_size', index=0,
+      number=1, type=5, cpp_type=1, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='page_token', full_name='dkp.ListDKPRequest.page_token', index=1,
+      number=2, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=483,
+  serialized_end=538,
+)
+
+
+_LISTDKPRESPONSE = _descriptor.Descriptor(
+  name='ListDKPResponse',
+  full_name='dkp.ListDKPResponse',
+  filename=None,
+  file=DESCRIPTOR,
+  containing_type=None,
+  create_key=_descriptor._internal_create_key,
+  fields=[
+    _descriptor.FieldDescriptor(
+      name='dkp', full_name='dkp.ListDKPResponse.dkp', index=0,
+      number=1, type=11, cpp_type=10, label=3,
+      has_default_value=False, default_value=[],
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='version', full_name='dkp.ListDKPResponse.version', index=1,
+      number=2, type=4, cpp_type=4, label=1,
+      has_default_value=False, default_value=0,
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='age', full_name='dkp.ListDKPResponse.age', index=2,
+      number=3, type=1, cpp_type=5, label=1,
+      has_default_value=False, default_value=float(0),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+    _descriptor.FieldDescriptor(
+      name='next_page_token', full_name='dkp.ListDKPResponse.next_page_token', index=3,
+      number=4, type=9, cpp_type=9, label=1,
+      has_default_value=False, default_value=b"".decode('utf-8'),
+      message_type=None, enum_type=None, containing_type=None,
+      is_extension=False, extension_scope=None,
+      serialized_options=None, file=DESCRIPTOR,  create_key=_descriptor._internal_create_key),
+  ],
+  extensions=[
+  ],
+  nested_types=[],
+  enum_types=[
+  ],
+  serialized_options=None,
+  is_extendable=False,
+  syntax='proto3',
+  extension_ranges=[],
+  oneofs=[
+  ],
+  serialized_start=540,
+  serialized_end=644,
+)
+
+_GETDKPRESPONSE.fields_by_name['dkp'].message_type = _CHARACTERDKP
+_BATCHGETDKPRESPONSE.fields_by_name['dkp'].message_type = _CHARACTERDKP
+_LISTDKPRESPONSE.fields_by_name['dkp'].message_type = _CHARACTERDKP
 DESCRIPTOR.message_types_by_name['LinkCharacterRequest'] = _LINKCHARACTERREQUEST
 DESCRIPTOR.message_types_by_name['LinkCharacterResponse'] = _LINKCHARACTERRESPONSE
+DESCRIPTOR.message_types_by_name['CharacterDKP'] = _CHARACTERDKP
+DESCRIPTOR.message_types_by_name['GetDKPRequest'] = _GETDKPREQUEST
+DESCRIPTOR.message_types_by_name['GetDKPResponse'] = _GETDKPRESPONSE
+DESCRIPTOR.message_types_by_name['BatchGetDKPRequest'] = _BATCHGETDKPREQUEST
+DESCRIPTOR.message_types_by_name['BatchGetDKPResponse'] = _BATCHGETDKPRESPONSE
+DESCRIPTOR.message_types_by_name['ListDKPRequest'] = _LISTDKPREQUEST
+DESCRIPTOR.message_types_by_name['ListDKPResponse'] = _LISTDKPRESPONSE
 _sym_db.RegisterFileDescriptor(DESCRIPTOR)
 
 LinkCharacterRequest = _reflection.GeneratedProtocolMessageType('LinkCharacterRequest', (_message.Message,), {
@@ -106,6 +431,55 @@ LinkCharacterResponse = _reflection.GeneratedProtocolMessageType('LinkCharacterR
   })
 _sym_db.RegisterMessage(LinkCharacterResponse)
 
+CharacterDKP = _reflection.GeneratedProtocolMessageType('CharacterDKP', (_message.Message,), {
+  'DESCRIPTOR' : _CHARACTERDKP,
+  '__module__' : 'comrade.plugins.dkp.rpc.dkp_pb2'
+  # @@protoc_insertion_point(class_scope:dkp.CharacterDKP)
+  })
+_sym_db.RegisterMessage(CharacterDKP)
+
+GetDKPRequest = _reflection.GeneratedProtocolMessageType('GetDKPRequest', (_message.Message,), {
+  'DESCRIPTOR' : _GETDKPREQUEST,
+  '__module__' : 'comrade.plugins.dkp.rpc.dkp_pb2'
+  # @@protoc_insertion_point(class_scope:dkp.GetDKPRequest)
+  })
+_sym_db.RegisterMessage(GetDKPRequest)
+
+GetDKPResponse = _reflection.GeneratedProtocolMessageType('GetDKPResponse', (_message.Message,), {
+  'DESCRIPTOR' : _GETDKPRESPONSE,
+  '__module__' : 'comrade.plugins.dkp.rpc.dkp_pb2'
+  # @@protoc_insertion_point(class_scope:dkp.GetDKPResponse)
+  })
+_sym_db.RegisterMessage(GetDKPResponse)
+
+BatchGetDKPRequest = _reflection.GeneratedProtocolMessageType('BatchGetDKPRequest', (_message.Message,), {
+  'DESCRIPTOR' : _BATCHGETDKPREQUEST,
+  '__module__' : 'comrade.plugins.dkp.rpc.dkp_pb2'
+  # @@protoc_insertion_point(class_scope:dkp.BatchGetDKPRequest)
+  })
+_sym_db.RegisterMessage(BatchGetDKPRequest)
+
+BatchGetDKPResponse = _reflection.GeneratedProtocolMessageType('BatchGetDKPResponse', (_message.Message,), {
+  'DESCRIPTOR' : _BATCHGETDKPRESPONSE,
+  '__module__' : 'comrade.plugins.dkp.rpc.dkp_pb2'
+  # @@protoc_insertion_point(class_scope:dkp.BatchGetDKPResponse)
+  })
+_sym_db.RegisterMessage(BatchGetDKPResponse)
+
+ListDKPRequest = _reflection.GeneratedProtocolMessageType('ListDKPRequest', (_message.Message,), {
+  'DESCRIPTOR' : _LISTDKPREQUEST,
+  '__module__' : 'comrade.plugins.dkp.rpc.dkp_pb2'
+  # @@protoc_insertion_point(class_scope:dkp.ListDKPRequest)
+  })
+_sym_db.RegisterMessage(ListDKPRequest)
+
+ListDKPResponse = _reflection.GeneratedProtocolMessageType('ListDKPResponse', (_message.Message,), {
+  'DESCRIPTOR' : _LISTDKPRESPONSE,
+  '__module__' : 'comrade.plugins.dkp.rpc.dkp_pb2'
+  # @@protoc_insertion_point(class_scope:dkp.ListDKPResponse)
+  })
+_sym_db.RegisterMessage(ListDKPResponse)
+
 
 
 _DKP = _descriptor.ServiceDescriptor(
@@ -115,8 +489,8 @@ _DKP = _descriptor.ServiceDescriptor(
   index=0,
   serialized_options=None,
   create_key=_descriptor._internal_create_key,
-  serialized_start=124,
-  serialized_end=203,
+  serialized_start=647,
+  serialized_end=905,
   methods=[
   _descriptor.MethodDescriptor(
     name='LinkCharacter',
@@ -128,6 +502,36 @@ _DKP = _descriptor.ServiceDescriptor(
     serialized_options=None,
     create_key=_descriptor._internal_create_key,
   ),
+  _descriptor.MethodDescriptor(
+    name='GetDKP',
+    full_name='dkp.DKP.GetDKP',
+    index=1,
+    containing_service=None,
+    input_type=_GETDKPREQUEST,
+    output_type=_GETDKPRESPONSE,
+    serialized_options=None,
+    create_key=_descriptor._internal_create_key,
+  ),
+  _descriptor.MethodDescriptor(
+    name='BatchGetDKP',
+    full_name='dkp.DKP.BatchGetDKP',
+    index=2,
+    containing_service=None,
+    input_type=_BATCHGETDKPREQUEST,
+    output_type=_BATCHGETDKPRESPONSE,
+    serialized_options=None,
+    create_key=_descriptor._internal_create_key,
+  ),
+  _descriptor.MethodDescriptor(
+    name='ListDKP',
+    full_name='dkp.DKP.ListDKP',
+    index=3,
+    containing_service=None,
+    input_type=_LISTDKPREQUEST,
+    output_type=_LISTDKPRESPONSE,
+    serialized_options=None,
+    create_key=_descriptor._internal_create_key,
+  ),
 ])
 _sym_db.RegisterServiceDescriptor(_DKP)
 
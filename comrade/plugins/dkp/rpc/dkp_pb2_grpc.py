@@ -21,6 +21,21 @@ class DKPStub(object):
             request_serializer=comrade_dot_plugins_dot_dkp_dot_rpc_dot_dkp__pb2.LinkCharacterRequest.SerializeToString,
             response_deserializer=comrade_dot_plugins_dot_dkp_dot_rpc_dot_dkp__pb2.LinkCharacterResponse.FromString,
         )
+        self.GetDKP = channel.unary_unary(
+            "/dkp.DKP/GetDKP",
+            request_serializer=comrade_dot_plugins_dot_dkp_dot_rpc_dot_dkp__pb2.GetDKPRequest.SerializeToString,
+            response_deserializer=comrade_dot_plugins_dot_dkp_dot_rpc_dot_dkp__pb2.GetDKPResponse.FromString,
+        )
+        self.BatchGetDKP = channel.unary_unary(
+            "/dkp.DKP/BatchGetDKP",
+            request_serializer=comrade_dot_plugins_dot_dkp_dot_rpc_dot_dkp__pb2.BatchGetDKPRequest.SerializeToString,
+            response_deserializer=comrade_dot_plugins_dot_dkp_dot_rpc_dot_dkp__pb2.BatchGetDKPResponse.FromString,
+        )
+        self.ListDKP = channel.unary_stream(
+            "/dkp.DKP/ListDKP",
+            request_serializer=comrade_dot_plugins_dot_dkp_dot_rpc_dot_dkp__pb2.ListDKPRequest.SerializeToString,
+            response_deserializer=comrade_dot_plugins_dot_dkp_dot_rpc_dot_dkp__pb2.ListDKPResponse.FromString,
+        )
 
 
 class DKPServicer(object):
@@ -32,6 +47,24 @@ class DKPServicer(object):
         context.set_details("Method not implemented!")
         raise NotImplementedError("Method not implemented!")
 
+    def GetDKP(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
+    def BatchGetDKP(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
+    def ListDKP(self, request, context):
+        """Missing associated documentation comment in .proto file."""
+        context.set_code(grpc.StatusCode.UNIMPLEMENTED)
+        context.set_details("Method not implemented!")
+        raise NotImplementedError("Method not implemented!")
+
 
 def add_DKPServicer_to_server(servicer, server):
     rpc_method_handlers = {
@@ -40,6 +73,21 @@ def add_DKPServicer_to_server(servicer, server):
             request_deserializer=comrade_dot_plugins_dot_dkp_dot_rpc_dot_dkp__pb2.LinkCharacterRequest.FromString,
             response_serializer=comrade_dot_plugins_dot_dkp_dot_rpc_dot_dkp__pb2.LinkCharacterResponse.SerializeToString,
         ),
+        "GetDKP": grpc.unary_unary_rpc_method_handler(
+            servicer.GetDKP,
+            request_deserializer=comrade_dot_plugins_dot_dkp_dot_rpc_dot_dkp__pb2.GetDKPRequest.FromString,
+            response_serializer=comrade_dot_plugins_dot_dkp_dot_rpc_dot_dkp__pb2.GetDKPResponse.SerializeToString,
+        ),
+        "BatchGetDKP": grpc.unary_unary_rpc_method_handler(
+            servicer.BatchGetDKP,
+            request_deserializer=comrade_dot_plugins_dot_dkp_dot_rpc_dot_dkp__pb2.BatchGetDKPRequest.FromString,
+            response_serializer=comrade_dot_plugins_dot_dkp_dot_rpc_dot_dkp__pb2.BatchGetDKPResponse.SerializeToString,
+        ),
+        "ListDKP": grpc.unary_stream_rpc_method_handler(
+            servicer.ListDKP,
+            request_deserializer=comrade_dot_plugins_dot_dkp_dot_rpc_dot_dkp__pb2.ListDKPRequest.FromString,
+            response_serializer=comrade_dot_plugins_dot_dkp_dot_rpc_dot_dkp__pb2.ListDKPResponse.SerializeToString,
+        ),
     }
     generic_handler = grpc.method_handlers_generic_handler(
         "dkp.DKP", rpc_method_handlers
@@ -79,3 +127,90 @@ class DKP(object):
             timeout,
             metadata,
         )
+
+    @staticmethod
+    def GetDKP(
+        request,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            "/dkp.DKP/GetDKP",
+            comrade_dot_plugins_dot_dkp_dot_rpc_dot_dkp__pb2.GetDKPRequest.SerializeToString,
+            comrade_dot_plugins_dot_dkp_dot_rpc_dot_dkp__pb2.GetDKPResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+        )
+
+    @staticmethod
+    def BatchGetDKP(
+        request,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.unary_unary(
+            request,
+            target,
+            "/dkp.DKP/BatchGetDKP",
+            comrade_dot_plugins_dot_dkp_dot_rpc_dot_dkp__pb2.BatchGetDKPRequest.SerializeToString,
+            comrade_dot_plugins_dot_dkp_dot_rpc_dot_dkp__pb2.BatchGetDKPResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+        )
+
+    @staticmethod
+    def ListDKP(
+        request,
+        target,
+        options=(),
+        channel_credentials=None,
+        call_credentials=None,
+        insecure=False,
+        compression=None,
+        wait_for_ready=None,
+        timeout=None,
+        metadata=None,
+    ):
+        return grpc.experimental.unary_stream(
+            request,
+            target,
+            "/dkp.DKP/ListDKP",
+            comrade_dot_plugins_dot_dkp_dot_rpc_dot_dkp__pb2.ListDKPRequest.SerializeToString,
+            comrade_dot_plugins_dot_dkp_dot_rpc_dot_dkp__pb2.ListDKPResponse.FromString,
+            options,
+            channel_credentials,
+            insecure,
+            call_credentials,
+            compression,
+            wait_for_ready,
+            timeout,
+            metadata,
+        )